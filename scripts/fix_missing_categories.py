@@ -2,9 +2,13 @@
 """Fix transactions that were imported without proper category assignment."""
 
 import os
+import re
 import sys
+from collections import Counter, defaultdict
 from pathlib import Path
 
+from sqlalchemy import func, update
+
 # Set production environment to work with the production database
 os.environ["FAFYCAT_DB_URL"] = "sqlite:///data/fafycat_prod.db"
 os.environ["FAFYCAT_ENV"] = "production"
@@ -13,7 +17,7 @@ os.environ["FAFYCAT_ENV"] = "production"
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fafycat.core.config import AppConfig
-from fafycat.core.database import CategoryORM, DatabaseManager, TransactionORM
+from fafycat.core.database import ID_CHUNK_SIZE, CategoryORM, DatabaseManager, TransactionORM
 
 
 def fix_missing_categories() -> None:
@@ -27,11 +31,23 @@ def fix_missing_categories() -> None:
         categories = {cat.name: cat.id for cat in session.query(CategoryORM).all()}
         print(f"📋 Available categories: {list(categories.keys())}")
 
-        # Get transactions without categories
-        uncategorized_txns = session.query(TransactionORM).filter(TransactionORM.category_id.is_(None)).all()
+        # Get transactions without categories (only the columns the matcher reads)
+        uncategorized_txns = (
+            session.query(TransactionORM.id, TransactionORM.name, TransactionORM.purpose)
+            .filter(TransactionORM.category_id.is_(None))
+            .all()
+        )
 
         print(f"🔍 Found {len(uncategorized_txns)} uncategorized transactions")
 
+        # Per-category totals before the fix, so the summary needs no count queries afterwards
+        existing_counts = dict(
+            session.query(TransactionORM.category_id, func.count())
+            .filter(TransactionORM.category_id.isnot(None))
+            .group_by(TransactionORM.category_id)
+            .all()
+        )
+
         if not uncategorized_txns:
             print("✅ All transactions already have categories!")
             return
@@ -103,42 +119,54 @@ def fix_missing_categories() -> None:
             "investment": ["sparplan", "etf", "aktien", "depot", "investment", "msci", "ishares"],
         }
 
-        categorized_count = 0
+        # One alternation per existing category instead of a substring test per pattern
+        category_matchers = [
+            (categories[category_name], re.compile("|".join(re.escape(pattern) for pattern in patterns)))
+            for category_name, patterns in merchant_patterns.items()
+            if category_name in categories
+        ]
+
+        # Matched transaction IDs grouped by target category, written as one UPDATE per category
+        ids_by_category: dict[int, list[str]] = defaultdict(list)
 
         for txn in uncategorized_txns:
             # Create a combined text to search in (name + purpose)
             search_text = f"{txn.name} {txn.purpose or ''}".lower()
 
-            # Try to match against patterns
-            matched_category = None
-            for category_name, patterns in merchant_patterns.items():
-                for pattern in patterns:
-                    if pattern in search_text and category_name in categories:
-                        matched_category = categories[category_name]
-                        break
-                if matched_category:
-                    break
-
-            # Update transaction if we found a match
+            # First category (in priority order) with any pattern in the text wins
+            matched_category = next(
+                (category_id for category_id, matcher in category_matchers if matcher.search(search_text)), None
+            )
+
             if matched_category:
-                txn.category_id = matched_category
-                categorized_count += 1
+                ids_by_category[matched_category].append(txn.id)
+
+        for category_id, txn_ids in ids_by_category.items():
+            for start in range(0, len(txn_ids), ID_CHUNK_SIZE):
+                session.execute(
+                    update(TransactionORM)
+                    .where(TransactionORM.id.in_(txn_ids[start : start + ID_CHUNK_SIZE]))
+                    .values(category_id=category_id)
+                )
 
         # Commit changes
         session.commit()
+        categorized_count = sum(len(txn_ids) for txn_ids in ids_by_category.values())
 
         print(f"✅ Successfully categorized {categorized_count} transactions")
         print(f"📊 Remaining uncategorized: {len(uncategorized_txns) - categorized_count}")
 
-        # Show breakdown by category
+        # Show breakdown by category: counts before the fix plus what this run assigned
+        category_counts = Counter(existing_counts)
+        category_counts.update({category_id: len(txn_ids) for category_id, txn_ids in ids_by_category.items()})
         print("\n📈 Category distribution:")
         for category_name, category_id in categories.items():
-            count = session.query(TransactionORM).filter(TransactionORM.category_id == category_id).count()
+            count = category_counts[category_id]
             if count > 0:
                 print(f"  {category_name}: {count} transactions")
 
         # Show total categorized transactions
-        total_categorized = session.query(TransactionORM).filter(TransactionORM.category_id.isnot(None)).count()
+        total_categorized = category_counts.total()
 
         print(f"\n🎯 Total categorized transactions: {total_categorized}")
 
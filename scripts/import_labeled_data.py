@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """Import labeled transaction data from fafycat-v1."""
 
+import hashlib
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pandas as pd
+from sqlalchemy import text
 
 # Add project root to Python path for imports
 project_root = Path(__file__).parent.parent
@@ -13,7 +16,7 @@ sys.path.insert(0, str(project_root))
 
 # Module imports after path manipulation (required by E402)
 from fafycat.core.config import AppConfig  # noqa: E402
-from fafycat.core.database import DatabaseManager  # noqa: E402
+from fafycat.core.database import AppSettingsORM, DatabaseManager  # noqa: E402
 from fafycat.core.models import TransactionInput  # noqa: E402
 from fafycat.data.csv_processor import CSVProcessor  # noqa: E402
 
@@ -24,16 +27,100 @@ if "FAFYCAT_ENV" not in os.environ:
     os.environ["FAFYCAT_ENV"] = "production"
 
 
-def parse_labeled_csv(file_path: Path) -> list[TransactionInput]:
-    """Parse a labeled CSV file and return TransactionInput objects."""
-    df = pd.read_csv(file_path)
-    transactions = []
+# Rows written between commits during a labeled import
+COMMIT_BATCH_SIZE = 10_000
+
+# Rows read from a labeled CSV at a time
+READ_CHUNK_SIZE = 50_000
+
+# SQLite page cache for the import connection, in KiB (negative means KiB); 256 MiB
+# instead of the app's 64 MiB keeps more of the ID index cached for duplicate lookups
+IMPORT_SQLITE_CACHE_SIZE = -262144
+
+# app_settings key prefix recording the SHA-256 of each imported labeled file
+IMPORTED_FILE_KEY_PREFIX = "labeled_import_sha256:"
+
+# Date layouts seen in bank exports, tried in order against a sample of each file
+DATE_FORMATS = ["%d.%m.%Y", "%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y", "%d.%m.%y", "%Y/%m/%d"]
+
+
+def detect_datetime_format(series: pd.Series, sample_size: int = 100) -> str | None:
+    """Return the first of ``DATE_FORMATS`` that parses every sampled value, if any."""
+    sample = series.dropna().head(sample_size)
+    if sample.empty:
+        return None
+    for fmt in DATE_FORMATS:
+        if pd.to_datetime(sample, format=fmt, errors="coerce").notna().all():
+            return fmt
+    return None
+
+
+def _parse_dates(values: pd.Series, fmt: str | None, cache: dict[str, pd.Timestamp]) -> pd.Series:
+    """Parse date strings with the detected format, falling back to day-first inference.
+
+    Strings that do not match ``fmt`` (or all of them, without a format) are parsed one
+    by one with day-first inference, as rows were before formats were detected.
+
+    Statements repeat the same few dates across many rows, so only strings not yet in
+    ``cache`` are parsed; the results are added to ``cache`` and mapped back per row.
+    """
+    uniques = pd.Series(values.dropna().unique())
+    uniques = uniques[~uniques.isin(cache.keys())]
+    if not uniques.empty:
+        parsed = pd.Series(pd.NaT, index=uniques.index, dtype="datetime64[ns]")
+        if fmt is not None:
+            parsed = pd.to_datetime(uniques, format=fmt, errors="coerce")
+        leftover = parsed.isna()
+        if leftover.any():
+            parsed = parsed.astype("datetime64[ns]")
+            parsed[leftover] = pd.to_datetime(uniques[leftover], format="mixed", dayfirst=True, errors="coerce")
+        cache.update(zip(uniques, parsed, strict=True))
+    return pd.to_datetime(values.map(cache))
+
+
+def _text_column(df: pd.DataFrame, col: str | None, default: str) -> pd.Series:
+    """Stripped text of ``col`` (``str(value).strip()`` per cell), or ``default`` if absent."""
+    if col is None:
+        return pd.Series(default, index=df.index, dtype=object)
+    return df[col].map(str).str.strip()
+
+
+# Dtypes pandas may infer for a text column read as a whole, from narrowest to widest
+_TEXT_KINDS = ("int", "float", "text")
+
+# Text fields of TransactionInput per resolved column
+_TEXT_FIELDS = {"Name": "name", "Purpose": "purpose", "Currency": "currency", "Cat": "category"}
+
+
+def _widen_text_kind(kind: str, values: pd.Series) -> str:
+    """Widen ``kind`` by the dtype pandas would infer for one chunk of a text column.
 
-    print(f"  📄 Processing {file_path.name}: {len(df)} transactions")
+    Text columns are read as strings, but rows used to be read with whole-file dtype
+    inference; a column of numbers became int64, or float64 if any cell was blank, and
+    its cells were stringified from those values. Tracking the kind over all chunks lets
+    the parser reproduce that stringification, and with it the transaction IDs.
+    """
+    non_null = values.dropna()
+    if pd.to_numeric(non_null, errors="coerce").isna().any():
+        chunk_kind = "text"
+    elif values.isna().any() or not non_null.str.fullmatch(r"\s*[+-]?\d+\s*").all():
+        chunk_kind = "float"
+    else:
+        chunk_kind = "int"
+    return max(kind, chunk_kind, key=_TEXT_KINDS.index)
 
-    # Handle both capitalized and lowercase column names
+
+def _stringify_as(value: str | None, kind: str) -> str | None:
+    """Render a stripped cell the way ``str()`` rendered it under the inferred ``kind``."""
+    if value is None or kind == "text":
+        return value
+    return str(int(value)) if kind == "int" else str(float(value))
+
+
+def _resolve_columns(columns: pd.Index) -> dict[str, str]:
+    """Map canonical field names to the file's columns, ignoring capitalization."""
     col_mapping = {}
-    for col in df.columns:
+    for col in columns:
         lower_col = col.lower()
         if lower_col == "date":
             col_mapping["Date"] = col
@@ -49,60 +136,155 @@ def parse_labeled_csv(file_path: Path) -> list[TransactionInput]:
             col_mapping["Cat"] = col
         elif "value" in lower_col and "date" in lower_col:
             col_mapping["Value date"] = col
+    return col_mapping
+
+
+def _parse_labeled_chunk(
+    df: pd.DataFrame,
+    col_mapping: dict[str, str],
+    date_format: str | None,
+    date_cache: dict[str, pd.Timestamp],
+) -> tuple[list[TransactionInput], int, int]:
+    """Parse one chunk of a labeled CSV.
+
+    Returns:
+        Tuple of (transactions, skipped_count, repeated_count)
+    """
+    date_col = col_mapping["Date"]
+
+    # Parse whole columns at once; rows whose date, value date or amount cannot be
+    # parsed are dropped and counted for the caller.
+    date_strs = _text_column(df, date_col, "")
+    dates = _parse_dates(date_strs, date_format, date_cache)
+    valid = dates.notna()
+
+    # Value date is only kept when it differs from the booking date
+    value_dates = pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    value_date_col = col_mapping.get("Value date")
+    if value_date_col:
+        value_date_strs = _text_column(df, value_date_col, "")
+        has_value_date = df[value_date_col].notna() & (value_date_strs != date_strs)
+        value_dates = _parse_dates(value_date_strs.where(has_value_date), date_format, date_cache)
+        valid &= ~(has_value_date & value_dates.isna())
+
+    amounts = pd.to_numeric(df[col_mapping["Amount"]], errors="coerce")
+    valid &= amounts.notna()
+
+    names = _text_column(df, col_mapping["Name"], "")
+    purposes = _text_column(df, col_mapping.get("Purpose"), "")
+    currencies = _text_column(df, col_mapping.get("Currency"), "EUR")
+
+    # Human-labeled category, None where the cell is empty
+    categories = pd.Series([None] * len(df), index=df.index, dtype=object)
+    cat_col = col_mapping.get("Cat")
+    if cat_col:
+        categories = _text_column(df, cat_col, "").astype(object).where(df[cat_col].notna(), None)
+
+    # Rows repeating an earlier row's date, amount, name and purpose would get the
+    # same transaction ID, so only the first of them becomes a TransactionInput
+    keys = pd.DataFrame({"date": dates, "amount": amounts, "name": names, "purpose": purposes})
+    repeated = keys[valid].duplicated().reindex(df.index, fill_value=False)
+    keep = valid & ~repeated
+
+    # Every field already has its final type here, so pydantic validation is skipped
+    transactions = [
+        TransactionInput.model_construct(
+            date=txn_date.date(),
+            value_date=None if pd.isna(value_date) else value_date.date(),
+            name=name,
+            purpose=purpose,
+            amount=float(amount),
+            currency=currency,
+            category=category,
+        )
+        for txn_date, value_date, name, purpose, amount, currency, category in zip(
+            dates[keep],
+            value_dates[keep],
+            names[keep],
+            purposes[keep],
+            amounts[keep],
+            currencies[keep],
+            categories[keep],
+            strict=True,
+        )
+    ]
+    return transactions, int((~valid).sum()), int(repeated.sum())
 
-    for _, row in df.iterrows():
-        try:
-            # Parse date
-            date_col = col_mapping.get("Date")
-            if not date_col:
-                print("    ⚠️  Error parsing row: No date column found")
-                continue
 
-            date_str = str(row[date_col]).strip()
-            txn_date = pd.to_datetime(date_str, dayfirst=True).date()
-
-            # Parse value date if different
-            value_date = None
-            value_date_col = col_mapping.get("Value date")
-            if value_date_col and pd.notna(row[value_date_col]):
-                value_date_str = str(row[value_date_col]).strip()
-                if value_date_str != date_str:
-                    value_date = pd.to_datetime(value_date_str, dayfirst=True).date()
-
-            # Extract fields
-            name = str(row[col_mapping.get("Name", "")]).strip()
-            purpose = str(row.get(col_mapping.get("Purpose", ""), "")).strip()
-            amount = float(row[col_mapping.get("Amount", "")])
-            currency = str(row.get(col_mapping.get("Currency", ""), "EUR")).strip()
-
-            # Get the human-labeled category
-            category = None
-            cat_col = col_mapping.get("Cat")
-            if cat_col and pd.notna(row[cat_col]):
-                category = str(row[cat_col]).strip()
-
-            # Create transaction
-            transaction = TransactionInput(
-                date=txn_date,
-                value_date=value_date,
-                name=name,
-                purpose=purpose,
-                amount=amount,
-                currency=currency,
-                category=category,
-            )
+def parse_labeled_csv(file_path: Path) -> list[TransactionInput]:
+    """Parse a labeled CSV file and return TransactionInput objects.
+
+    The file is read ``READ_CHUNK_SIZE`` rows at a time, so only one chunk of raw
+    columns is held in memory alongside the parsed transactions.
+    """
+    transactions: list[TransactionInput] = []
+
+    col_mapping = _resolve_columns(pd.read_csv(file_path, nrows=0).columns)
+    if not all(key in col_mapping for key in ["Date", "Name", "Amount"]):
+        print(f"  📄 Processing {file_path.name}")
+        print("    ⚠️  Skipping file: date, name or amount column not found")
+        return transactions
+
+    date_col = col_mapping["Date"]
+    # One explicit format keeps pandas on its compiled parser instead of per-value
+    # inference; it is detected from the first chunk that has any dates.
+    date_format = None
+    format_detected = False
+    date_cache: dict[str, pd.Timestamp] = {}
+    row_count = 0
+    skipped = 0
+    repeated = 0
+
+    # Text columns are read as strings so pandas skips type inference on them; the
+    # amount column keeps the C parser's float conversion.
+    text_dtypes = {col: str for key, col in col_mapping.items() if key != "Amount"}
+    text_kinds = dict.fromkeys((key for key in _TEXT_FIELDS if key in col_mapping), "int")
+
+    for chunk in pd.read_csv(file_path, chunksize=READ_CHUNK_SIZE, dtype=text_dtypes):
+        row_count += len(chunk)
+        if not format_detected and chunk[date_col].notna().any():
+            date_format = detect_datetime_format(_text_column(chunk, date_col, "")[chunk[date_col].notna()])
+            format_detected = True
+
+        for key in text_kinds:
+            text_kinds[key] = _widen_text_kind(text_kinds[key], chunk[col_mapping[key]])
+
+        chunk_transactions, chunk_skipped, chunk_repeated = _parse_labeled_chunk(
+            chunk, col_mapping, date_format, date_cache
+        )
+        transactions.extend(chunk_transactions)
+        skipped += chunk_skipped
+        repeated += chunk_repeated
+
+    # Columns that held only numbers are rendered as before (e.g. name 101 -> "101.0"
+    # when a cell was blank), so re-imported rows keep their IDs
+    for key, kind in text_kinds.items():
+        if kind != "text":
+            field = _TEXT_FIELDS[key]
+            for txn in transactions:
+                setattr(txn, field, _stringify_as(getattr(txn, field), kind))
+
+    print(f"  📄 Processing {file_path.name}: {row_count} transactions")
+    if skipped:
+        print(f"    ⚠️  Skipped {skipped} rows with an unparseable date, value date or amount")
+    if repeated:
+        print(f"    🔄 Dropped {repeated} repeated rows")
 
-            transactions.append(transaction)
+    return transactions
 
-        except Exception as e:
-            print(f"    ⚠️  Error parsing row: {e}")
-            continue
 
-    return transactions
+def file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file's contents."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
 
+def import_all_labeled_data(data_path: Path | None = None, force: bool = False) -> None:
+    """Import all labeled data files.
 
-def import_all_labeled_data(data_path: Path | None = None) -> None:
-    """Import all labeled data files."""
+    Files whose contents are unchanged since their last successful import are skipped
+    unless ``force`` is set.
+    """
     # Path to labeled data - use provided path or environment variable
     default_path = os.getenv("FAFYCAT_LABELED_DATA_PATH", "data/labeled")
     labeled_data_dir = Path(default_path) if data_path is None else data_path
@@ -128,37 +310,86 @@ def import_all_labeled_data(data_path: Path | None = None) -> None:
     config.ensure_dirs()
     db_manager = DatabaseManager(config)
 
-    # First, discover all categories from the labeled data
-    print("🏷️  Discovering categories from labeled data...")
-    discovered_categories = check_categories(labeled_data_dir)
-
-    if discovered_categories:
-        print(f"📋 Creating {len(discovered_categories)} categories (without budgets)...")
-        created_count = db_manager.discover_categories_from_data(discovered_categories)
-        print(f"✅ Created {created_count} new categories")
-        if created_count < len(discovered_categories):
-            print(f"ℹ️  {len(discovered_categories) - created_count} categories already existed")
-        print()
+    # Categories are discovered from the parsed files themselves, so no separate
+    # read of the data is needed; they are created before a file's rows are saved.
+    known_categories: set[str] = set()
+    total_created_categories = 0
+
+    # Skip files already imported with the same contents; rerunning them would only
+    # find duplicates. With force, nothing is looked up and files are hashed only once
+    # they have been imported.
+    file_hashes: dict[Path, str] = {}
+    unchanged_files: list[Path] = []
+    if not force:
+        file_hashes = {csv_file: file_sha256(csv_file) for csv_file in csv_files}
+        with db_manager.get_session() as session:
+            imported_hashes = dict(
+                session.query(AppSettingsORM.key, AppSettingsORM.value).filter(
+                    AppSettingsORM.key.startswith(IMPORTED_FILE_KEY_PREFIX)
+                )
+            )
+        unchanged_files = [
+            csv_file
+            for csv_file in csv_files
+            if imported_hashes.get(f"{IMPORTED_FILE_KEY_PREFIX}{csv_file.resolve()}") == file_hashes[csv_file]
+        ]
+    for csv_file in unchanged_files:
+        print(f"⏭️  Skipping {csv_file.name} (unchanged since last import)")
+    csv_files = [csv_file for csv_file in csv_files if csv_file not in unchanged_files]
 
     total_imported = 0
     total_duplicates = 0
     total_errors = 0
 
-    with db_manager.get_session() as session:
+    # Files are parsed in worker processes while the database writes below stay
+    # sequential; results are consumed in file order as they become available.
+    with (
+        ProcessPoolExecutor(max_workers=max(1, min(len(csv_files), os.cpu_count() or 1))) as executor,
+        db_manager.get_session() as session,
+    ):
+        parsed_files = [executor.submit(parse_labeled_csv, csv_file) for csv_file in csv_files]
         processor = CSVProcessor(session)
+        if config.database.url.startswith("sqlite"):
+            session.execute(text(f"PRAGMA cache_size={IMPORT_SQLITE_CACHE_SIZE}"))
+        uncommitted_rows = 0
 
-        for csv_file in csv_files:
+        for csv_file, parsed in zip(csv_files, parsed_files, strict=True):
             try:
                 print(f"📂 Processing {csv_file.name}...")
 
-                # Parse the CSV file
-                transactions = parse_labeled_csv(csv_file)
+                # Wait for the CSV file to be parsed
+                transactions = parsed.result()
+
+                # Categories must exist before rows can be linked to them. They are
+                # created in their own session, so pending rows are committed first
+                # to release SQLite's write lock.
+                new_categories = {txn.category for txn in transactions if txn.category} - known_categories
+                if new_categories:
+                    session.commit()
+                    uncommitted_rows = 0
+                    created_count = db_manager.discover_categories_from_data(new_categories)
+                    known_categories |= new_categories
+                    total_created_categories += created_count
+                    print(f"  🏷️  Created {created_count} new categories (without budgets)")
 
                 if transactions:
-                    # Import to database
-                    new_count, duplicate_count = processor.save_transactions(
-                        transactions, f"labeled_import_{csv_file.stem}"
-                    )
+                    # Import to database in slices; rows are only flushed here and
+                    # committed once roughly COMMIT_BATCH_SIZE of them are pending,
+                    # so small files share a commit and large files are split.
+                    new_count = 0
+                    duplicate_count = 0
+                    for start in range(0, len(transactions), COMMIT_BATCH_SIZE):
+                        batch = transactions[start : start + COMMIT_BATCH_SIZE]
+                        batch_new, batch_duplicates = processor.save_transactions(
+                            batch, f"labeled_import_{csv_file.stem}", commit=False
+                        )
+                        new_count += batch_new
+                        duplicate_count += batch_duplicates
+
+                        uncommitted_rows += len(batch)
+                        if uncommitted_rows >= COMMIT_BATCH_SIZE:
+                            session.commit()
+                            uncommitted_rows = 0
 
                     total_imported += new_count
                     total_duplicates += duplicate_count
@@ -167,17 +398,28 @@ def import_all_labeled_data(data_path: Path | None = None) -> None:
                 else:
                     print("  ⚠️  No valid transactions found")
 
+                # Recorded only once every slice is saved, and committed with the last one;
+                # slices of a larger file may already be committed, so a failed file is not
+                # recorded and its next import deduplicates the rows that made it in
+                file_hash = file_hashes.get(csv_file) or file_sha256(csv_file)
+                session.merge(AppSettingsORM(key=f"{IMPORTED_FILE_KEY_PREFIX}{csv_file.resolve()}", value=file_hash))
+
             except Exception as e:
                 print(f"  ❌ Error processing {csv_file.name}: {e}")
                 total_errors += 1
                 continue
 
+        session.commit()
+
     print("-" * 60)
     print("🎉 Import Summary:")
+    print(f"  🏷️  Categories created: {total_created_categories}")
     print(f"  📊 Total imported: {total_imported}")
     print(f"  🔄 Duplicates skipped: {total_duplicates}")
+    print(f"  ⏭️  Unchanged files skipped: {len(unchanged_files)}")
     print(f"  ❌ Files with errors: {total_errors}")
-    print(f"  📈 Success rate: {((len(csv_files) - total_errors) / len(csv_files)) * 100:.1f}%")
+    if csv_files:
+        print(f"  📈 Success rate: {((len(csv_files) - total_errors) / len(csv_files)) * 100:.1f}%")
 
     if total_imported > 0:
         print("\n✨ Great! Your labeled data is now imported.")
@@ -195,27 +437,27 @@ def check_categories(data_path: Path | None = None) -> set:
     labeled_data_dir = Path(default_path) if data_path is None else data_path
     csv_files = sorted(labeled_data_dir.glob("*.csv"))
 
-    all_categories = set()
+    category_values: list[pd.Index] = []
 
     print("🏷️  Analyzing categories in your labeled data...")
 
     for csv_file in csv_files:
         try:
-            df = pd.read_csv(csv_file)
-
-            # Find category column (could be "Cat", "category", or similar)
-            cat_col = None
-            for col in df.columns:
-                if col.lower() in ["cat", "category"]:
-                    cat_col = col
-                    break
+            # Find category column (could be "Cat", "category", or similar) from the header alone
+            header = pd.read_csv(csv_file, nrows=0).columns
+            cat_col = next((col for col in header if col.lower() in ["cat", "category"]), None)
 
             if cat_col:
-                categories = df[cat_col].dropna().unique()
-                all_categories.update(categories)
+                # Only the category column is parsed; the other columns are never materialized
+                df = pd.read_csv(csv_file, usecols=[cat_col], dtype={cat_col: "category"})
+                # The categories of a parsed column are exactly its distinct non-empty values
+                category_values.append(df[cat_col].cat.categories)
         except Exception as e:
             print(f"Error reading {csv_file}: {e}")
 
+    # One unique over all files instead of adding each file's values to a set
+    all_categories = set(pd.Index([], dtype=object).append(category_values).unique())
+
     print(f"\n📋 Found {len(all_categories)} unique categories:")
     for cat in sorted(all_categories):
         print(f"  - {cat}")
@@ -229,17 +471,14 @@ def main() -> None:
 
     parser = argparse.ArgumentParser(description="Import labeled transaction data")
     parser.add_argument("--data-path", type=Path, help="Path to directory containing labeled CSV files")
+    parser.add_argument("--force", action="store_true", help="Reimport files even if unchanged since their last import")
 
     args = parser.parse_args()
 
     print("🐱 FafyCat Labeled Data Importer")
     print("=" * 50)
 
-    # First show what categories we have
-    categories = check_categories(args.data_path)
-
-    print(f"Found {len(categories)} categories. Will import and categorize transactions automatically...")
-    import_all_labeled_data(args.data_path)
+    import_all_labeled_data(args.data_path, force=args.force)
 
 
 if __name__ == "__main__":
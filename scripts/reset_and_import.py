@@ -65,7 +65,7 @@ def initialize_fresh_database(config: AppConfig) -> DatabaseManager:
     return db_manager
 
 
-def import_labeled_data(labeled_data_path: Path, config: AppConfig) -> None:
+def import_labeled_data(labeled_data_path: Path) -> None:
     """Import labeled data using the existing import script."""
     if not labeled_data_path.exists():
         print(f"Error: Labeled data path does not exist: {labeled_data_path}")
@@ -73,43 +73,24 @@ def import_labeled_data(labeled_data_path: Path, config: AppConfig) -> None:
 
     print(f"Importing labeled data from: {labeled_data_path}")
 
-    import subprocess
+    # Run the importer in this process: FAFYCAT_DB_URL is already set by main(), so it
+    # writes to the same database, and its progress output streams as it happens.
+    from scripts.import_labeled_data import import_all_labeled_data
 
-    # Set environment to use the same database as the reset script
-    env = os.environ.copy()
-    env["FAFYCAT_DB_URL"] = config.database.url
-
-    # Run the import script with the custom data path
-    result = subprocess.run(
-        [sys.executable, "scripts/import_labeled_data.py", "--data-path", str(labeled_data_path)],
-        capture_output=True,
-        text=True,
-        cwd=str(Path.cwd()),
-        env=env,
-    )
-
-    if result.returncode != 0:
-        print(f"Error importing labeled data: {result.stderr}")
-        sys.exit(1)
+    import_all_labeled_data(labeled_data_path)
 
     print("Labeled data imported successfully!")
-    print(result.stdout)
 
 
 def train_model() -> None:
     """Train a new ML model with the imported data."""
     print("Training new ML model...")
 
-    import subprocess
-
-    result = subprocess.run([sys.executable, "scripts/train_model.py"], capture_output=True, text=True)
+    from scripts.train_model import main as train_model_main
 
-    if result.returncode != 0:
-        print(f"Error training model: {result.stderr}")
-        sys.exit(1)
+    train_model_main()
 
     print("Model training completed!")
-    print(result.stdout)
 
 
 def main() -> None:
@@ -163,7 +144,7 @@ def main() -> None:
 
     # Step 3: Import labeled data
     print("\nStep 3: Importing labeled data...")
-    import_labeled_data(args.labeled_data_path, config)
+    import_labeled_data(args.labeled_data_path)
 
     # Step 4: Train model (optional)
     if args.train_model:
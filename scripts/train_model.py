@@ -14,8 +14,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fafycat.core.config import AppConfig
 from fafycat.core.database import DatabaseManager
-from fafycat.ml.categorizer import TransactionCategorizer
-from fafycat.ml.ensemble_categorizer import EnsembleCategorizer
 
 
 def main() -> None:
@@ -28,7 +26,10 @@ def main() -> None:
     with db_manager.get_session() as session:
         try:
             # Choose between ensemble and single model based on config
+            # Only the selected model's modules are imported
             if config.ml.use_ensemble:
+                from fafycat.ml.ensemble_categorizer import EnsembleCategorizer
+
                 print("Initializing ensemble categorizer...")
                 ensemble_categorizer = EnsembleCategorizer(session, config.ml)
                 model_filename = "ensemble_categorizer.pkl"
@@ -49,6 +50,8 @@ def main() -> None:
                 model_path = config.ml.model_dir / model_filename
                 ensemble_categorizer.save_model(model_path)
             else:
+                from fafycat.ml.categorizer import TransactionCategorizer
+
                 print("Initializing single categorizer...")
                 single_categorizer = TransactionCategorizer(session, config.ml)
                 model_filename = "categorizer.pkl"
@@ -72,6 +75,8 @@ def main() -> None:
                 model_path = config.ml.model_dir / model_filename
                 single_categorizer.save_model(model_path)
 
+            # The file is an uncompressed joblib dump; inference workers can pass
+            # mmap_mode="r" to load_model to share its arrays through the page cache.
             print(f"\nModel saved to: {model_path}")
 
         except ValueError as e:
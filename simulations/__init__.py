@@ -4,11 +4,21 @@ This module can be used standalone with DictDataSource or CSVDataSource,
 or with FafyCat integration via FafyCatDataLoader.
 """
 
-from . import scenarios, visualizations
+import importlib
+from typing import TYPE_CHECKING
+
 from .core import Scenario, Simulation, SimulationResult
-from .data_loader import FafyCatDataLoader
 from .data_sources import CSVDataSource, DataSource, DictDataSource
 
+# Loaded on first access (PEP 562): visualizations pulls in matplotlib and the
+# FafyCat loader pulls in SQLAlchemy, neither of which the core API needs.
+_LAZY_SUBMODULES = {"scenarios", "visualizations"}
+_LAZY_ATTRIBUTES = {"FafyCatDataLoader": "data_loader"}
+
+if TYPE_CHECKING:
+    from . import scenarios, visualizations
+    from .data_loader import FafyCatDataLoader
+
 __version__ = "0.1.0"
 __all__ = [
     # Core simulation classes
@@ -24,3 +34,13 @@ __all__ = [
     "scenarios",
     "visualizations",
 ]
+
+
+def __getattr__(name: str):
+    """Import lazily exported submodules and classes on first access."""
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,12 +3,36 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import Any
+from typing import Any, NamedTuple
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+def _next_month_start() -> date:
+    """First day of the month after today."""
+    return (date.today().replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def _first_negative_month(balances: np.ndarray) -> int | None:
+    """1-based month in which ``balances`` first drops below zero, or None if it never does."""
+    negative = balances < 0
+    return int(np.argmax(negative)) + 1 if negative.any() else None
+
+
+class _Projection(NamedTuple):
+    """Monthly projections as (scenario, month) matrices; household balance is shared."""
+
+    income: np.ndarray
+    spending: np.ndarray
+    saving: np.ndarray
+    net_cashflow: np.ndarray
+    cumulative_savings: np.ndarray
+    household_balance: np.ndarray
+    total_liquid: np.ndarray
+
+
+@dataclass(slots=True, frozen=True)
 class SimulationResult:
     """Holds simulation results with visualization capabilities."""
 
@@ -17,14 +41,25 @@ class SimulationResult:
     scenario_name: str
     parameters: dict[str, Any] = field(default_factory=dict)
 
-    def plot_cashflow(self, figsize=(12, 8)):
-        """Plot monthly cash flow over time."""
+    def plot_cashflow(self, figsize=(12, 8), ax1=None, ax2=None):
+        """Plot monthly cash flow over time.
+
+        Args:
+            figsize: Size of the new figure
+            ax1: Existing axes for the cash flow plot; with ``ax2`` no figure is created
+                and the layout is left to the caller
+            ax2: Existing axes for the cumulative savings plot
+        """
         try:
             import matplotlib.pyplot as plt
         except ImportError:
             return
 
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
+        owns_figure = ax1 is None or ax2 is None
+        if owns_figure:
+            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
+        else:
+            fig = ax1.figure
 
         # Monthly cash flow
         ax1.plot(
@@ -52,7 +87,8 @@ class SimulationResult:
         ax2.legend()
         ax2.grid(True, alpha=0.3)
 
-        plt.tight_layout()
+        if owns_figure:
+            fig.tight_layout()
         return fig
 
     def get_runway_months(self, use_total_liquid: bool = True) -> int | None:
@@ -62,14 +98,19 @@ class SimulationResult:
             use_total_liquid: If True, use total_liquid column (includes household).
                              If False, use cumulative_savings (personal only).
         """
+        # Results from Simulation.run carry both answers in the summary
+        summary_key = "first_negative_month_total" if use_total_liquid else "first_negative_month_personal"
+        if summary_key in self.summary:
+            return self.summary[summary_key]
+
         if use_total_liquid and "total_liquid" in self.monthly_data.columns:
             column = "total_liquid"
         else:
             column = "cumulative_savings"
-        negative_months = self.monthly_data[self.monthly_data[column] < 0]
-        if len(negative_months) == 0:
+        negative = self.monthly_data[column].to_numpy() < 0
+        if not negative.any():
             return None  # Never runs out
-        return negative_months.index[0]
+        return self.monthly_data.index[np.argmax(negative)]
 
 
 class Scenario(ABC):
@@ -78,6 +119,8 @@ class Scenario(ABC):
     def __init__(self, name: str):
         self.name = name
         self.parameters = {}
+        # Months after which adjustments repeat (e.g. 12 for seasonal scenarios), if any
+        self.period: int | None = None
 
     @abstractmethod
     def apply_adjustments(self, baseline_data: dict[str, float], month_number: int = 1) -> dict[str, float]:
@@ -92,6 +135,24 @@ class Scenario(ABC):
         """
         pass
 
+    def apply_adjustments_vectorized(
+        self, baseline_data: dict[str, float], months: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return adjusted (income, spending, saving) arrays for months 1..``months``.
+
+        The default calls ``apply_adjustments`` once per month, or only for the first
+        ``period`` months when the scenario repeats and tiles those. Scenarios whose
+        adjustments are plain arithmetic override it to compute all months at once.
+        """
+        period = getattr(self, "period", None)
+        distinct_months = months if period is None else min(period, months)
+        monthly = [self.apply_adjustments(baseline_data, month_num) for month_num in range(1, distinct_months + 1)]
+        income, spending, saving = (
+            np.resize(np.array([adjusted.get(key, 0) for adjusted in monthly], dtype=float), months)
+            for key in ("income", "spending", "saving")
+        )
+        return income, spending, saving
+
     def get_parameters(self) -> dict[str, Any]:
         """Return scenario parameters for documentation."""
         return self.parameters.copy()
@@ -131,81 +192,109 @@ class Simulation:
         Returns:
             SimulationResult with monthly projections
         """
+        return self.run_batch([scenario], months, start_date)[0]
+
+    def run_batch(
+        self, scenarios: list[Scenario], months: int = 12, start_date: date | None = None
+    ) -> list[SimulationResult]:
+        """Run several scenarios over the same period in one vectorized pass.
+
+        Args:
+            scenarios: Scenarios to simulate
+            months: Number of months to simulate
+            start_date: Starting date (defaults to next month)
+
+        Returns:
+            One SimulationResult per scenario, in order; their monthly data share
+            the batch's arrays.
+        """
         if start_date is None:
-            start_date = date.today().replace(day=1) + timedelta(days=32)
-            start_date = start_date.replace(day=1)  # First of next month
-
-        # Generate month dates
-        month_dates = []
-        current_date = start_date
-        for _ in range(months):
-            month_dates.append(current_date)
-            # Move to next month
-            if current_date.month == 12:
-                current_date = current_date.replace(year=current_date.year + 1, month=1)
-            else:
-                current_date = current_date.replace(month=current_date.month + 1)
-
-        # Run monthly simulation
-        monthly_results = []
-        cumulative_savings = self.initial_savings
-        household_balance = self.household_savings
-
-        for month_date in month_dates:
-            month_num = month_dates.index(month_date) + 1
-
-            # Get scenario-adjusted amounts for this month
-            adjusted_data = scenario.apply_adjustments(self.baseline_data, month_num)
-
-            # Calculate net cash flow
-            monthly_income = adjusted_data.get("income", 0)
-            monthly_spending = adjusted_data.get("spending", 0)
-            monthly_saving = adjusted_data.get("saving", 0)
-            net_cashflow = monthly_income - monthly_spending
-
-            # Update personal savings
-            cumulative_savings += net_cashflow
-
-            # Update household savings (independent of personal cash flow)
-            household_balance += self.household_monthly_contribution
-
-            # Calculate combined liquid position
-            total_liquid = cumulative_savings + household_balance
-
-            monthly_results.append(
+            start_date = _next_month_start()
+
+        # Consecutive months on the start date's day of month, shared by all scenarios
+        month_dates = pd.date_range(start_date, periods=months, freq=pd.DateOffset(months=1)).date
+        index = pd.RangeIndex(1, months + 1, name="month")
+
+        income, spending, saving, net_cashflow, cumulative_savings, household_balance, total_liquid = self._project(
+            scenarios, months
+        )
+
+        final_household_balance = float(household_balance[-1]) if months else self.household_savings
+
+        results = []
+        for row, scenario in enumerate(scenarios):
+            df = pd.DataFrame(
                 {
-                    "month": month_num,
-                    "date": month_date,
-                    "income": monthly_income,
-                    "spending": monthly_spending,
-                    "saving": monthly_saving,
-                    "net_cashflow": net_cashflow,
+                    "date": month_dates,
+                    "income": income[row],
+                    "spending": spending[row],
+                    "saving": saving[row],
+                    "net_cashflow": net_cashflow[row],
                     "household_contribution": self.household_monthly_contribution,
                     "household_balance": household_balance,
-                    "total_liquid": total_liquid,
-                    "cumulative_savings": cumulative_savings,
-                }
+                    "total_liquid": total_liquid[row],
+                    "cumulative_savings": cumulative_savings[row],
+                },
+                index=index,
+                copy=False,
+            )
+
+            final_savings = float(cumulative_savings[row, -1]) if months else self.initial_savings
+
+            # Calculate summary statistics
+            summary = {
+                "total_months": months,
+                "final_savings": final_savings,
+                "final_household_balance": final_household_balance,
+                "final_total_liquid": final_savings + final_household_balance,
+                "avg_monthly_cashflow": df["net_cashflow"].mean(),
+                "min_savings": df["cumulative_savings"].min(),
+                "min_total_liquid": df["total_liquid"].min(),
+                "first_negative_month_personal": _first_negative_month(cumulative_savings[row]),
+                "first_negative_month_total": _first_negative_month(total_liquid[row]),
+                "scenario_name": scenario.name,
+            }
+
+            results.append(
+                SimulationResult(
+                    monthly_data=df, summary=summary, scenario_name=scenario.name, parameters=scenario.get_parameters()
+                )
             )
 
-        # Convert to DataFrame
-        df = pd.DataFrame(monthly_results)
-        df.set_index("month", inplace=True)
-
-        # Calculate summary statistics
-        summary = {
-            "total_months": months,
-            "final_savings": cumulative_savings,
-            "final_household_balance": household_balance,
-            "final_total_liquid": cumulative_savings + household_balance,
-            "avg_monthly_cashflow": df["net_cashflow"].mean(),
-            "min_savings": df["cumulative_savings"].min(),
-            "min_total_liquid": df["total_liquid"].min(),
-            "scenario_name": scenario.name,
+        return results
+
+    def run_summary_only(self, scenario: Scenario, months: int = 12) -> dict[str, Any]:
+        """Project a scenario without building a DataFrame or SimulationResult.
+
+        Returns:
+            Dict with ``min_savings`` (lowest personal savings) and ``runway_months``
+            (first month the total liquid position is negative, None if never)
+        """
+        projection = self._project([scenario], months)
+        cumulative_savings = projection.cumulative_savings[0]
+        return {
+            "min_savings": float(cumulative_savings.min()) if months else self.initial_savings,
+            "runway_months": _first_negative_month(projection.total_liquid[0]),
         }
 
-        return SimulationResult(
-            monthly_data=df, summary=summary, scenario_name=scenario.name, parameters=scenario.get_parameters()
-        )
+    def _project(self, scenarios: list[Scenario], months: int) -> _Projection:
+        """Compute (scenario, month) matrices of the monthly projections for ``scenarios``."""
+        # Scenario-adjusted amounts as (scenario, month) matrices
+        adjusted = np.array(
+            [scenario.apply_adjustments_vectorized(self.baseline_data, months) for scenario in scenarios], dtype=float
+        ).reshape(len(scenarios), 3, months)
+        income, spending, saving = adjusted[:, 0], adjusted[:, 1], adjusted[:, 2]
+        net_cashflow = income - spending
+
+        # Personal savings accumulate the net cash flow; household savings grow by a
+        # fixed contribution independent of personal cash flow and scenario
+        cumulative_savings = self.initial_savings + np.cumsum(net_cashflow, axis=1)
+        household_balance = self.household_savings + np.arange(1, months + 1) * self.household_monthly_contribution
+
+        # Combined liquid position
+        total_liquid = cumulative_savings + household_balance
+
+        return _Projection(income, spending, saving, net_cashflow, cumulative_savings, household_balance, total_liquid)
 
     def calculate_required_runway(
         self, scenario: Scenario, months: int = 24, safety_margin: float = 1.5
@@ -220,8 +309,8 @@ class Simulation:
         Returns:
             Dict with runway analysis
         """
-        result = self.run(scenario, months)
-        min_savings = result.monthly_data["cumulative_savings"].min()
+        projection = self.run_summary_only(scenario, months)
+        min_savings = projection["min_savings"]
 
         # If savings never go negative, no emergency fund needed
         required_emergency_fund = 0.0 if min_savings >= 0 else abs(min_savings) * safety_margin
@@ -230,6 +319,6 @@ class Simulation:
             "required_emergency_fund": required_emergency_fund,
             "safety_margin": safety_margin,
             "min_savings_point": min_savings,
-            "runway_months": result.get_runway_months(),
+            "runway_months": projection["runway_months"],
             "recommended_total_savings": self.initial_savings + required_emergency_fund,
         }
@@ -4,20 +4,75 @@ from datetime import date
 from pathlib import Path
 
 import pandas as pd
-from sqlalchemy import create_engine, func, or_
+from sqlalchemy import case, create_engine, event, func, or_, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from simulations.data_sources import DataSource
 
 # Optional FafyCat import - allows module to be imported without FafyCat installed
 try:
-    from fafycat.core.database import CategoryORM, TransactionORM
+    from fafycat.core.database import CategoryORM, TransactionORM, apply_sqlite_pragmas
 
     FAFYCAT_AVAILABLE = True
 except ImportError:
     FAFYCAT_AVAILABLE = False
     CategoryORM = None
     TransactionORM = None
+    apply_sqlite_pragmas = None
+
+
+MONTHLY_AVERAGES_CACHE_SIZE = 32
+"""Number of monthly averages results each loader keeps."""
+
+DEFAULT_OUTLIER_PERCENTILES = (1, 99)
+"""Percentile range of transactions kept when outliers are excluded."""
+
+CATEGORY_TYPES = ("spending", "income", "saving")
+
+EXPORT_CHUNK_SIZE = 10_000
+"""Rows read from the database per chunk in export_data_for_analysis."""
+
+EXPORT_COLUMNS = ["date", "description", "amount", "category", "category_type"]
+
+
+def _categorized_amounts(*columns):
+    """Select category type and amount (plus extra columns) of categorized transactions."""
+    return (
+        select(*columns, CategoryORM.type, TransactionORM.amount)
+        .join(
+            CategoryORM,
+            CategoryORM.id == func.coalesce(TransactionORM.category_id, TransactionORM.predicted_category_id),
+        )
+        .where(CategoryORM.is_active)
+        .where(or_(TransactionORM.category_id.is_not(None), TransactionORM.predicted_category_id.is_not(None)))
+    )
+
+
+def _in_years(years):
+    """Filter condition matching transactions in any of the given years."""
+    return or_(*[TransactionORM.date.between(date(y, 1, 1), date(y, 12, 31)) for y in years])
+
+
+def _amount_totals(df: pd.DataFrame, keys: list[str], exclude_outliers: bool, outlier_percentiles: tuple) -> pd.Series:
+    """Sum absolute amounts per group, optionally excluding outliers.
+
+    Outliers are only dropped in groups with more than 10 transactions, and a group whose
+    amounts would all be dropped keeps its full total.
+    """
+    grouped = df.groupby(keys)["amount"]
+    totals = grouped.sum()
+    if not exclude_outliers or df.empty:
+        return totals
+
+    amounts = df["amount"]
+    within = amounts.between(
+        grouped.transform("quantile", outlier_percentiles[0] / 100),
+        grouped.transform("quantile", outlier_percentiles[1] / 100),
+    )
+    by_group = [df[key] for key in keys]
+    filtered = amounts.where(within, 0.0).groupby(by_group).sum()
+    use_filtered = (grouped.size() > 10) & within.groupby(by_group).any()
+    return totals.where(~use_filtered, filtered)
 
 
 class FafyCatDataLoader(DataSource):
@@ -44,19 +99,29 @@ class FafyCatDataLoader(DataSource):
             raise FileNotFoundError(f"Database not found: {db_path}")
 
         # Create database connection
-        self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
+        self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False, connect_args={"check_same_thread": False})
+        # Same WAL/cache/mmap pragmas as the app's engine, so reads do not block on its writes
+        event.listen(self.engine, "connect", apply_sqlite_pragmas)
         self.SessionLocal = sessionmaker(bind=self.engine)
+        # Monthly averages keyed by (years, end_date, months_back, exclude_outliers, outlier_percentiles)
+        self._monthly_averages_cache: dict[tuple, dict[str, float]] = {}
 
     def get_session(self) -> Session:
         """Get database session."""
         return self.SessionLocal()
 
+    def _remember(self, key: tuple, averages: dict[str, float]) -> None:
+        """Cache monthly averages, evicting the oldest entry once the cache is full."""
+        self._monthly_averages_cache[key] = averages
+        if len(self._monthly_averages_cache) > MONTHLY_AVERAGES_CACHE_SIZE:
+            del self._monthly_averages_cache[next(iter(self._monthly_averages_cache))]
+
     def get_monthly_averages(
         self,
         year: int | list[int] | None = None,
         months_back: int = 12,
         exclude_outliers: bool = True,
-        outlier_percentiles: tuple = (1, 99),
+        outlier_percentiles: tuple = DEFAULT_OUTLIER_PERCENTILES,
     ) -> dict[str, float]:
         """Calculate monthly averages by category type from historical data.
 
@@ -68,77 +133,59 @@ class FafyCatDataLoader(DataSource):
 
         Returns:
             Dict with 'income', 'spending', 'saving' monthly averages
+
+        Results are memoized per loader and shared with get_weighted_baseline, so repeated calls for
+        the same years do not re-query the database. Create a new loader to see transactions written
+        after the first call.
         """
+        years = None
+        end_date = None
+        if year:
+            # Handle both single year and multiple years
+            years = (year,) if isinstance(year, int) else tuple(year)
+            months_back = None
+        else:
+            # Recent months depend on today's date, so it is part of the cache key
+            end_date = date.today()
+
+        key = (years, end_date, months_back, exclude_outliers, tuple(outlier_percentiles))
+        if key not in self._monthly_averages_cache:
+            self._remember(key, self._query_monthly_averages(*key))
+        return dict(self._monthly_averages_cache[key])
+
+    def _query_monthly_averages(
+        self,
+        years: tuple[int, ...] | None,
+        end_date: date | None,
+        months_back: int | None,
+        exclude_outliers: bool,
+        outlier_percentiles: tuple,
+    ) -> dict[str, float]:
+        """Run the monthly averages query; see get_monthly_averages."""
+        # Core select of (type, amount) tuples; no ORM rows are materialized
+        stmt = _categorized_amounts()
+
+        # Apply time filter
+        if years:
+            stmt = stmt.where(_in_years(years))
+            num_months = len(years) * 12
+        else:
+            # Use last N months - fix the date calculation
+            from dateutil.relativedelta import relativedelta
+
+            start_date = end_date - relativedelta(months=months_back - 1)
+            start_date = start_date.replace(day=1)
+            stmt = stmt.where(TransactionORM.date.between(start_date, end_date))
+            num_months = months_back
+
         with self.get_session() as session:
-            # First, get all transactions for the time period
-            base_query = (
-                session.query(CategoryORM.type, TransactionORM.amount)
-                .join(
-                    CategoryORM,
-                    CategoryORM.id == func.coalesce(TransactionORM.category_id, TransactionORM.predicted_category_id),
-                )
-                .filter(CategoryORM.is_active)
-                .filter(or_(TransactionORM.category_id.is_not(None), TransactionORM.predicted_category_id.is_not(None)))
-            )
+            rows = session.execute(stmt).all()
+
+        df = pd.DataFrame(rows, columns=["type", "amount"])
+        df["amount"] = df["amount"].astype(float).abs()  # Use absolute values
+        totals = _amount_totals(df, ["type"], exclude_outliers, outlier_percentiles)
 
-            # Apply time filter
-            if year:
-                # Handle both single year and multiple years
-                years = [year] if isinstance(year, int) else year
-
-                # Create date ranges for all years
-                year_conditions = []
-                for y in years:
-                    year_start = date(y, 1, 1)
-                    year_end = date(y, 12, 31)
-                    year_conditions.append(TransactionORM.date.between(year_start, year_end))
-
-                # Combine all year conditions with OR
-                base_query = base_query.filter(or_(*year_conditions))
-                num_months = len(years) * 12
-            else:
-                # Use last N months - fix the date calculation
-                from dateutil.relativedelta import relativedelta
-
-                end_date = date.today()
-                start_date = end_date - relativedelta(months=months_back - 1)
-                start_date = start_date.replace(day=1)
-                base_query = base_query.filter(TransactionORM.date.between(start_date, end_date))
-                num_months = months_back
-
-            # Get all transactions
-            all_transactions = base_query.all()
-
-            # Group by category type and optionally filter outliers
-            totals = {category_type: [] for category_type in ["spending", "income", "saving"]}
-
-            for transaction in all_transactions:
-                category_type = transaction.type
-                amount = abs(float(transaction.amount))  # Use absolute values
-                totals[category_type].append(amount)
-
-            # Calculate monthly averages, optionally excluding outliers
-            monthly_averages = {}
-            for category_type, amounts in totals.items():
-                if not amounts:
-                    monthly_averages[category_type] = 0.0
-                    continue
-
-                if exclude_outliers and len(amounts) > 10:  # Only filter if we have enough data
-                    # Calculate percentiles
-                    lower_bound = pd.Series(amounts).quantile(outlier_percentiles[0] / 100)
-                    upper_bound = pd.Series(amounts).quantile(outlier_percentiles[1] / 100)
-
-                    # Filter amounts within percentile range
-                    filtered_amounts = [a for a in amounts if lower_bound <= a <= upper_bound]
-
-                    total_amount = sum(filtered_amounts) if filtered_amounts else sum(amounts)
-                else:
-                    total_amount = sum(amounts)
-
-                monthly_averages[category_type] = total_amount / num_months
-
-            return monthly_averages
+        return {category_type: float(totals.get(category_type, 0.0)) / num_months for category_type in CATEGORY_TYPES}
 
     def get_category_breakdown(self, year: int | None = None) -> pd.DataFrame:
         """Get detailed breakdown by category for analysis.
@@ -223,37 +270,24 @@ class FafyCatDataLoader(DataSource):
         if year is None:
             year = date.today().year
 
+        is_categorized = or_(TransactionORM.category_id.is_not(None), TransactionORM.predicted_category_id.is_not(None))
         with self.get_session() as session:
-            # Total transactions
-            total_transactions = (
-                session.query(func.count(TransactionORM.id))
-                .filter(TransactionORM.date.between(date(year, 1, 1), date(year, 12, 31)))
-                .scalar()
-            )
-
-            # Categorized transactions
-            categorized = (
-                session.query(func.count(TransactionORM.id))
-                .filter(TransactionORM.date.between(date(year, 1, 1), date(year, 12, 31)))
-                .filter(or_(TransactionORM.category_id.is_not(None), TransactionORM.predicted_category_id.is_not(None)))
-                .scalar()
-            )
-
-            # Date range of data
-            date_range = (
-                session.query(
-                    func.min(TransactionORM.date).label("min_date"), func.max(TransactionORM.date).label("max_date")
-                )
-                .filter(TransactionORM.date.between(date(year, 1, 1), date(year, 12, 31)))
-                .first()
-            )
+            # Counts and date range from a single scan of the year
+            total_transactions, categorized, min_date, max_date = session.execute(
+                select(
+                    func.count(TransactionORM.id),
+                    func.sum(case((is_categorized, 1), else_=0)),
+                    func.min(TransactionORM.date),
+                    func.max(TransactionORM.date),
+                ).where(TransactionORM.date.between(date(year, 1, 1), date(year, 12, 31)))
+            ).one()
 
             return {
                 "year": year,
                 "total_transactions": total_transactions or 0,
                 "categorized_transactions": categorized or 0,
-                "categorization_rate": (categorized / total_transactions * 100) if total_transactions > 0 else 0,
-                "date_range": {"start": date_range.min_date, "end": date_range.max_date},
+                "categorization_rate": (categorized / total_transactions * 100) if total_transactions else 0,
+                "date_range": {"start": min_date, "end": max_date},
             }
 
     def export_data_for_analysis(self, filename: str, year: int | None = None) -> str:
@@ -266,49 +300,44 @@ class FafyCatDataLoader(DataSource):
         Returns:
             Path to exported file
         """
-        with self.get_session() as session:
-            query = (
-                session.query(
-                    TransactionORM.date,
-                    TransactionORM.name,
-                    TransactionORM.purpose,
-                    TransactionORM.amount,
-                    CategoryORM.name.label("category"),
-                    CategoryORM.type.label("category_type"),
-                )
-                .join(
-                    CategoryORM,
-                    CategoryORM.id == func.coalesce(TransactionORM.category_id, TransactionORM.predicted_category_id),
-                )
-                .filter(or_(TransactionORM.category_id.is_not(None), TransactionORM.predicted_category_id.is_not(None)))
+        stmt = (
+            select(
+                TransactionORM.date,
+                TransactionORM.name,
+                TransactionORM.purpose,
+                TransactionORM.amount,
+                CategoryORM.name.label("category"),
+                CategoryORM.type.label("category_type"),
             )
-
-            if year:
-                query = query.filter(TransactionORM.date.between(date(year, 1, 1), date(year, 12, 31)))
-
-            query = query.order_by(TransactionORM.date.desc())
-            results = query.all()
-
-            # Convert to DataFrame and export
-            data = []
-            for result in results:
-                data.append(
-                    {
-                        "date": result.date,
-                        "description": f"{result.name} - {result.purpose}".rstrip(" -")
-                        if result.purpose
-                        else result.name,
-                        "amount": result.amount,
-                        "category": result.category,
-                        "category_type": result.category_type,
-                    }
+            .join(
+                CategoryORM,
+                CategoryORM.id == func.coalesce(TransactionORM.category_id, TransactionORM.predicted_category_id),
+            )
+            .where(or_(TransactionORM.category_id.is_not(None), TransactionORM.predicted_category_id.is_not(None)))
+        )
+
+        if year:
+            stmt = stmt.where(TransactionORM.date.between(date(year, 1, 1), date(year, 12, 31)))
+
+        stmt = stmt.order_by(TransactionORM.date.desc())
+
+        # Stream the rows to CSV chunk by chunk instead of materializing all of them
+        output_path = Path(filename)
+        with output_path.open("w", newline="") as f:
+            header = True
+            for chunk in pd.read_sql_query(stmt, self.engine, chunksize=EXPORT_CHUNK_SIZE):
+                has_purpose = chunk["purpose"].fillna("") != ""
+                chunk["description"] = chunk["name"].where(
+                    ~has_purpose, (chunk["name"] + " - " + chunk["purpose"]).str.rstrip(" -")
                 )
+                chunk[EXPORT_COLUMNS].to_csv(f, header=header, index=False)
+                header = False
 
-            df = pd.DataFrame(data)
-            output_path = Path(filename)
-            df.to_csv(output_path, index=False)
+            if header:
+                # No matching transactions: still write the header row
+                pd.DataFrame(columns=EXPORT_COLUMNS).to_csv(f, index=False)
 
-            return str(output_path)
+        return str(output_path)
 
     def get_weighted_baseline(self, year_weights: dict[int, float], exclude_outliers: bool = True) -> dict[str, float]:
         """Get weighted baseline from multiple years with custom weighting.
@@ -328,28 +357,50 @@ class FafyCatDataLoader(DataSource):
         if total_weight == 0:
             raise ValueError("Total weight cannot be zero")
 
-        normalized_weights = {year: weight / total_weight for year, weight in year_weights.items()}
+        weights = pd.Series(year_weights, dtype=float) / total_weight
 
-        # Get data for each year
-        year_data = {}
-        for year in normalized_weights:
+        # Per-year averages share get_monthly_averages' cache; only uncached years are queried
+        pct = DEFAULT_OUTLIER_PERCENTILES
+        keys = {year: ((year,), None, None, exclude_outliers, pct) for year in year_weights}
+        averages = {
+            year: self._monthly_averages_cache[key] for year, key in keys.items() if key in self._monthly_averages_cache
+        }
+        missing = [year for year in keys if year not in averages]
+        if missing:
             try:
-                year_data[year] = self.get_monthly_averages(year, exclude_outliers=exclude_outliers)
-            except Exception:
-                continue
-
-        if not year_data:
-            raise ValueError("No valid data found for any specified years")
-
-        # Calculate weighted averages
-        weighted_baseline = {"income": 0.0, "spending": 0.0, "saving": 0.0}
+                queried = self._query_yearly_averages(missing, exclude_outliers, pct)
+            except Exception as e:
+                raise ValueError("No valid data found for any specified years") from e
+            for year in missing:
+                self._remember(keys[year], queried[year])
+            averages.update(queried)
+
+        # Monthly averages per year (rows) and type (columns); years without data count as zero
+        monthly = pd.DataFrame.from_dict(averages, orient="index")
+        monthly = monthly.reindex(index=weights.index, columns=list(CATEGORY_TYPES))
+
+        weighted = monthly.mul(weights, axis=0).sum()
+        return {category: float(weighted[category]) for category in ("income", "spending", "saving")}
+
+    def _query_yearly_averages(
+        self, years: list[int], exclude_outliers: bool, outlier_percentiles: tuple
+    ) -> dict[int, dict[str, float]]:
+        """Monthly averages of each year in one query; outliers are still filtered per year and type."""
+        stmt = _categorized_amounts(func.extract("year", TransactionORM.date).label("year")).where(_in_years(years))
+        with self.get_session() as session:
+            rows = session.execute(stmt).all()
 
-        for year, data in year_data.items():
-            weight = normalized_weights[year]
-            for category in weighted_baseline:
-                weighted_baseline[category] += data.get(category, 0.0) * weight
+        df = pd.DataFrame(rows, columns=["year", "type", "amount"])
+        df["year"] = df["year"].astype(int)
+        df["amount"] = df["amount"].astype(float).abs()
+        totals = _amount_totals(df, ["year", "type"], exclude_outliers, outlier_percentiles)
 
-        return weighted_baseline
+        return {
+            year: {
+                category_type: float(totals.get((year, category_type), 0.0)) / 12 for category_type in CATEGORY_TYPES
+            }
+            for year in years
+        }
 
     def compare_baselines(self, years: list[int], exclude_outliers: bool = True) -> pd.DataFrame:
         """Compare baseline data across multiple years.
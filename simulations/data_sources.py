@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from datetime import date
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
@@ -171,21 +172,22 @@ class CSVDataSource(DataSource):
 
         for category_type in ["income", "spending", "saving"]:
             type_mask = filtered_df[self.category_type_column] == category_type
-            amounts = filtered_df.loc[type_mask, self.amount_column].abs().tolist()
+            amounts = np.abs(filtered_df.loc[type_mask, self.amount_column].to_numpy(dtype=np.float64))
 
-            if not amounts:
+            if not amounts.size:
                 monthly_averages[category_type] = 0.0
                 continue
 
-            if exclude_outliers and len(amounts) > 10:
-                lower_bound = pd.Series(amounts).quantile(outlier_percentiles[0] / 100)
-                upper_bound = pd.Series(amounts).quantile(outlier_percentiles[1] / 100)
-                filtered_amounts = [a for a in amounts if lower_bound <= a <= upper_bound]
-                total_amount = sum(filtered_amounts) if filtered_amounts else sum(amounts)
-            else:
-                total_amount = sum(amounts)
+            total_amount = amounts.sum()
+            if exclude_outliers and amounts.size > 10:
+                lower_bound, upper_bound = np.quantile(
+                    amounts, [outlier_percentiles[0] / 100, outlier_percentiles[1] / 100]
+                )
+                within = (amounts >= lower_bound) & (amounts <= upper_bound)
+                if within.any():
+                    total_amount = amounts[within].sum()
 
-            monthly_averages[category_type] = total_amount / months
+            monthly_averages[category_type] = float(total_amount) / months
 
         return monthly_averages
 
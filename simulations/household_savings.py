@@ -1,11 +1,18 @@
 """Household savings account integration for simulations."""
 
+import re
 from datetime import date
+from functools import cached_property
 from pathlib import Path
 
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
+LARGE_ONE_OFF_KEYWORDS = ("immobilienkauf", "grunderwerbssteuer", "hauskauf")
+"""Lowercase purpose keywords of large one-off transactions (house purchase, property tax)."""
+
+_LARGE_ONE_OFF_PATTERN = re.compile("|".join(map(re.escape, LARGE_ONE_OFF_KEYWORDS)))
+
 
 class HouseholdSavingsLoader:
     """Load and analyze household savings account data from CSV."""
@@ -30,17 +37,31 @@ class HouseholdSavingsLoader:
         self.df["Date"] = pd.to_datetime(self.df["Date"], format="%d.%m.%Y")
         self.df["Amount"] = self.df["Amount"].astype(float)
 
+        # Scan the purpose text once; the analysis methods reuse these masks
+        purpose = self.df["Purpose"].fillna("").astype(str).str.lower()
+        self._is_etf_purchase = purpose.str.contains("wertpapierkauf", regex=False)
+        self._is_etf_sale = purpose.str.contains("verkauf", regex=False)
+        self._is_sparplan = purpose.str.contains("sparplan", regex=False)
+        self._is_large_one_off = purpose.str.contains(_LARGE_ONE_OFF_PATTERN)
+
+        # Derived values depend on the data just loaded
+        for name in ("_etf_portfolio_value", "_etf_monthly_investment"):
+            self.__dict__.pop(name, None)
+
     def get_current_balance(self) -> float:
         """Get current household savings balance."""
         return self.current_balance
 
     def get_etf_portfolio_value(self) -> float:
         """Calculate current ETF portfolio value from transactions."""
-        etf_purchases = self.df[self.df["Purpose"].str.contains("Wertpapierkauf", na=False, case=False)]
-        etf_sales = self.df[self.df["Purpose"].str.contains("Verkauf", na=False, case=False)]
+        return self._etf_portfolio_value
 
+    @cached_property
+    def _etf_portfolio_value(self) -> float:
         # ETF purchases are negative (money out), sales are positive (money in)
-        net_invested = abs(etf_purchases["Amount"].sum()) - etf_sales["Amount"].sum()
+        net_invested = (
+            abs(self.df.loc[self._is_etf_purchase, "Amount"].sum()) - self.df.loc[self._is_etf_sale, "Amount"].sum()
+        )
         return net_invested
 
     def get_monthly_savings_rate(self, exclude_large_transactions: bool = True) -> float:
@@ -53,27 +74,18 @@ class HouseholdSavingsLoader:
         Returns:
             Average monthly net savings rate
         """
-        df_analysis = self.df.copy()
+        keep = pd.Series(True, index=self.df.index)
 
         if exclude_large_transactions:
             # Exclude large one-off transactions (house purchase, property tax, etc.)
-            large_transactions = df_analysis[
-                df_analysis["Purpose"].str.contains("Immobilienkauf|Grunderwerbssteuer|Hauskauf", na=False, case=False)
-            ]
-            df_analysis = df_analysis[~df_analysis.index.isin(large_transactions.index)]
+            keep &= ~self._is_large_one_off
 
         # Use recent data based on months_back parameter
         cutoff_date = date.today() - relativedelta(months=self.months_back)
-        recent_data = df_analysis[df_analysis["Date"] >= pd.Timestamp(cutoff_date)]
-
-        # Exclude ETF internal transfers (sparplan deposits)
-        sparplan_deposits = recent_data[recent_data["Purpose"].str.contains("Sparplan", na=False, case=False)]
-        etf_purchases = recent_data[recent_data["Purpose"].str.contains("Wertpapierkauf", na=False, case=False)]
+        keep &= self.df["Date"] >= pd.Timestamp(cutoff_date)
 
-        # Real savings excluding ETF transactions
-        real_savings = recent_data[
-            ~recent_data.index.isin(sparplan_deposits.index) & ~recent_data.index.isin(etf_purchases.index)
-        ]
+        # Real savings excluding ETF transactions (sparplan deposits and purchases)
+        real_savings = self.df[keep & ~self._is_sparplan & ~self._is_etf_purchase]
 
         if len(real_savings) == 0:
             return 0.0
@@ -92,7 +104,11 @@ class HouseholdSavingsLoader:
 
         Returns the most recent sparplan amount, as these can change over time.
         """
-        sparplan_data = self.df[self.df["Purpose"].str.contains("Sparplan", na=False, case=False)]
+        return self._etf_monthly_investment
+
+    @cached_property
+    def _etf_monthly_investment(self) -> float:
+        sparplan_data = self.df[self._is_sparplan]
 
         if len(sparplan_data) == 0:
             return 0.0
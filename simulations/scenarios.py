@@ -2,9 +2,19 @@
 
 from typing import Any
 
+import numpy as np
+
 from .core import Scenario
 
 
+def _repeat_monthly(monthly_data: dict[str, float], months: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Repeat one month's (income, spending, saving) amounts for ``months`` months."""
+    income, spending, saving = (
+        np.full(months, monthly_data.get(key, 0), dtype=float) for key in ("income", "spending", "saving")
+    )
+    return income, spending, saving
+
+
 class ParentalLeaveScenario(Scenario):
     """Scenario for parental leave with configurable parameters."""
 
@@ -90,6 +100,36 @@ class ParentalLeaveScenario(Scenario):
 
         return adjusted
 
+    def apply_adjustments_vectorized(
+        self, baseline_data: dict[str, float], months: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Apply parental leave adjustments to all months at once."""
+        monthly_inflation = (1 + self.inflation_rate) ** (1 / 12) - 1
+        inflated = {key: value * (1 + monthly_inflation) for key, value in baseline_data.items()}
+
+        month_numbers = np.arange(1, months + 1)
+        on_leave = (month_numbers >= self.start_month) & (month_numbers < self.start_month + self.months_without_salary)
+        after_start = month_numbers >= self.start_month
+
+        # Elterngeld replaces income during leave; child benefits apply from the start month on
+        income = np.full(months, inflated["income"], dtype=float)
+        elterngeld = min(inflated["income"] * self.salary_replacement_rate, self.elterngeld_cap)
+        income[on_leave] = elterngeld
+        income[after_start] += self.kindergeld_increase
+
+        adjusted = {
+            "income": income,
+            "spending": np.full(months, inflated.get("spending", 0), dtype=float),
+            "saving": np.full(months, inflated.get("saving", 0), dtype=float),
+        }
+
+        # Spending reductions during parental leave
+        for category, reduction_factor in self.reduced_spending.items():
+            if category in adjusted and category in inflated:
+                adjusted[category][on_leave] *= 1 - reduction_factor
+
+        return adjusted["income"], adjusted["spending"], adjusted["saving"]
+
 
 class InflationOnlyScenario(Scenario):
     """Simple scenario that only applies inflation adjustments."""
@@ -109,6 +149,12 @@ class InflationOnlyScenario(Scenario):
         monthly_inflation = (1 + self.annual_inflation_rate) ** (1 / 12) - 1
         return {key: value * (1 + monthly_inflation) for key, value in baseline_data.items()}
 
+    def apply_adjustments_vectorized(
+        self, baseline_data: dict[str, float], months: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Apply inflation to all months at once; every month gets the same amounts."""
+        return _repeat_monthly(self.apply_adjustments(baseline_data), months)
+
 
 class IncomeChangeScenario(Scenario):
     """Scenario for general income changes (job loss, promotion, etc.)."""
@@ -155,6 +201,16 @@ class IncomeChangeScenario(Scenario):
 
         return adjusted
 
+    def apply_adjustments_vectorized(
+        self, baseline_data: dict[str, float], months: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Apply income change to all months at once."""
+        income, spending, saving = _repeat_monthly(baseline_data, months)
+        month_numbers = np.arange(1, months + 1)
+        changed = (month_numbers >= self.start_month) & (month_numbers < self.start_month + self.duration_months)
+        income[changed] *= 1 + self.income_change_percent
+        return income, spending, saving
+
 
 class SpendingReductionScenario(Scenario):
     """Scenario for reducing spending by category or overall."""
@@ -200,21 +256,36 @@ class SpendingReductionScenario(Scenario):
 
         return adjusted
 
+    def apply_adjustments_vectorized(
+        self, baseline_data: dict[str, float], months: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Apply spending reductions to all months at once; every month gets the same amounts."""
+        return _repeat_monthly(self.apply_adjustments(baseline_data), months)
+
 
 class CustomScenario(Scenario):
     """Flexible scenario that accepts a custom adjustment function."""
 
-    def __init__(self, adjustment_function, name: str = "Custom", parameters: dict[str, Any] | None = None):
+    def __init__(
+        self,
+        adjustment_function,
+        name: str = "Custom",
+        parameters: dict[str, Any] | None = None,
+        period: int | None = None,
+    ):
         """Initialize custom scenario.
 
         Args:
             adjustment_function: Function that takes baseline_data and returns adjusted data
             name: Scenario name
             parameters: Parameters dict for documentation
+            period: Months after which the function's results repeat (e.g. 12 for
+                seasonal patterns), so it is only called for the first period
         """
         super().__init__(name)
         self.adjustment_function = adjustment_function
         self.parameters = parameters or {}
+        self.period = period
 
     def apply_adjustments(self, baseline_data: dict[str, float], month_number: int = 1) -> dict[str, float]:
         """Apply custom adjustment function."""
@@ -56,7 +56,13 @@ def reset_singletons() -> None:
 
 
 def get_categorizer(db: Session = Depends(get_db_session)) -> TransactionCategorizer | EnsembleCategorizer:
-    """Get or create the ML categorizer instance."""
+    """Get or create the ML categorizer instance.
+
+    The model is deserialized once per process and reused by every request
+    until training replaces it. Only a successfully loaded categorizer is
+    cached, so a missing or broken model file is re-checked on the next call
+    instead of leaving an untrained instance behind.
+    """
     global _categorizer, _config
 
     if _categorizer is None or _config is None:
@@ -64,17 +70,18 @@ def get_categorizer(db: Session = Depends(get_db_session)) -> TransactionCategor
         _config.ensure_dirs()
 
         # Choose between ensemble and single model based on config
+        categorizer: TransactionCategorizer | EnsembleCategorizer
         if _config.ml.use_ensemble:
-            _categorizer = EnsembleCategorizer(db, _config.ml)
+            categorizer = EnsembleCategorizer(db, _config.ml)
             model_path = _config.ml.model_dir / "ensemble_categorizer.pkl"
         else:
-            _categorizer = TransactionCategorizer(db, _config.ml)
+            categorizer = TransactionCategorizer(db, _config.ml)
             model_path = _config.ml.model_dir / "categorizer.pkl"
 
         # Try to load saved model
         if model_path.exists():
             try:
-                _categorizer.load_model(model_path)
+                categorizer.load_model(model_path)
             except Exception as e:
                 error_msg = str(e)
                 if "No module named 'fafycat'" in error_msg:
@@ -94,6 +101,7 @@ def get_categorizer(db: Session = Depends(get_db_session)) -> TransactionCategor
                     )
 
                 raise HTTPException(status_code=503, detail=detail) from e
+            _categorizer = categorizer
         else:
             model_type = "ensemble" if _config.ml.use_ensemble else "single"
             raise HTTPException(
@@ -90,6 +90,51 @@ class UploadResponse(BaseModel):
     auto_accepted: int = 0
     needs_review: int = 0
     quality_check: int = 0
+    predictions_pending: bool = False  # True while background predictions run; see the upload preview
+
+
+class UploadPreviewTransaction(BaseModel):
+    """One transaction row in an upload preview."""
+
+    id: str
+    date: date
+    description: str
+    amount: float
+    currency: str
+
+
+class UploadPreviewSummary(BaseModel):
+    """Import counts reported by the upload preview."""
+
+    filename: str
+    total_rows: int
+    imported: int
+    duplicates: int
+    predictions_made: int = 0
+
+
+class UploadPreviewResponse(BaseModel):
+    """Response model for an upload preview."""
+
+    upload_id: str
+    summary: UploadPreviewSummary
+    preview: list[UploadPreviewTransaction]
+
+
+class UploadConfirmSummary(BaseModel):
+    """Import counts reported when an upload is confirmed."""
+
+    imported: int
+    duplicates: int
+    predictions_made: int = 0
+
+
+class UploadConfirmResponse(BaseModel):
+    """Response model for upload confirmation."""
+
+    message: str
+    upload_id: str
+    summary: UploadConfirmSummary
 
 
 class ExportRequest(BaseModel):
@@ -1,23 +1,117 @@
 """API routes for file upload operations."""
 
+import asyncio
 import html
-import tempfile
+import json
 import uuid
-from pathlib import Path
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Request, UploadFile
 from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 
-from fafycat.api.dependencies import get_db_session
-from fafycat.api.models import UploadResponse
+from fafycat.api.dependencies import get_db_manager, get_db_session
+from fafycat.api.models import (
+    UploadConfirmResponse,
+    UploadConfirmSummary,
+    UploadPreviewResponse,
+    UploadPreviewSummary,
+    UploadPreviewTransaction,
+    UploadResponse,
+)
+from fafycat.core.database import DatabaseManager, TransactionORM, UploadSessionORM
+from fafycat.core.models import TransactionInput
 from fafycat.data.csv_processor import CSVProcessor
 from fafycat.ml.prediction_pipeline import CategorizationSummary, predict_new
 
 router = APIRouter(prefix="/upload", tags=["upload"])
 
-# Store upload sessions temporarily (in production, use Redis or database)
-upload_sessions = {}
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+PREVIEW_ROWS = 5
+UPLOAD_SESSION_TTL = timedelta(hours=1)
+
+
+class UploadRejectedError(ValueError):
+    """An uploaded CSV that cannot be imported; the message is user-facing."""
+
+
+@dataclass(frozen=True)
+class CSVUploadResult:
+    """Outcome of importing one uploaded CSV file."""
+
+    transactions: list[TransactionInput]
+    transaction_ids: list[str]
+    inserted_ids: list[str]
+    new_count: int
+    duplicate_count: int
+    categorization: dict
+
+
+class UploadSessionStore:
+    """Upload sessions keyed by ``upload_id``, persisted in the application database.
+
+    Keeping sessions out of process memory lets a preview or confirmation be
+    served by any worker, not just the one that handled the upload. Sessions
+    expire after ``ttl``; abandoned previews are purged whenever a new upload
+    is stored, so the table stays bounded.
+    """
+
+    def __init__(self, db: Session, ttl: timedelta = UPLOAD_SESSION_TTL):
+        self.db = db
+        self.ttl = ttl
+
+    def _cutoff(self) -> datetime:
+        return datetime.now(UTC) - self.ttl
+
+    def put(self, upload_id: str, data: dict) -> None:
+        """Store session data for an upload and purge expired sessions."""
+        self.db.query(UploadSessionORM).filter(UploadSessionORM.created_at < self._cutoff()).delete()
+        self.db.merge(
+            UploadSessionORM(
+                upload_id=upload_id,
+                filename=data["filename"],
+                total_rows=data["total_rows"],
+                imported=data["imported"],
+                duplicates=data["duplicates"],
+                predictions_made=data.get("predictions_made", 0),
+                transaction_ids=json.dumps(data["transaction_ids"]),
+            )
+        )
+        self.db.commit()
+
+    def get(self, upload_id: str) -> dict | None:
+        """Return session data for an upload, or ``None`` if unknown or expired."""
+        row = (
+            self.db.query(UploadSessionORM)
+            .filter(UploadSessionORM.upload_id == upload_id, UploadSessionORM.created_at >= self._cutoff())
+            .first()
+        )
+        if row is None:
+            return None
+        return {
+            "filename": row.filename,
+            "total_rows": row.total_rows,
+            "imported": row.imported,
+            "duplicates": row.duplicates,
+            "predictions_made": row.predictions_made,
+            "transaction_ids": json.loads(str(row.transaction_ids)),
+        }
+
+    def set_predictions_made(self, upload_id: str, predictions_made: int) -> None:
+        """Record the prediction count for an upload once predictions finish."""
+        self.db.query(UploadSessionORM).filter(UploadSessionORM.upload_id == upload_id).update(
+            {UploadSessionORM.predictions_made: predictions_made}
+        )
+        self.db.commit()
+
+    def pop(self, upload_id: str) -> dict | None:
+        """Remove an upload's session and return its data, or ``None`` if unknown."""
+        data = self.get(upload_id)
+        if data is not None:
+            self.db.query(UploadSessionORM).filter(UploadSessionORM.upload_id == upload_id).delete()
+            self.db.commit()
+        return data
 
 
 def _summary_to_dict(summary: CategorizationSummary) -> dict:
@@ -35,20 +129,22 @@ def empty_categorization_summary() -> dict:
     return _summary_to_dict(CategorizationSummary())
 
 
-def predict_transaction_categories(db: Session, transactions: list, new_count: int) -> dict:
+def predict_transaction_categories(db: Session, inserted_ids: list[str]) -> dict:
     """Predict categories for newly imported transactions via the Prediction Pipeline.
 
-    Gracefully degrades to an empty categorization summary when no trained
-    Categorizer is available - the import itself still succeeds.
+    ``inserted_ids`` are the IDs the import actually inserted; duplicates of
+    stored rows are never looked up. Gracefully degrades to an empty
+    categorization summary when no trained Categorizer is available - the
+    import itself still succeeds.
     """
-    if new_count <= 0:
+    if not inserted_ids:
         return empty_categorization_summary()
 
     try:
         from fafycat.api.ml import get_categorizer
 
         categorizer = get_categorizer(db)
-        summary = predict_new(db, categorizer, [t.generate_id() for t in transactions])
+        summary = predict_new(db, categorizer, inserted_ids)
     except Exception as e:
         _handle_prediction_error(e)
         return empty_categorization_summary()
@@ -69,185 +165,209 @@ def _handle_prediction_error(e: Exception):
         traceback.print_exc()
 
 
-@router.post("/csv", response_model=UploadResponse)
-async def upload_csv(file: UploadFile = File(...), db: Session = Depends(get_db_session)) -> UploadResponse:
-    """Upload and process a CSV file containing transactions."""
-    # Validate file type
+def validate_csv_upload(file: UploadFile) -> None:
+    """Reject uploads that are not ``.csv`` files or exceed the size limit.
+
+    Raises:
+        UploadRejectedError: If the file name or size is not acceptable.
+    """
     if not file.filename or not file.filename.endswith(".csv"):
-        raise HTTPException(status_code=400, detail="Only CSV files are allowed")
+        raise UploadRejectedError("Only CSV files are allowed")
 
-    # Validate file size (limit to 10MB)
-    if file.size and file.size > 10 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="File too large (max 10MB)")
+    if file.size and file.size > MAX_UPLOAD_BYTES:
+        raise UploadRejectedError("File too large (max 10MB)")
 
-    temp_file_path: Path | None = None
-    try:
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".csv", delete=False) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = Path(temp_file.name)
-
-        # Process CSV
-        processor = CSVProcessor(db)
-        transactions, errors = processor.import_csv(temp_file_path)
-
-        if errors:
-            raise HTTPException(
-                status_code=400,
-                detail=f"CSV processing errors: {'; '.join(errors[:5])}",  # Show first 5 errors
-            )
 
-        if not transactions:
-            raise HTTPException(status_code=400, detail="No valid transactions found in CSV")
+async def import_csv_upload(
+    file: UploadFile, db: Session, *, max_errors: int = 5, predict: bool = True
+) -> CSVUploadResult:
+    """Parse an uploaded CSV, save its transactions, and auto-predict the new ones.
 
-        # Save transactions to database
-        new_count, duplicate_count = processor.save_transactions(transactions)
+    This is the single import pipeline behind every upload route.
 
-        # Auto-predict categories for new transactions if model is available
-        cat_summary = predict_transaction_categories(db, transactions, new_count)
+    Args:
+        file: The uploaded CSV file.
+        db: Database session used for saving and prediction.
+        max_errors: Number of row errors to include in the rejection message.
+        predict: Whether to predict inline; callers that defer prediction get
+            an empty categorization summary.
 
-        upload_id = str(uuid.uuid4())
+    Raises:
+        UploadRejectedError: If the CSV has parse errors or no valid transactions.
+    """
+    # Parse the spooled upload in place rather than copying it to a second temp file first.
+    # Parsing, saving and prediction block, so they run in a worker thread to keep the event loop free.
+    await file.seek(0)
+    processor = CSVProcessor(db)
+    transactions, errors = await asyncio.to_thread(processor.import_csv_stream, file.file)
 
-        # Store session info for potential preview/confirmation workflow
-        upload_sessions[upload_id] = {
-            "filename": file.filename,
-            "total_rows": len(transactions),
-            "imported": new_count,
-            "duplicates": duplicate_count,
-            "predictions_made": cat_summary["predictions_made"],
-            "transaction_ids": [t.generate_id() for t in transactions[:10]],  # Store first 10 for preview
-        }
+    if errors:
+        raise UploadRejectedError(f"CSV processing errors: {'; '.join(errors[:max_errors])}")
 
-        return UploadResponse(
-            upload_id=upload_id,
-            filename=file.filename,
-            rows_processed=len(transactions),
-            transactions_imported=new_count,
-            duplicates_skipped=duplicate_count,
-            **cat_summary,
-        )
+    if not transactions:
+        raise UploadRejectedError("No valid transactions found in CSV")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Upload processing failed: {str(e)}") from e
-    finally:
-        if temp_file_path is not None:
-            temp_file_path.unlink(missing_ok=True)
+    inserted_ids, duplicate_count = await asyncio.to_thread(processor.insert_new_transactions, transactions)
 
+    # Auto-predict categories for new transactions if model is available
+    if predict:
+        categorization = await asyncio.to_thread(predict_transaction_categories, db, inserted_ids)
+    else:
+        categorization = empty_categorization_summary()
+
+    return CSVUploadResult(
+        transactions=transactions,
+        transaction_ids=[t.transaction_id for t in transactions],
+        inserted_ids=inserted_ids,
+        new_count=len(inserted_ids),
+        duplicate_count=duplicate_count,
+        categorization=categorization,
+    )
 
-@router.get("/preview/{upload_id}")
-async def get_upload_preview(upload_id: str, db: Session = Depends(get_db_session)) -> dict:
-    """Get preview of uploaded transactions before confirmation."""
-    if upload_id not in upload_sessions:
-        raise HTTPException(status_code=404, detail="Upload session not found")
 
-    session_data = upload_sessions[upload_id]
+def predict_upload_in_background(db_manager: DatabaseManager, upload_id: str, inserted_ids: list[str]) -> None:
+    """Predict an upload's new transactions after the response has been sent.
 
-    # Get first few transactions for preview
-    from fafycat.core.database import TransactionORM
+    Runs with its own session because the request-scoped one is closed by then.
+    The resulting count is recorded on the upload session for the preview.
+    """
+    with db_manager.get_session() as db:
+        categorization = predict_transaction_categories(db, inserted_ids)
+        UploadSessionStore(db).set_predictions_made(upload_id, categorization["predictions_made"])
 
-    transactions = (
-        db.query(TransactionORM).filter(TransactionORM.id.in_(session_data["transaction_ids"])).limit(5).all()
-    )
 
-    preview_data = []
-    for txn in transactions:
-        preview_data.append(
-            {
-                "id": txn.id,
-                "date": txn.date.isoformat(),
-                "description": f"{txn.name} - {txn.purpose}".rstrip(" -") if txn.purpose else txn.name,
-                "amount": txn.amount,
-                "currency": txn.currency,
-            }
-        )
+@router.post("/csv", response_model=UploadResponse)
+async def upload_csv(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db_session),
+) -> UploadResponse:
+    """Upload and process a CSV file containing transactions.
+
+    Returns as soon as the transactions are saved; ML predictions for the new
+    rows run as a background task and their count shows up in the preview.
+    """
+    try:
+        validate_csv_upload(file)
+        result = await import_csv_upload(file, db, predict=False)
+    except UploadRejectedError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Upload processing failed: {str(e)}") from e
 
-    return {
-        "upload_id": upload_id,
-        "summary": {
-            "filename": session_data["filename"],
-            "total_rows": session_data["total_rows"],
-            "imported": session_data["imported"],
-            "duplicates": session_data["duplicates"],
-            "predictions_made": session_data.get("predictions_made", 0),
+    transactions = result.transactions
+    upload_id = str(uuid.uuid4())
+
+    # Store session info for potential preview/confirmation workflow
+    UploadSessionStore(db).put(
+        upload_id,
+        {
+            "filename": file.filename,
+            "total_rows": len(transactions),
+            "imported": result.new_count,
+            "duplicates": result.duplicate_count,
+            "predictions_made": result.categorization["predictions_made"],
+            "transaction_ids": result.transaction_ids[:10],  # Store first 10 for preview
         },
-        "preview": preview_data,
-    }
+    )
 
+    predictions_pending = result.new_count > 0
+    if predictions_pending:
+        background_tasks.add_task(predict_upload_in_background, get_db_manager(request), upload_id, result.inserted_ids)
+
+    return UploadResponse(
+        upload_id=upload_id,
+        filename=str(file.filename),
+        rows_processed=len(transactions),
+        transactions_imported=result.new_count,
+        duplicates_skipped=result.duplicate_count,
+        predictions_pending=predictions_pending,
+        **result.categorization,
+    )
 
-@router.post("/confirm/{upload_id}")
-async def confirm_upload(upload_id: str, db: Session = Depends(get_db_session)) -> dict:
-    """Confirm and finalize transaction import."""
-    if upload_id not in upload_sessions:
+
+@router.get("/preview/{upload_id}", response_model=UploadPreviewResponse)
+async def get_upload_preview(upload_id: str, db: Session = Depends(get_db_session)) -> UploadPreviewResponse:
+    """Get preview of uploaded transactions before confirmation."""
+    session_data = UploadSessionStore(db).get(upload_id)
+    if session_data is None:
         raise HTTPException(status_code=404, detail="Upload session not found")
 
-    session_data = upload_sessions[upload_id]
+    # Get first few transactions for preview, selecting only the columns it shows
+    transactions = (
+        db.query(
+            TransactionORM.id,
+            TransactionORM.date,
+            TransactionORM.name,
+            TransactionORM.purpose,
+            TransactionORM.amount,
+            TransactionORM.currency,
+        )
+        .filter(TransactionORM.id.in_(session_data["transaction_ids"]))
+        .limit(PREVIEW_ROWS)
+        .all()
+    )
 
+    return UploadPreviewResponse(
+        upload_id=upload_id,
+        summary=UploadPreviewSummary(
+            filename=session_data["filename"],
+            total_rows=session_data["total_rows"],
+            imported=session_data["imported"],
+            duplicates=session_data["duplicates"],
+            predictions_made=session_data.get("predictions_made", 0),
+        ),
+        preview=[
+            UploadPreviewTransaction(
+                id=txn.id,
+                date=txn.date,
+                description=f"{txn.name} - {txn.purpose}".rstrip(" -") if txn.purpose else txn.name,
+                amount=txn.amount,
+                currency=txn.currency,
+            )
+            for txn in transactions
+        ],
+    )
+
+
+@router.post("/confirm/{upload_id}", response_model=UploadConfirmResponse)
+async def confirm_upload(upload_id: str, db: Session = Depends(get_db_session)) -> UploadConfirmResponse:
+    """Confirm and finalize transaction import."""
     # Clean up session
-    del upload_sessions[upload_id]
+    session_data = UploadSessionStore(db).pop(upload_id)
+    if session_data is None:
+        raise HTTPException(status_code=404, detail="Upload session not found")
 
-    return {
-        "message": "Upload confirmed and transactions saved",
-        "upload_id": upload_id,
-        "summary": {
-            "imported": session_data["imported"],
-            "duplicates": session_data["duplicates"],
-            "predictions_made": session_data.get("predictions_made", 0),
-        },
-    }
+    return UploadConfirmResponse(
+        message="Upload confirmed and transactions saved",
+        upload_id=upload_id,
+        summary=UploadConfirmSummary(
+            imported=session_data["imported"],
+            duplicates=session_data["duplicates"],
+            predictions_made=session_data.get("predictions_made", 0),
+        ),
+    )
 
 
 @router.post("/csv-htmx", response_class=HTMLResponse)
 async def upload_csv_htmx(file: UploadFile = File(...), db: Session = Depends(get_db_session)) -> str:
     """Upload and process a CSV file, returning HTML results for HTMX."""
-    temp_file_path: Path | None = None
     try:
-        # Validate file type
-        if not file.filename or not file.filename.endswith(".csv"):
-            return _render_upload_error("Only CSV files are allowed")
-
-        # Validate file size (limit to 10MB)
-        if file.size and file.size > 10 * 1024 * 1024:
-            return _render_upload_error("File too large (max 10MB)")
-
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".csv", delete=False) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = Path(temp_file.name)
-
-        # Process CSV
-        processor = CSVProcessor(db)
-        transactions, errors = processor.import_csv(temp_file_path)
-
-        if errors:
-            return _render_upload_error(f"CSV processing errors: {'; '.join(errors[:3])}")
-
-        if not transactions:
-            return _render_upload_error("No valid transactions found in CSV")
-
-        # Save transactions to database
-        new_count, duplicate_count = processor.save_transactions(transactions)
-
-        # Auto-predict categories for new transactions if model is available
-        cat_summary = predict_transaction_categories(db, transactions, new_count)
-
-        # Return success HTML
-        return _render_upload_success(
-            filename=file.filename,
-            rows_processed=len(transactions),
-            new_count=new_count,
-            duplicate_count=duplicate_count,
-            predictions_made=cat_summary["predictions_made"],
-        )
-
+        validate_csv_upload(file)
+        result = await import_csv_upload(file, db, max_errors=3)
+    except UploadRejectedError as e:
+        return _render_upload_error(str(e))
     except Exception as e:
         return _render_upload_error(f"Upload processing failed: {str(e)}")
-    finally:
-        if temp_file_path is not None:
-            temp_file_path.unlink(missing_ok=True)
+
+    return _render_upload_success(
+        filename=str(file.filename),
+        rows_processed=len(result.transactions),
+        new_count=result.new_count,
+        duplicate_count=result.duplicate_count,
+        predictions_made=result.categorization["predictions_made"],
+    )
 
 
 def _render_upload_success(
@@ -7,14 +7,25 @@ from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 
+from fafycat.api.analytics import router as analytics_router
+from fafycat.api.budgets import router as budgets_router
+from fafycat.api.categories import router as categories_router
+from fafycat.api.export import router as export_router
+from fafycat.api.ml import router as ml_router
+from fafycat.api.transactions import router as transactions_router
+from fafycat.api.upload import router as upload_router
 from fafycat.core.config import AppConfig
 from fafycat.core.database import DatabaseManager
+from fafycat.web.routes import router as web_router
 
 _PACKAGE_DIR = Path(__file__).resolve().parent
 
+logger = logging.getLogger(__name__)
+
 
 class _TrainingStatusAccessLogFilter(logging.Filter):
     """Drop uvicorn access-log lines for the training-status poll endpoint."""
@@ -44,19 +55,22 @@ def create_app() -> FastAPI:
     app.state.config = config
     app.state.db_manager = db_manager
 
+    # Compress larger responses (transaction lists, previews, rendered pages)
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Add performance monitoring middleware
     @app.middleware("http")
     async def add_process_time_header(request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
+        process_time = (time.perf_counter_ns() - start_ns) / 1e9
+        response.headers["X-Process-Time"] = f"{process_time:.6f}"
 
         # Log slow requests
         if process_time > 0.1:  # Log requests taking more than 100ms
-            logging.warning("SLOW REQUEST: %s %s took %.3fs", request.method, request.url.path, process_time)
+            logger.warning("SLOW REQUEST: %s %s took %.3fs", request.method, request.url.path, process_time)
         elif process_time > 0.05:  # Log requests taking more than 50ms
-            logging.info("Request %s %s took %.3fs", request.method, request.url.path, process_time)
+            logger.info("Request %s %s took %.3fs", request.method, request.url.path, process_time)
 
         return response
 
@@ -64,14 +78,6 @@ def create_app() -> FastAPI:
     app.mount("/static", StaticFiles(directory=_PACKAGE_DIR / "static"), name="static")
 
     # Include API routes
-    from fafycat.api.analytics import router as analytics_router
-    from fafycat.api.budgets import router as budgets_router
-    from fafycat.api.categories import router as categories_router
-    from fafycat.api.export import router as export_router
-    from fafycat.api.ml import router as ml_router
-    from fafycat.api.transactions import router as transactions_router
-    from fafycat.api.upload import router as upload_router
-
     app.include_router(transactions_router, prefix="/api")
     app.include_router(categories_router, prefix="/api")
     app.include_router(upload_router, prefix="/api")
@@ -81,8 +87,6 @@ def create_app() -> FastAPI:
     app.include_router(analytics_router)
 
     # Include web routes (FastHTML)
-    from fafycat.web.routes import router as web_router
-
     app.include_router(web_router)
 
     return app
@@ -148,6 +148,8 @@ def cmd_serve(args: argparse.Namespace) -> None:
 
     port = args.port or (8001 if args.dev else 8000)
     host = args.host or "127.0.0.1"
+    # Hot reload runs a single supervised process; uvicorn ignores workers there.
+    workers = 1 if args.dev else args.workers
 
     from fafycat.core.config import AppConfig
 
@@ -162,6 +164,8 @@ def cmd_serve(args: argparse.Namespace) -> None:
     print(f"📊 Database: {os.environ['FAFYCAT_DB_URL']}")
     print(f"🌐 http://localhost:{port}")
     print(f"📚 API docs: http://localhost:{port}/docs")
+    if workers > 1:
+        print(f"⚙️  Workers: {workers}")
     print("-" * 50)
 
     import uvicorn
@@ -171,6 +175,9 @@ def cmd_serve(args: argparse.Namespace) -> None:
         host=host,
         port=port,
         reload=args.dev,
+        workers=workers,
+        loop="auto",  # uvloop / httptools when installed, asyncio / h11 otherwise
+        http="auto",
         log_level="info",
     )
 
@@ -206,8 +213,9 @@ def cmd_import(args: argparse.Namespace) -> None:
             print(json.dumps({"error": "No valid transactions found in CSV"}))
             sys.exit(1)
 
-        new_count, duplicate_count = processor.save_transactions(transactions)
-        cat_summary = predict_transaction_categories(session, transactions, new_count)
+        inserted_ids, duplicate_count = processor.insert_new_transactions(transactions)
+        new_count = len(inserted_ids)
+        cat_summary = predict_transaction_categories(session, inserted_ids)
 
         result = {
             "filename": csv_path.name,
@@ -644,6 +652,15 @@ def main() -> None:
         help="Port number (default: 8001 for dev, 8000 for prod)",
     )
     serve_parser.add_argument("--host", default=None, help="Host to bind to (default: 127.0.0.1)")
+    serve_parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help=(
+            "Number of server processes (default: 1, ignored with --dev). "
+            "ML training progress is tracked per process, so keep 1 unless you only use the API."
+        ),
+    )
     _add_data_dir_argument(serve_parser, suppress_default=True)
 
     import_parser = subparsers.add_parser("import", help="Import transactions from a CSV file")
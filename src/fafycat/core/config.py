@@ -56,6 +56,8 @@ class MLConfig(BaseModel):
     # Ensemble settings
     use_ensemble: bool = True
     ensemble_cv_folds: int = 5
+    # Fit Naive Bayes in a worker thread while LightGBM fits (False = one after the other)
+    ensemble_concurrent_fit: bool = True
 
     # LightGBM parameters (Optuna-tuned, 5x5 CV macro F1: 0.8549 vs 0.8466 baseline)
     lgbm_params: dict[str, Any] = Field(
@@ -16,6 +16,8 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     create_engine,
+    event,
+    make_url,
 )
 from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
 
@@ -28,6 +30,36 @@ def _utc_now() -> datetime:
     return datetime.now(UTC)
 
 
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",  # readers are not blocked while an import commits
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+)
+
+
+SQLITE_POOL_OPTIONS = {
+    # Keep connections (and their applied pragmas) open for request, upload-thread and
+    # background-task sessions instead of reconnecting once the default pool of 5 is in use.
+    "pool_size": 10,
+    "max_overflow": 20,
+}
+
+ID_CHUNK_SIZE = 500
+"""Maximum transaction IDs bound into one ``IN (...)`` filter (SQLite caps bound parameters)."""
+
+
+def apply_sqlite_pragmas(dbapi_connection, _connection_record=None) -> None:
+    """Apply ``SQLITE_PRAGMAS`` to a new SQLite DBAPI connection (engine ``connect`` listener)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 class CategoryORM(Base):
     """Category table."""
 
@@ -141,6 +173,21 @@ class AppSettingsORM(Base):
     updated_at = Column(DateTime, default=_utc_now, onupdate=_utc_now)
 
 
+class UploadSessionORM(Base):
+    """Upload preview/confirmation sessions, shared by every app worker."""
+
+    __tablename__ = "upload_sessions"
+
+    upload_id = Column(String(36), primary_key=True)
+    filename = Column(Text, nullable=False)
+    total_rows = Column(Integer, nullable=False, default=0)
+    imported = Column(Integer, nullable=False, default=0)
+    duplicates = Column(Integer, nullable=False, default=0)
+    predictions_made = Column(Integer, nullable=False, default=0)
+    transaction_ids = Column(Text, nullable=False, default="[]")  # JSON list of preview IDs
+    created_at = Column(DateTime, default=_utc_now)
+
+
 class ModelMetadataORM(Base):
     """Model metadata table."""
 
@@ -163,13 +210,20 @@ class DatabaseManager:
 
         # Configure SQLite connection with timeout for long operations
         connect_args = {}
+        pool_options = {}
         if config.database.url.startswith("sqlite"):
             connect_args = {
                 "timeout": 300,  # 5 minutes timeout for SQLite operations
                 "check_same_thread": False,
             }
+            if make_url(config.database.url).database not in (None, "", ":memory:"):
+                pool_options = SQLITE_POOL_OPTIONS
 
-        self.engine = create_engine(config.database.url, echo=config.database.echo, connect_args=connect_args)
+        self.engine = create_engine(
+            config.database.url, echo=config.database.echo, connect_args=connect_args, **pool_options
+        )
+        if config.database.url.startswith("sqlite"):
+            event.listen(self.engine, "connect", apply_sqlite_pragmas)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
     def create_tables(self) -> None:
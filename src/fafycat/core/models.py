@@ -3,6 +3,7 @@
 import hashlib
 from datetime import date, datetime
 from enum import StrEnum
+from functools import cached_property
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
@@ -54,6 +55,9 @@ class BudgetPlan(BaseModel):
     updated_at: datetime | None = None
 
 
+_ID_FIELDS = frozenset({"date", "amount", "name", "purpose"})
+
+
 class TransactionInput(BaseModel):
     """Raw transaction from CSV import."""
 
@@ -72,6 +76,17 @@ class TransactionInput(BaseModel):
         key = f"{self.date}|{self.amount}|{self.name}|{self.purpose}"
         return hashlib.sha256(key.encode()).hexdigest()[:16]
 
+    @cached_property
+    def transaction_id(self) -> str:
+        """Deterministic ID, hashed once per instance and reused by later callers."""
+        return self.generate_id()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Assigning a field the ID is built from drops the memoized ID
+        if name in _ID_FIELDS:
+            self.__dict__.pop("transaction_id", None)
+
 
 class Transaction(BaseModel):
     """Database transaction model."""
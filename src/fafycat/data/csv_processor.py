@@ -4,12 +4,13 @@ import csv
 import uuid
 from datetime import UTC, date, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, TextIO
 
 import pandas as pd
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from ..core.database import CategoryORM, TransactionORM
+from ..core.database import ID_CHUNK_SIZE, CategoryORM, TransactionORM
 from ..core.models import TransactionInput
 
 
@@ -25,11 +26,29 @@ class CSVProcessor:
         Returns:
             Tuple of (successful_transactions, error_messages)
         """
+        return self._import_source(file_path, csv_format)
+
+    def import_csv_stream(
+        self, fileobj: BinaryIO | TextIO, csv_format: str = "generic"
+    ) -> tuple[list[TransactionInput], list[str]]:
+        """Import transactions from an open CSV file object, e.g. an upload's spooled file.
+
+        Reads from the current position, so callers rewind the stream first.
+
+        Returns:
+            Tuple of (successful_transactions, error_messages)
+        """
+        return self._import_source(fileobj, csv_format)
+
+    def _import_source(
+        self, source: Path | BinaryIO | TextIO, csv_format: str
+    ) -> tuple[list[TransactionInput], list[str]]:
+        """Read ``source`` with pandas and parse it in the requested format."""
         transactions = []
         errors = []
 
         try:
-            df = pd.read_csv(file_path)
+            df = pd.read_csv(source)
 
             if csv_format == "generic":
                 transactions, errors = self._parse_generic_format(df)
@@ -185,62 +204,93 @@ class CSVProcessor:
         raise ValueError(f"Could not parse date: {date_str}")
 
     def save_transactions(
-        self, transactions: list[TransactionInput], import_batch: str | None = None
+        self, transactions: list[TransactionInput], import_batch: str | None = None, commit: bool = True
     ) -> tuple[int, int]:
         """Save transactions to database with deduplication.
 
         Returns:
             Tuple of (new_count, duplicate_count)
         """
+        inserted_ids, duplicate_count = self.insert_new_transactions(transactions, import_batch, commit=commit)
+        return len(inserted_ids), duplicate_count
+
+    def insert_new_transactions(
+        self, transactions: list[TransactionInput], import_batch: str | None = None, commit: bool = True
+    ) -> tuple[list[str], int]:
+        """Save transactions with deduplication, reporting which ones were inserted.
+
+        Args:
+            transactions: Parsed transactions to store
+            import_batch: Batch tag recorded on every inserted row (generated if omitted)
+            commit: Commit when done; pass False to only flush and let the caller
+                group several calls into one commit
+
+        Returns:
+            Tuple of (inserted_ids, duplicate_count); ``inserted_ids`` excludes
+            transactions that were already stored.
+        """
         if not import_batch:
             import_batch = str(uuid.uuid4())
 
-        new_count = 0
+        inserted_ids: list[str] = []
+        rows: list[dict[str, Any]] = []
         duplicate_count = 0
+        imported_at = datetime.now(UTC)
 
-        for txn in transactions:
-            txn_id = txn.generate_id()
+        # Look up stored IDs and category names once per call instead of once per row
+        seen_ids = self._existing_transaction_ids([txn.transaction_id for txn in transactions])
+        category_ids = dict(self.session.query(CategoryORM.name, CategoryORM.id).all())
 
-            # Check for existing transaction
-            existing = self.session.query(TransactionORM).filter(TransactionORM.id == txn_id).first()
+        for txn in transactions:
+            txn_id = txn.transaction_id
 
-            if existing:
+            # Skip transactions already stored or repeated earlier in this batch
+            if txn_id in seen_ids:
                 duplicate_count += 1
                 continue
+            seen_ids.add(txn_id)
 
             # Determine if transaction is already reviewed (has category assigned)
             is_reviewed = bool(txn.category and txn.category.strip())
 
-            # Create new transaction
-            db_txn = TransactionORM(
-                id=txn_id,
-                date=txn.date,
-                value_date=txn.value_date,
-                name=txn.name,
-                purpose=txn.purpose,
-                amount=txn.amount,
-                currency=txn.currency,
-                imported_at=datetime.now(UTC),
-                import_batch=import_batch,
-                is_reviewed=is_reviewed,
+            rows.append(
+                {
+                    "id": txn_id,
+                    "date": txn.date,
+                    "value_date": txn.value_date,
+                    "name": txn.name,
+                    "purpose": txn.purpose,
+                    "amount": txn.amount,
+                    "currency": txn.currency,
+                    # Match an existing category if provided (categories are stored normalized)
+                    "category_id": category_ids.get(txn.category.strip().lower()) if txn.category else None,
+                    "imported_at": imported_at,
+                    "import_batch": import_batch,
+                    "is_reviewed": is_reviewed,
+                }
             )
-
-            # Try to match existing category if provided
-            if txn.category:
-                # Normalize category name to match database storage
-                normalized_category = txn.category.strip().lower()
-
-                # Find matching category (categories are stored normalized)
-                category = self.session.query(CategoryORM).filter(CategoryORM.name == normalized_category).first()
-
-                if category:
-                    db_txn.category_id = category.id
-
-            self.session.add(db_txn)
-            new_count += 1
-
-        self.session.commit()
-        return new_count, duplicate_count
+            inserted_ids.append(txn_id)
+
+        # One executemany INSERT instead of tracking every row as an ORM object
+        if rows:
+            self.session.execute(insert(TransactionORM), rows)
+
+        if commit:
+            self.session.commit()
+        else:
+            self.session.flush()
+        return inserted_ids, duplicate_count
+
+    def _existing_transaction_ids(self, transaction_ids: list[str]) -> set[str]:
+        """Return which of ``transaction_ids`` are already stored (including flushed rows)."""
+        unique_ids = list(dict.fromkeys(transaction_ids))
+        existing: set[str] = set()
+        for start in range(0, len(unique_ids), ID_CHUNK_SIZE):
+            chunk = unique_ids[start : start + ID_CHUNK_SIZE]
+            existing.update(
+                txn_id for (txn_id,) in self.session.query(TransactionORM.id).filter(TransactionORM.id.in_(chunk))
+            )
+        return existing
 
     def export_transactions(
         self,
@@ -2,10 +2,12 @@
 
 import json
 import pickle
+from collections import Counter
 from datetime import date
 from pathlib import Path
 from typing import Any, cast
 
+import joblib
 import numpy as np
 import pandas as pd
 from lightgbm import LGBMClassifier
@@ -24,6 +26,17 @@ from ..core.models import ModelMetrics, TransactionInput, TransactionPrediction
 from .feature_extractor import FeatureExtractor
 from .merchant_mapper import MerchantMapper
 
+TRAINING_COLUMNS = (
+    TransactionORM.date,
+    TransactionORM.value_date,
+    TransactionORM.name,
+    TransactionORM.purpose,
+    TransactionORM.amount,
+    TransactionORM.currency,
+    TransactionORM.category_id,
+)
+"""Columns read for labeled training rows; plain tuples instead of tracked ORM instances."""
+
 
 class TransactionCategorizer:
     """Main ML model for transaction categorization."""
@@ -51,8 +64,7 @@ class TransactionCategorizer:
     def prepare_training_data(self) -> tuple[pd.DataFrame, np.ndarray]:
         """Prepare training data from database transactions."""
         # Get transactions with confirmed categories
-        query = self.session.query(TransactionORM).filter(TransactionORM.category_id.isnot(None))
-
+        query = self.session.query(*TRAINING_COLUMNS).filter(TransactionORM.category_id.isnot(None))
         transactions = query.all()
 
         if len(transactions) < self.config.min_training_samples:
@@ -67,9 +79,7 @@ class TransactionCategorizer:
         min_samples_per_category = 7
 
         # Count transactions per category
-        category_counts = {}
-        for txn in transactions:
-            category_counts[txn.category_id] = category_counts.get(txn.category_id, 0) + 1
+        category_counts = Counter(txn.category_id for txn in transactions)
 
         # Filter categories with enough samples
         valid_categories = {cat_id for cat_id, count in category_counts.items() if count >= min_samples_per_category}
@@ -83,11 +93,12 @@ class TransactionCategorizer:
         # Log filtering results
         excluded_categories = set(category_counts.keys()) - valid_categories
         if excluded_categories:
-            excluded_names = []
-            for cat_id in excluded_categories:
-                category = self.session.query(CategoryORM).filter(CategoryORM.id == cat_id).first()
-                if category:
-                    excluded_names.append(f"{category.name} ({category_counts[cat_id]} samples)")
+            excluded_rows = (
+                self.session.query(CategoryORM.id, CategoryORM.name)
+                .filter(CategoryORM.id.in_(excluded_categories))
+                .all()
+            )
+            excluded_names = [f"{name} ({category_counts[cat_id]} samples)" for cat_id, name in excluded_rows]
             print(f"⚠️  Excluding categories with <{min_samples_per_category} samples: {', '.join(excluded_names)}")
 
         print(f"📊 Training with {len(filtered_transactions)} transactions across {len(valid_categories)} categories")
@@ -172,10 +183,22 @@ class TransactionCategorizer:
 
         return metrics
 
-    def fit(self, transactions: list[TransactionInput], labels: np.ndarray) -> None:
-        """Train the model on pre-split data without DB access."""
-        features_list = self.feature_extractor.extract_batch_features(transactions)
-        X_df = pd.DataFrame(features_list)
+    def extract_feature_frame(self, transactions: list[TransactionInput]) -> pd.DataFrame:
+        """Extract raw (label-independent) features for ``transactions``, one row each."""
+        return pd.DataFrame(self.feature_extractor.extract_batch_features(transactions))
+
+    def fit(
+        self, transactions: list[TransactionInput], labels: np.ndarray, features: pd.DataFrame | None = None
+    ) -> None:
+        """Train the model on pre-split data without DB access.
+
+        Args:
+            transactions: Training transactions.
+            labels: Category IDs aligned with ``transactions``.
+            features: Optional ``extract_feature_frame`` output for ``transactions``,
+                reused instead of extracting the same features again.
+        """
+        X_df = features if features is not None else self.extract_feature_frame(transactions)
 
         y_encoded = self.label_encoder.fit_transform(labels)
         self.classes_ = self.label_encoder.classes_
@@ -253,7 +276,7 @@ class TransactionCategorizer:
             merchant_match = self.merchant_mapper.get_category(txn.name)
             if merchant_match and merchant_match.confidence >= 0.95:
                 predictions[i] = TransactionPrediction(
-                    transaction_id=txn.generate_id(),
+                    transaction_id=txn.transaction_id,
                     predicted_category_id=merchant_match.category_id,
                     confidence_score=merchant_match.confidence,
                     feature_contributions={"merchant_rule": 1.0},
@@ -276,32 +299,35 @@ class TransactionCategorizer:
             except ValueError:
                 probas = self.classifier.predict_proba(X_prepared)
 
+            # Winning class and its probability for the whole batch in one pass each
+            pred_indices = probas.argmax(axis=1)
+            confidences = probas[np.arange(len(pred_indices)), pred_indices].tolist()
+            predicted_category_ids = self.classes_[pred_indices].tolist()
+
             for j, idx in enumerate(ml_indices):
-                proba = probas[j]
-                pred_idx = np.argmax(proba)
-                confidence = float(proba[pred_idx])
-                predicted_category_id = int(self.classes_[pred_idx])
-                feature_contributions = self._get_feature_contributions(X_prepared[j], int(pred_idx))
+                feature_contributions = self._get_feature_contributions(X_prepared[j], int(pred_indices[j]))
 
                 predictions[idx] = TransactionPrediction(
-                    transaction_id=ml_transactions[j].generate_id(),
-                    predicted_category_id=predicted_category_id,
-                    confidence_score=confidence,
+                    transaction_id=ml_transactions[j].transaction_id,
+                    predicted_category_id=int(predicted_category_ids[j]),
+                    confidence_score=confidences[j],
                     feature_contributions=feature_contributions,
                 )
 
         return [p for p in predictions if p is not None]
 
-    def predict_proba(self, transactions: list[TransactionInput]) -> np.ndarray:
+    def predict_proba(self, transactions: list[TransactionInput], features: pd.DataFrame | None = None) -> np.ndarray:
         """Get full calibrated probability vectors, bypassing merchant mapper.
 
+        ``features`` may carry precomputed ``extract_feature_frame`` output for
+        ``transactions``.
+
         Returns:
             Array of shape (n_transactions, n_classes) with calibrated probabilities.
         """
         if not self.is_trained:
             raise ValueError("Model must be trained before prediction")
-        features_list = self.feature_extractor.extract_batch_features(transactions)
-        X_df = pd.DataFrame(features_list)
+        X_df = features if features is not None else self.extract_feature_frame(transactions)
         X_prepared = self._prepare_features(X_df, fit=False)
         if self.calibrated_classifier is not None:
             return self.calibrated_classifier.predict_proba(X_prepared)
@@ -424,38 +450,40 @@ class TransactionCategorizer:
             "config": self.config.model_dump(),
         }
 
-        with open(model_path, "wb") as f:
-            pickle.dump(model_data, f)
+        # joblib writes numpy arrays as raw buffers instead of pickling copies of them
+        joblib.dump(model_data, model_path, protocol=pickle.HIGHEST_PROTOCOL)
 
-    def load_model(self, model_path: Path) -> None:
-        """Load trained model from disk."""
-        with open(model_path, "rb") as f:
-            try:
-                model_data = pickle.load(f)
-            except ModuleNotFoundError as e:
-                # Handle legacy pickle files with different module paths
-                if "fafycat" in str(e):
-                    # Create a custom unpickler that can handle the old module path
-                    import pickle as _pickle
-
-                    # Temporarily add the module mapping for old pickle files
-                    class LegacyUnpickler(_pickle.Unpickler):
-                        def find_class(self, module, name):
-                            # Map old module paths to new ones
-                            if module.startswith("fafycat."):
-                                # Remove the old 'fafycat.' prefix and use the current structure
-                                new_module = module.replace("fafycat.", "src.fafycat.")
-                                return super().find_class(new_module, name)
-                            if module == "fafycat":
-                                # Handle direct fafycat imports
-                                return super().find_class("src.fafycat", name)
-                            return super().find_class(module, name)
-
-                    f.seek(0)  # Reset file pointer
-                    unpickler = LegacyUnpickler(f)
-                    model_data = unpickler.load()
-                else:
-                    raise
+    def load_model(self, model_path: Path, mmap_mode: str | None = None) -> None:
+        """Load trained model from disk.
+
+        Args:
+            model_path: File written by ``save_model``
+            mmap_mode: Passed to ``joblib.load``; ``"r"`` memory-maps the model's numpy
+                arrays read-only so several worker processes share one page-cached copy
+        """
+        try:
+            # Also reads the plain pickle files written by earlier versions
+            model_data = joblib.load(model_path, mmap_mode=mmap_mode)
+        except ModuleNotFoundError as e:
+            # Handle legacy pickle files with different module paths
+            if "fafycat" not in str(e):
+                raise
+
+            # Temporarily add the module mapping for old pickle files
+            class LegacyUnpickler(pickle.Unpickler):
+                def find_class(self, module, name):
+                    # Map old module paths to new ones
+                    if module.startswith("fafycat."):
+                        # Remove the old 'fafycat.' prefix and use the current structure
+                        new_module = module.replace("fafycat.", "src.fafycat.")
+                        return super().find_class(new_module, name)
+                    if module == "fafycat":
+                        # Handle direct fafycat imports
+                        return super().find_class("src.fafycat", name)
+                    return super().find_class(module, name)
+
+            with open(model_path, "rb") as f:
+                model_data = LegacyUnpickler(f).load()
 
         self.classifier = model_data["classifier"]
         self.calibrated_classifier = model_data["calibrated_classifier"]
@@ -3,12 +3,32 @@
 from typing import Any
 
 import numpy as np
-from sklearn.metrics import accuracy_score, confusion_matrix, precision_recall_fscore_support
+from sklearn.metrics import accuracy_score, confusion_matrix
 from sklearn.model_selection import StratifiedKFold
 
 from ..core.models import TransactionInput
 
 
+def weighted_ensemble_argmax(lgbm_probas: np.ndarray, nb_probas: np.ndarray, weight_grid: np.ndarray) -> np.ndarray:
+    """Predict class indices for several ensemble weightings in one broadcast.
+
+    Args:
+        lgbm_probas: LightGBM probabilities, shape (n_samples, n_classes)
+        nb_probas: Naive Bayes probabilities in the same class order
+        weight_grid: One ``(lgbm_weight, nb_weight)`` row per candidate
+
+    Returns:
+        Argmax class indices, shape (n_candidates, n_samples)
+    """
+    # Only the argmax is kept, so the (candidates, samples, classes) intermediate is
+    # built in float32 to halve its memory and bandwidth.
+    weights = weight_grid.astype(np.float32, copy=False)
+    lgbm = lgbm_probas.astype(np.float32, copy=False)
+    nb = nb_probas.astype(np.float32, copy=False)
+    ensemble_probas = weights[:, 0, None, None] * lgbm + weights[:, 1, None, None] * nb
+    return ensemble_probas.argmax(axis=2)
+
+
 class StratifiedKFoldValidator:
     """K-fold cross-validation for transaction categorization models."""
 
@@ -47,8 +67,9 @@ class StratifiedKFoldValidator:
             model_params = {}
 
         fold_scores = []
-        fold_predictions = []
-        fold_true_labels = []
+        # Each sample is validated in exactly one fold, so out-of-fold predictions
+        # fill one preallocated array aligned with ``labels``.
+        oof_predictions = np.empty(len(labels), dtype=labels.dtype)
         all_feature_importance = []
 
         # Convert to arrays for indexing
@@ -75,24 +96,28 @@ class StratifiedKFoldValidator:
             fold_scores.append(fold_accuracy)
 
             # Store predictions for overall metrics
-            fold_predictions.extend(val_predictions)
-            fold_true_labels.extend(val_labels)
+            oof_predictions[val_idx] = val_predictions
 
             # Get feature importance if available
             if hasattr(model, "get_feature_importance"):
                 importance = model.get_feature_importance()
                 all_feature_importance.append(importance)
 
-        # Calculate overall metrics
-        overall_accuracy = accuracy_score(fold_true_labels, fold_predictions)
-        precision, recall, _, support = precision_recall_fscore_support(
-            fold_true_labels, fold_predictions, average=None, zero_division=0
+        # Overall and per-class metrics all derive from one confusion matrix pass
+        unique_labels = np.unique(labels)
+        matrix = confusion_matrix(labels, oof_predictions, labels=unique_labels)
+        true_positives = np.diag(matrix)
+        predicted_counts = matrix.sum(axis=0)
+        actual_counts = matrix.sum(axis=1)
+
+        overall_accuracy = true_positives.sum() / matrix.sum()
+        precision = np.divide(
+            true_positives, predicted_counts, out=np.zeros(len(unique_labels)), where=predicted_counts > 0
         )
+        recall = np.divide(true_positives, actual_counts, out=np.zeros(len(unique_labels)), where=actual_counts > 0)
 
-        # Get unique labels for per-class metrics
-        unique_labels = np.unique(labels)
-        precision_per_class = {str(label): float(prec) for label, prec in zip(unique_labels, precision, strict=False)}
-        recall_per_class = {str(label): float(rec) for label, rec in zip(unique_labels, recall, strict=False)}
+        precision_per_class = {str(label): float(prec) for label, prec in zip(unique_labels, precision, strict=True)}
+        recall_per_class = {str(label): float(rec) for label, rec in zip(unique_labels, recall, strict=True)}
 
         return {
             "cv_accuracy_mean": float(np.mean(fold_scores)),
@@ -101,7 +126,7 @@ class StratifiedKFoldValidator:
             "overall_accuracy": float(overall_accuracy),
             "precision_per_class": precision_per_class,
             "recall_per_class": recall_per_class,
-            "confusion_matrix": confusion_matrix(fold_true_labels, fold_predictions).tolist(),
+            "confusion_matrix": matrix.tolist(),
             "feature_importance": all_feature_importance[0] if all_feature_importance else {},
         }
 
@@ -139,50 +164,53 @@ class StratifiedKFoldValidator:
         all_weight_scores = []
 
         print(f"Testing {len(weight_candidates)} weight combinations...")
+        if not weight_candidates:
+            return best_weights, best_score, all_weight_scores
 
-        for _weight_idx, weights in enumerate(weight_candidates):
-            print(f"  Testing weights: LightGBM={weights['lgbm']:.1f}, NB={weights['nb']:.1f}")
-
-            fold_scores = []
-            transactions_array = np.array(transactions)
+        # Both models are fit once per fold; every weight candidate is then scored
+        # against the same probabilities instead of retraining per candidate.
+        weight_grid = np.array([[weights["lgbm"], weights["nb"]] for weights in weight_candidates])
+        fold_scores = np.zeros((len(weight_candidates), self.n_splits))
+        transactions_array = np.array(transactions)
 
-            for _fold_idx, (train_idx, val_idx) in enumerate(self.skf.split(transactions, labels)):
-                # Split data
-                train_transactions = transactions_array[train_idx].tolist()
-                val_transactions = transactions_array[val_idx].tolist()
-                train_labels = labels[train_idx]
-                val_labels = labels[val_idx]
+        for fold_idx, (train_idx, val_idx) in enumerate(self.skf.split(transactions, labels)):
+            print(f"  Fold {fold_idx + 1}/{self.n_splits}")
 
-                # Train both models
-                lgbm_model = lgbm_model_class(**lgbm_params)
-                nb_model = nb_model_class(**nb_params)
+            # Split data
+            train_transactions = transactions_array[train_idx].tolist()
+            val_transactions = transactions_array[val_idx].tolist()
+            train_labels = labels[train_idx]
+            val_labels = labels[val_idx]
 
-                lgbm_model.fit(train_transactions, train_labels)
-                nb_model.fit(train_transactions, train_labels)
+            # Train both models
+            lgbm_model = lgbm_model_class(**lgbm_params)
+            nb_model = nb_model_class(**nb_params)
 
-                # Get predictions from both models
-                lgbm_probas = lgbm_model.predict_proba(val_transactions)
-                nb_probas = nb_model.predict_proba(val_transactions)
+            lgbm_model.fit(train_transactions, train_labels)
+            nb_model.fit(train_transactions, train_labels)
 
-                # Combine predictions with current weights
-                ensemble_probas = weights["lgbm"] * lgbm_probas + weights["nb"] * nb_probas
+            # Get predictions from both models
+            lgbm_probas = lgbm_model.predict_proba(val_transactions)
+            nb_probas = nb_model.predict_proba(val_transactions)
 
-                # Get ensemble predictions
-                ensemble_predictions = np.argmax(ensemble_probas, axis=1)
+            # Ensemble predictions for every candidate at once, shape (n_candidates, n_samples)
+            ensemble_predictions = weighted_ensemble_argmax(lgbm_probas, nb_probas, weight_grid)
 
-                # Convert back to original label space
-                if hasattr(lgbm_model, "label_encoder"):
-                    ensemble_predictions = lgbm_model.label_encoder.inverse_transform(ensemble_predictions)
+            # Convert back to original label space
+            if hasattr(lgbm_model, "label_encoder"):
+                ensemble_predictions = lgbm_model.label_encoder.inverse_transform(ensemble_predictions.ravel()).reshape(
+                    ensemble_predictions.shape
+                )
 
-                # Calculate accuracy
-                fold_accuracy = accuracy_score(val_labels, ensemble_predictions)
-                fold_scores.append(fold_accuracy)
+            # Accuracy per candidate
+            fold_scores[:, fold_idx] = (ensemble_predictions == val_labels).mean(axis=1)
 
-            # Calculate mean score for this weight combination
-            mean_score = np.mean(fold_scores)
+        for weights, scores in zip(weight_candidates, fold_scores, strict=True):
+            mean_score = np.mean(scores)
             all_weight_scores.append(mean_score)
 
-            print(f"    Mean CV accuracy: {mean_score:.4f} ± {np.std(fold_scores):.4f}")
+            print(f"  Weights LightGBM={weights['lgbm']:.1f}, NB={weights['nb']:.1f}")
+            print(f"    Mean CV accuracy: {mean_score:.4f} ± {np.std(scores):.4f}")
 
             # Update best weights if this is better
             if mean_score > best_score:
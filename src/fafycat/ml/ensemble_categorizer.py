@@ -2,19 +2,23 @@
 
 import json
 import pickle
+from collections import Counter
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 from typing import Any, cast
 
+import joblib
 import numpy as np
+import pandas as pd
 from sqlalchemy.orm import Session
 
 from ..core.config import MLConfig
 from ..core.database import CategoryORM, ModelMetadataORM, TransactionORM
 from ..core.models import TransactionInput, TransactionPrediction
-from .categorizer import TransactionCategorizer
-from .cross_validation import StratifiedKFoldValidator
+from .categorizer import TRAINING_COLUMNS, TransactionCategorizer
+from .cross_validation import StratifiedKFoldValidator, weighted_ensemble_argmax
 from .naive_bayes_classifier import NaiveBayesTextClassifier
 
 
@@ -45,7 +49,7 @@ class EnsembleCategorizer:
     def prepare_training_data(self) -> tuple[list[TransactionInput], np.ndarray]:
         """Prepare training data from database transactions."""
         # Get transactions with confirmed categories (same as TransactionCategorizer)
-        query = self.session.query(TransactionORM).filter(TransactionORM.category_id.isnot(None))
+        query = self.session.query(*TRAINING_COLUMNS).filter(TransactionORM.category_id.isnot(None))
         transactions = query.all()
 
         if len(transactions) < self.config.min_training_samples:
@@ -57,10 +61,7 @@ class EnsembleCategorizer:
         min_samples_per_category = max(5, self.cv_validator.n_splits)  # Need at least 5 (or n_splits) for CV
 
         # Count transactions per category
-        category_counts: dict[int, int] = {}
-        for txn in transactions:
-            cat_id = cast(int, txn.category_id)
-            category_counts[cat_id] = category_counts.get(cat_id, 0) + 1
+        category_counts = Counter(txn.category_id for txn in transactions)
 
         # Filter categories with enough samples
         valid_categories = {cat_id for cat_id, count in category_counts.items() if count >= min_samples_per_category}
@@ -74,11 +75,12 @@ class EnsembleCategorizer:
         # Log filtering results
         excluded_categories = set(category_counts.keys()) - valid_categories
         if excluded_categories:
-            excluded_names = []
-            for cat_id in excluded_categories:
-                category = self.session.query(CategoryORM).filter(CategoryORM.id == cat_id).first()
-                if category:
-                    excluded_names.append(f"{category.name} ({category_counts[cat_id]} samples)")
+            excluded_rows = (
+                self.session.query(CategoryORM.id, CategoryORM.name)
+                .filter(CategoryORM.id.in_(excluded_categories))
+                .all()
+            )
+            excluded_names = [f"{name} ({category_counts[cat_id]} samples)" for cat_id, name in excluded_rows]
             print(f"⚠️  Excluding categories with <{min_samples_per_category} samples: {', '.join(excluded_names)}")
 
         print(
@@ -121,34 +123,33 @@ class EnsembleCategorizer:
         # Split into train/validation for weight optimization
         from sklearn.model_selection import train_test_split
 
-        train_transactions, val_transactions, train_labels, val_labels = train_test_split(
-            transactions, labels, test_size=0.2, stratify=labels, random_state=42
+        # Features do not depend on labels: extract them once and slice per split
+        # instead of re-extracting for the train, validation and final fits.
+        features = self.lgbm_component.extract_feature_frame(transactions)
+        train_idx, val_idx = train_test_split(
+            np.arange(len(transactions)), test_size=0.2, stratify=labels, random_state=42
         )
+        train_transactions = [transactions[i] for i in train_idx]
+        val_transactions = [transactions[i] for i in val_idx]
+        train_labels, val_labels = labels[train_idx], labels[val_idx]
 
         print("🚀 Training individual models...")
-
-        # Train LightGBM component
-        print("  Training LightGBM...")
         lgbm_temp = TransactionCategorizer(self.session, self.config)
-        lgbm_temp.fit(train_transactions, train_labels)
-
-        # Train Naive Bayes component
-        if progress_callback:
-            progress_callback("training_nb")
-        print("  Training Naive Bayes...")
         nb_temp = NaiveBayesTextClassifier(
             alpha=getattr(self.config, "nb_alpha", 1.0),
             use_complement=getattr(self.config, "nb_use_complement", True),
             max_features=getattr(self.config, "nb_max_features", 2000),
         )
-        nb_temp.fit(train_transactions, train_labels)
+        self._fit_components(
+            lgbm_temp, nb_temp, train_transactions, train_labels, features.iloc[train_idx], progress_callback
+        )
 
         if progress_callback:
             progress_callback("optimizing_weights")
         print("🔄 Optimizing ensemble weights on validation set...")
 
         # Get probability vectors on validation set
-        lgbm_val_probas_raw = lgbm_temp.predict_proba(val_transactions)
+        lgbm_val_probas_raw = lgbm_temp.predict_proba(val_transactions, features=features.iloc[val_idx])
         nb_val_probas = nb_temp.predict_proba(val_transactions)
 
         # Align LightGBM probabilities to NB class order
@@ -161,16 +162,15 @@ class EnsembleCategorizer:
         best_weights = {"lgbm": 0.7, "nb": 0.3}
         best_score = 0.0
 
-        for weights in weight_candidates:
-            # Combine predictions
-            ensemble_probas = weights["lgbm"] * lgbm_val_probas + weights["nb"] * nb_val_probas
-            ensemble_predictions = nb_temp.label_encoder.inverse_transform(np.argmax(ensemble_probas, axis=1))
-
-            # Calculate accuracy
-            from sklearn.metrics import accuracy_score
-
-            score = accuracy_score(val_labels, ensemble_predictions)
+        # Score every candidate from one broadcast over the validation probabilities
+        weight_grid = np.array([[weights["lgbm"], weights["nb"]] for weights in weight_candidates])
+        candidate_predictions = weighted_ensemble_argmax(lgbm_val_probas, nb_val_probas, weight_grid)
+        candidate_labels = nb_temp.label_encoder.inverse_transform(candidate_predictions.ravel()).reshape(
+            candidate_predictions.shape
+        )
+        candidate_scores = (candidate_labels == val_labels).mean(axis=1)
 
+        for weights, score in zip(weight_candidates, candidate_scores, strict=True):
             print(f"  Weights LightGBM={weights['lgbm']:.1f}, NB={weights['nb']:.1f}: {score:.4f}")
 
             if score > best_score:
@@ -187,8 +187,7 @@ class EnsembleCategorizer:
 
         # Train final models on full dataset
         print("🚀 Training final models on full dataset...")
-        self.lgbm_component.fit(transactions, labels)
-        self.nb_component.fit(transactions, labels)
+        self._fit_components(self.lgbm_component, self.nb_component, transactions, labels, features)
 
         # Save results
         self.cv_results = {
@@ -212,6 +211,38 @@ class EnsembleCategorizer:
 
         return self.cv_results
 
+    def _fit_components(
+        self,
+        lgbm: TransactionCategorizer,
+        nb: NaiveBayesTextClassifier,
+        transactions: list[TransactionInput],
+        labels: np.ndarray,
+        features: pd.DataFrame,
+        progress_callback: Callable[[str], None] | None = None,
+    ) -> None:
+        """Fit the LightGBM and Naive Bayes components on the same data.
+
+        With ``ensemble_concurrent_fit``, Naive Bayes fits in a worker thread while
+        LightGBM (which releases the GIL) fits in this one; the LightGBM model
+        keeps the DB session on the calling thread.
+        """
+        if not getattr(self.config, "ensemble_concurrent_fit", True):
+            print("  Training LightGBM...")
+            lgbm.fit(transactions, labels, features=features)
+            if progress_callback:
+                progress_callback("training_nb")
+            print("  Training Naive Bayes...")
+            nb.fit(transactions, labels)
+            return
+
+        print("  Training LightGBM and Naive Bayes concurrently...")
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="nb_fit") as executor:
+            nb_fit = executor.submit(nb.fit, transactions, labels)
+            lgbm.fit(transactions, labels, features=features)
+            if progress_callback:
+                progress_callback("training_nb")
+            nb_fit.result()
+
     def _align_probas(
         self, probas: np.ndarray, source_classes: np.ndarray | None, target_classes: np.ndarray
     ) -> np.ndarray:
@@ -229,19 +260,19 @@ class EnsembleCategorizer:
         if source_classes is None:
             return np.ones((probas.shape[0], len(target_classes))) / len(target_classes)
 
-        n_samples = probas.shape[0]
-        n_target = len(target_classes)
-        aligned = np.zeros((n_samples, n_target))
+        # One gather with a precomputed column map instead of a per-class list.index scan
+        source_positions = {cls: idx for idx, cls in enumerate(source_classes)}
+        columns = np.fromiter(
+            (source_positions.get(cls, -1) for cls in target_classes), dtype=np.intp, count=len(target_classes)
+        )
+        present = columns >= 0
 
-        source_class_list = list(source_classes)
-        for i, cls in enumerate(target_classes):
-            if cls in source_class_list:
-                src_idx = source_class_list.index(cls)
-                aligned[:, i] = probas[:, src_idx]
+        aligned = np.zeros((probas.shape[0], len(target_classes)))
+        aligned[:, present] = probas[:, columns[present]]
 
         row_sums = aligned.sum(axis=1, keepdims=True)
         row_sums[row_sums == 0] = 1  # avoid division by zero
-        aligned = aligned / row_sums
+        aligned /= row_sums
         return aligned
 
     def _align_single_proba(
@@ -281,7 +312,7 @@ class EnsembleCategorizer:
             merchant_match = self.lgbm_component.merchant_mapper.get_category(txn.name)
             if merchant_match and merchant_match.confidence >= 0.95:
                 predictions[i] = TransactionPrediction(
-                    transaction_id=txn.generate_id(),
+                    transaction_id=txn.transaction_id,
                     predicted_category_id=merchant_match.category_id,
                     confidence_score=merchant_match.confidence,
                     feature_contributions={"merchant_rule": 1.0},
@@ -306,25 +337,19 @@ class EnsembleCategorizer:
                 self.ensemble_weights["lgbm"] * lgbm_probas_aligned + self.ensemble_weights["nb"] * nb_probas_all
             )
 
-            for j, idx in enumerate(ml_indices):
-                combined_probas = combined_probas_all[j]
-                pred_idx = np.argmax(combined_probas)
-                confidence = float(combined_probas[pred_idx])
-
-                # Map back to category ID
-                if hasattr(self.nb_component, "classes_") and self.nb_component.classes_ is not None:
-                    predicted_category_id = int(self.nb_component.classes_[pred_idx])
-                elif self.lgbm_component.classes_ is not None:
-                    predicted_category_id = int(self.lgbm_component.classes_[np.argmax(lgbm_probas_all[j])])
-                else:
-                    raise ValueError("No classes_ available — was the model trained?")
+            # Winning class and its probability for the whole batch in one pass each;
+            # combined columns follow the NB class order (asserted above)
+            pred_indices = combined_probas_all.argmax(axis=1)
+            confidences = combined_probas_all[np.arange(len(pred_indices)), pred_indices].tolist()
+            predicted_category_ids = nb_classes[pred_indices].tolist()
 
+            for j, idx in enumerate(ml_indices):
                 feature_contributions = self._combine_feature_contributions(lgbm_probas_aligned[j], nb_probas_all[j])
 
                 predictions[idx] = TransactionPrediction(
-                    transaction_id=ml_transactions[j].generate_id(),
-                    predicted_category_id=predicted_category_id,
-                    confidence_score=confidence,
+                    transaction_id=ml_transactions[j].transaction_id,
+                    predicted_category_id=int(predicted_category_ids[j]),
+                    confidence_score=confidences[j],
                     feature_contributions=feature_contributions,
                 )
 
@@ -413,38 +438,40 @@ class EnsembleCategorizer:
             "config": self.config.model_dump(),
         }
 
-        with open(model_path, "wb") as f:
-            pickle.dump(ensemble_data, f)
-
-    def load_model(self, model_path: Path) -> None:
-        """Load trained ensemble model from disk."""
-        with open(model_path, "rb") as f:
-            try:
-                ensemble_data = pickle.load(f)
-            except ModuleNotFoundError as e:
-                # Handle legacy pickle files with different module paths
-                if "fafycat" in str(e):
-                    # Create a custom unpickler that can handle the old module path
-                    import pickle as _pickle
-
-                    # Temporarily add the module mapping for old pickle files
-                    class LegacyUnpickler(_pickle.Unpickler):
-                        def find_class(self, module, name) -> Any:
-                            # Map old module paths to new ones
-                            if module.startswith("fafycat."):
-                                # Remove the old 'fafycat.' prefix and use the current structure
-                                new_module = module.replace("fafycat.", "src.fafycat.")
-                                return super().find_class(new_module, name)
-                            if module == "fafycat":
-                                # Handle direct fafycat imports
-                                return super().find_class("src.fafycat", name)
-                            return super().find_class(module, name)
-
-                    f.seek(0)  # Reset file pointer
-                    unpickler = LegacyUnpickler(f)
-                    ensemble_data = unpickler.load()
-                else:
-                    raise
+        # joblib writes numpy arrays as raw buffers instead of pickling copies of them
+        joblib.dump(ensemble_data, model_path, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load_model(self, model_path: Path, mmap_mode: str | None = None) -> None:
+        """Load trained ensemble model from disk.
+
+        Args:
+            model_path: File written by ``save_model``
+            mmap_mode: Passed to ``joblib.load``; ``"r"`` memory-maps the model's numpy
+                arrays read-only so several worker processes share one page-cached copy
+        """
+        try:
+            # Also reads the plain pickle files written by earlier versions
+            ensemble_data = joblib.load(model_path, mmap_mode=mmap_mode)
+        except ModuleNotFoundError as e:
+            # Handle legacy pickle files with different module paths
+            if "fafycat" not in str(e):
+                raise
+
+            # Temporarily add the module mapping for old pickle files
+            class LegacyUnpickler(pickle.Unpickler):
+                def find_class(self, module, name) -> Any:
+                    # Map old module paths to new ones
+                    if module.startswith("fafycat."):
+                        # Remove the old 'fafycat.' prefix and use the current structure
+                        new_module = module.replace("fafycat.", "src.fafycat.")
+                        return super().find_class(new_module, name)
+                    if module == "fafycat":
+                        # Handle direct fafycat imports
+                        return super().find_class("src.fafycat", name)
+                    return super().find_class(module, name)
+
+            with open(model_path, "rb") as f:
+                ensemble_data = LegacyUnpickler(f).load()
 
         # Recreate lgbm_component from saved data
         if "lgbm_model_data" in ensemble_data:
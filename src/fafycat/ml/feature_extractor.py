@@ -1,10 +1,9 @@
 """Feature extraction for transaction categorization."""
 
+import math
 import re
 from typing import Any
 
-import numpy as np
-
 from ..core.models import TransactionInput
 from .sepa_parser import SepaFieldParser
 
@@ -12,9 +11,10 @@ from .sepa_parser import SepaFieldParser
 class MerchantCleaner:
     """Clean and normalize merchant names."""
 
-    def __init__(self):
-        self.sepa_parser = SepaFieldParser()
-        self.patterns = [
+    # Compiled once at class level and shared by every instance (and every CV fold)
+    _NOISE_PATTERNS = tuple(
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
             r"\d{4}\.\d{2}\.\d{2}.*",  # Dates
             r"//.*",  # Location info after //
             r"\b(DE|Berlin|München|Hamburg|Köln|Frankfurt|Stuttgart)\b.*",  # Cities/countries
@@ -22,7 +22,12 @@ class MerchantCleaner:
             r"\bNR\.\d+.*",  # Reference numbers
             r"\d{2}:\d{2}:\d{2}.*",  # Times
             r"\*+.*",  # Everything after asterisks
-        ]
+        )
+    )
+    _WHITESPACE = re.compile(r"\s+")
+
+    def __init__(self, sepa_parser: SepaFieldParser | None = None):
+        self.sepa_parser = sepa_parser or SepaFieldParser()
 
     def clean(self, merchant_name: str) -> str:
         """Clean and normalize merchant name."""
@@ -33,11 +38,11 @@ class MerchantCleaner:
         cleaned = self.sepa_parser.strip_noise(cleaned)
 
         # Remove patterns
-        for pattern in self.patterns:
-            cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+        for pattern in self._NOISE_PATTERNS:
+            cleaned = pattern.sub("", cleaned)
 
         # Normalize whitespace and case
-        cleaned = re.sub(r"\s+", " ", cleaned)
+        cleaned = self._WHITESPACE.sub(" ", cleaned)
         cleaned = cleaned.strip().upper()
 
         # Remove common prefixes/suffixes
@@ -52,8 +57,11 @@ class MerchantCleaner:
 class TextPreprocessor:
     """Process text fields for NLP features."""
 
-    def __init__(self):
-        self.sepa_parser = SepaFieldParser()
+    _NON_WORD = re.compile(r"[^\w\s]")
+    _WHITESPACE = re.compile(r"\s+")
+
+    def __init__(self, sepa_parser: SepaFieldParser | None = None):
+        self.sepa_parser = sepa_parser or SepaFieldParser()
         self.stopwords = {
             "und",
             "oder",
@@ -86,10 +94,10 @@ class TextPreprocessor:
         text = text.lower()
 
         # Remove special characters but keep spaces
-        text = re.sub(r"[^\w\s]", " ", text)
+        text = self._NON_WORD.sub(" ", text)
 
         # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text)
+        text = self._WHITESPACE.sub(" ", text)
 
         # Remove stopwords
         words = text.split()
@@ -102,27 +110,33 @@ class FeatureExtractor:
     """Extract features from transactions for ML model."""
 
     def __init__(self):
-        self.merchant_cleaner = MerchantCleaner()
-        self.text_preprocessor = TextPreprocessor()
+        # The SEPA parser is stateless; one instance serves all three components
         self.sepa_parser = SepaFieldParser()
+        self.merchant_cleaner = MerchantCleaner(self.sepa_parser)
+        self.text_preprocessor = TextPreprocessor(self.sepa_parser)
 
     def extract_features(self, transaction: TransactionInput) -> dict[str, Any]:
         """Extract all features for ML model."""
         clean_merchant = self.merchant_cleaner.clean(transaction.name)
+        # Computed once per row; each is reused by several features below
+        merchant_lower = clean_merchant.lower()
+        purpose_lower = transaction.purpose.lower()
+        amount_abs = abs(transaction.amount)
+        weekday = transaction.date.weekday()
 
         features = {
             # Numerical features
             "amount": transaction.amount,
-            "amount_abs": abs(transaction.amount),
-            "amount_log": np.log1p(abs(transaction.amount)),
+            "amount_abs": amount_abs,
+            "amount_log": math.log1p(amount_abs),
             "is_income": int(transaction.amount > 0),
-            "is_round_amount": int(abs(transaction.amount) % 10 == 0),
-            "amount_magnitude": self._get_amount_magnitude(abs(transaction.amount)),
+            "is_round_amount": int(amount_abs % 10 == 0),
+            "amount_magnitude": self._get_amount_magnitude(amount_abs),
             # Temporal features
             "day_of_month": transaction.date.day,
-            "day_of_week": transaction.date.weekday(),
+            "day_of_week": weekday,
             "month": transaction.date.month,
-            "is_weekend": int(transaction.date.weekday() >= 5),
+            "is_weekend": int(weekday >= 5),
             "is_month_start": int(transaction.date.day <= 5),
             "is_month_end": int(transaction.date.day >= 25),
             "is_holiday_season": int(transaction.date.month in [11, 12, 1]),
@@ -131,29 +145,23 @@ class FeatureExtractor:
             "merchant_length": len(clean_merchant),
             "merchant_word_count": len(clean_merchant.split()) if clean_merchant else 0,
             # Transaction type indicators (from purpose field)
-            "is_lastschrift": int("lastschrift" in transaction.purpose.lower()),
-            "is_dauerauftrag": int("dauerauftrag" in transaction.purpose.lower()),
-            "is_kartenzahlung": int("karte" in transaction.purpose.lower()),
-            "is_online": int(any(x in transaction.purpose.lower() for x in ["online", "internet", "paypal", "amazon"])),
-            "is_recurring": int(
-                any(x in transaction.purpose.lower() for x in ["dauerauftrag", "standing order", "subscription"])
-            ),
+            "is_lastschrift": int("lastschrift" in purpose_lower),
+            "is_dauerauftrag": int("dauerauftrag" in purpose_lower),
+            "is_kartenzahlung": int("karte" in purpose_lower),
+            "is_online": int(any(x in purpose_lower for x in ["online", "internet", "paypal", "amazon"])),
+            "is_recurring": int(any(x in purpose_lower for x in ["dauerauftrag", "standing order", "subscription"])),
             # Merchant category indicators
             "is_supermarket": int(
-                any(x in clean_merchant.lower() for x in ["edeka", "rewe", "aldi", "lidl", "kaufland", "netto"])
+                any(x in merchant_lower for x in ["edeka", "rewe", "aldi", "lidl", "kaufland", "netto"])
             ),
             "is_gas_station": int(
-                any(x in clean_merchant.lower() for x in ["shell", "esso", "aral", "bp", "total", "tankstelle"])
+                any(x in merchant_lower for x in ["shell", "esso", "aral", "bp", "total", "tankstelle"])
             ),
             "is_restaurant": int(
-                any(x in clean_merchant.lower() for x in ["mcdonald", "burger", "pizza", "restaurant", "cafe"])
-            ),
-            "is_transport": int(
-                any(x in clean_merchant.lower() for x in ["deutsche bahn", "db ", "bvg", "uber", "taxi"])
-            ),
-            "is_tech": int(
-                any(x in clean_merchant.lower() for x in ["amazon", "apple", "google", "microsoft", "netflix"])
+                any(x in merchant_lower for x in ["mcdonald", "burger", "pizza", "restaurant", "cafe"])
             ),
+            "is_transport": int(any(x in merchant_lower for x in ["deutsche bahn", "db ", "bvg", "uber", "taxi"])),
+            "is_tech": int(any(x in merchant_lower for x in ["amazon", "apple", "google", "microsoft", "netflix"])),
             # Text for TF-IDF
             "text_combined": self.text_preprocessor.process(f"{transaction.name} {transaction.purpose}"),
             # Currency features
@@ -138,7 +138,9 @@ class NaiveBayesTextClassifier:
         probabilities = self.predict_proba([transaction])[0]
         predicted_class_idx = np.argmax(probabilities)
         confidence = float(probabilities[predicted_class_idx])
-        predicted_label = self.label_encoder.inverse_transform([predicted_class_idx])[0]
+        # classes_ is the encoder's index -> label table; index it instead of one inverse_transform per class
+        classes = self.label_encoder.classes_
+        predicted_label = classes[predicted_class_idx]
 
         # Get text features
         text_feature = self._extract_text_features([transaction])[0]
@@ -162,9 +164,7 @@ class NaiveBayesTextClassifier:
             "confidence": confidence,
             "text_input": text_feature,
             "top_text_features": top_features,
-            "class_probabilities": {
-                self.label_encoder.inverse_transform([i])[0]: float(prob) for i, prob in enumerate(probabilities)
-            },
+            "class_probabilities": {label: float(prob) for label, prob in zip(classes, probabilities, strict=True)},
         }
 
     def get_model_info(self) -> dict[str, any]:
@@ -6,20 +6,51 @@ Threshold, and persists the outcome. Entry points commit before returning.
 """
 
 from collections import Counter
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import date
-from typing import Protocol, cast
+from typing import Any, Protocol, cast
 
+from sqlalchemy import bindparam, func, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
 from ..core.config import AppConfig
-from ..core.database import AppSettingsORM, TransactionORM
+from ..core.database import ID_CHUNK_SIZE, AppSettingsORM, TransactionORM
 from ..core.models import ReviewPriority, TransactionInput, TransactionPrediction
 from .active_learning import ActiveLearningSelector
 
 MAX_REVIEW_ITEMS = 20
 """Cap on Strategic Selection review items per pipeline run."""
 
+_INPUT_COLUMNS = (
+    TransactionORM.id,
+    TransactionORM.date,
+    TransactionORM.value_date,
+    TransactionORM.name,
+    TransactionORM.purpose,
+    TransactionORM.amount,
+    TransactionORM.currency,
+)
+"""Only the columns needed to build a Categorizer input; avoids full ORM hydration."""
+
+_transactions = TransactionORM.__table__
+_WRITE_OUTCOME = (
+    update(_transactions)
+    .where(_transactions.c.id == bindparam("b_id"))
+    .values(
+        predicted_category_id=bindparam("b_predicted_category_id"),
+        confidence_score=bindparam("b_confidence_score"),
+        review_priority=bindparam("b_review_priority"),
+        is_reviewed=bindparam("b_is_reviewed"),
+        # Only auto-accepted outcomes carry a category; keep the stored one otherwise.
+        category_id=func.coalesce(bindparam("b_accepted_category_id"), _transactions.c.category_id),
+    )
+)
+"""Core UPDATE executed once per run with one parameter set per transaction."""
+
 
 class ConfidenceCategorizer(Protocol):
     """The Categorizer seam: anything exposing confidence-scored prediction."""
@@ -75,7 +106,7 @@ def predict_unpredicted(
     Returns the Categorization Summary and the number of matching
     transactions left unprocessed because of ``limit``. Commits.
     """
-    query = db.query(TransactionORM).filter(TransactionORM.predicted_category_id.is_(None))
+    query = db.query(*_INPUT_COLUMNS).filter(TransactionORM.predicted_category_id.is_(None))
     txns, remaining = _select_with_limit(query, limit)
     return _apply_predictions(db, txns, categorizer, threshold=threshold), remaining
 
@@ -89,16 +120,16 @@ def predict_new(
 ) -> CategorizationSummary:
     """Predict newly imported transactions that are not yet predicted.
 
-    Returns the Categorization Summary. Commits.
+    Large imports are looked up in ``ID_CHUNK_SIZE`` batches so the query
+    stays within SQLite's bound-parameter limit. Returns the Categorization
+    Summary. Commits.
     """
-    txns = (
-        db.query(TransactionORM)
-        .filter(
-            TransactionORM.id.in_(transaction_ids),
-            TransactionORM.predicted_category_id.is_(None),
-        )
-        .all()
-    )
+    unpredicted = db.query(*_INPUT_COLUMNS).filter(TransactionORM.predicted_category_id.is_(None))
+    txns = [
+        txn
+        for chunk in _chunked(list(dict.fromkeys(transaction_ids)), ID_CHUNK_SIZE)
+        for txn in unpredicted.filter(TransactionORM.id.in_(chunk)).all()
+    ]
     return _apply_predictions(db, txns, categorizer, threshold=threshold)
 
 
@@ -114,7 +145,7 @@ def repredict_unreviewed(
     Returns the Categorization Summary and the number of matching
     transactions left unprocessed because of ``limit``. Commits.
     """
-    query = db.query(TransactionORM).filter(
+    query = db.query(*_INPUT_COLUMNS).filter(
         TransactionORM.is_reviewed.is_(False),
         TransactionORM.predicted_category_id.is_not(None),
     )
@@ -122,7 +153,13 @@ def repredict_unreviewed(
     return _apply_predictions(db, txns, categorizer, threshold=threshold), remaining
 
 
-def _select_with_limit(query, limit: int) -> tuple[list[TransactionORM], int]:
+def _chunked(items: Sequence[str], size: int) -> Iterator[Sequence[str]]:
+    """Yield consecutive slices of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _select_with_limit(query, limit: int) -> tuple[list[Row], int]:
     """Fetch up to ``limit`` matches and count how many are left beyond it."""
     txns = query.limit(limit).all()
     if len(txns) < limit:
@@ -130,8 +167,9 @@ def _select_with_limit(query, limit: int) -> tuple[list[TransactionORM], int]:
     return txns, max(0, query.count() - len(txns))
 
 
-def _to_input(txn: TransactionORM) -> TransactionInput:
-    return TransactionInput(
+def _to_input(txn: Row) -> TransactionInput:
+    # Stored rows were validated on import; skip per-row pydantic validation.
+    return TransactionInput.model_construct(
         date=cast(date, txn.date),
         value_date=cast(date, txn.value_date or txn.date),
         name=str(txn.name),
@@ -143,12 +181,17 @@ def _to_input(txn: TransactionORM) -> TransactionInput:
 
 def _apply_predictions(
     db: Session,
-    txns: list[TransactionORM],
+    txns: list[Row],
     categorizer: ConfidenceCategorizer,
     *,
     threshold: float | None,
 ) -> CategorizationSummary:
-    """Predict, run Strategic Selection, bucket, persist, and commit."""
+    """Predict, run Strategic Selection, bucket, persist, and commit.
+
+    Outcomes are written with a single Core executemany UPDATE rather than
+    per-object ORM assignment; instances the caller still holds in the session
+    are then given the written values without another round trip.
+    """
     if not txns:
         return CategorizationSummary()
 
@@ -173,12 +216,15 @@ def _apply_predictions(
     if threshold is None:
         threshold = get_auto_approve_threshold(db)
 
-    counts = Counter(
-        _bucket_transaction(txn, prediction, strategic_selections, threshold)
+    updates = [
+        _bucket_transaction(str(txn.id), prediction, strategic_selections, threshold)
         for txn, prediction in zip(txns, predictions, strict=True)
-    )
-
+    ]
+    db.execute(_WRITE_OUTCOME, updates)
     db.commit()
+    _sync_loaded_instances(db, updates)
+
+    counts = Counter(params["b_review_priority"] for params in updates)
     return CategorizationSummary(
         auto_accepted=counts[ReviewPriority.AUTO_ACCEPTED],
         quality_check=counts[ReviewPriority.QUALITY_CHECK],
@@ -187,23 +233,43 @@ def _apply_predictions(
     )
 
 
+def _sync_loaded_instances(db: Session, updates: list[dict[str, Any]]) -> None:
+    """Mirror written outcomes onto ``TransactionORM`` instances loaded in the session.
+
+    The Core UPDATE bypasses the identity map; setting the committed values keeps
+    ReviewPriority members on held instances instead of reloading plain strings.
+    """
+    for params in updates:
+        txn = db.identity_map.get(identity_key(TransactionORM, params["b_id"]))
+        if txn is None:
+            continue
+        set_committed_value(txn, "predicted_category_id", params["b_predicted_category_id"])
+        set_committed_value(txn, "confidence_score", params["b_confidence_score"])
+        set_committed_value(txn, "review_priority", params["b_review_priority"])
+        set_committed_value(txn, "is_reviewed", params["b_is_reviewed"])
+        if params["b_accepted_category_id"] is not None:
+            set_committed_value(txn, "category_id", params["b_accepted_category_id"])
+
+
 def _bucket_transaction(
-    txn: TransactionORM,
+    txn_id: str,
     prediction: TransactionPrediction,
     strategic_selections: set[str],
     threshold: float,
-) -> ReviewPriority:
-    """Write one transaction's Prediction and Review Priority; return the bucket."""
-    txn.predicted_category_id = prediction.predicted_category_id
-    txn.confidence_score = prediction.confidence_score
-
+) -> dict[str, Any]:
+    """Bucket one transaction's Prediction; return its ``_WRITE_OUTCOME`` parameters."""
     if prediction.confidence_score >= threshold:
-        priority = ReviewPriority.QUALITY_CHECK if txn.id in strategic_selections else ReviewPriority.AUTO_ACCEPTED
+        priority = ReviewPriority.QUALITY_CHECK if txn_id in strategic_selections else ReviewPriority.AUTO_ACCEPTED
     else:
-        priority = ReviewPriority.HIGH if txn.id in strategic_selections else ReviewPriority.STANDARD
-
-    txn.review_priority = priority
-    txn.is_reviewed = priority is ReviewPriority.AUTO_ACCEPTED
-    if priority is ReviewPriority.AUTO_ACCEPTED:
-        txn.category_id = prediction.predicted_category_id
-    return priority
+        priority = ReviewPriority.HIGH if txn_id in strategic_selections else ReviewPriority.STANDARD
+
+    return {
+        "b_id": txn_id,
+        "b_predicted_category_id": prediction.predicted_category_id,
+        "b_confidence_score": prediction.confidence_score,
+        "b_review_priority": priority,
+        "b_is_reviewed": priority is ReviewPriority.AUTO_ACCEPTED,
+        "b_accepted_category_id": (
+            prediction.predicted_category_id if priority is ReviewPriority.AUTO_ACCEPTED else None
+        ),
+    }
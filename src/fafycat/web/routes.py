@@ -87,52 +87,17 @@ async def analytics_page(request: Request) -> HTMLResponse:
 @router.post("/upload-csv", response_class=HTMLResponse)
 async def upload_csv_web(request: Request, file: UploadFile) -> HTMLResponse:
     """Handle CSV upload and return HTML response with preview."""
-    import os
-    import tempfile
-    from pathlib import Path
-
-    from fafycat.api.dependencies import get_db_manager
+    from fafycat.api.upload import import_csv_upload
 
     # Get database manager and session
     db_manager = get_db_manager(request)
 
     try:
         with db_manager.get_session() as db_session:
-            from fafycat.data.csv_processor import CSVProcessor
-
-            # Save uploaded file temporarily
-            file_content = await file.read()
-            content_str = file_content.decode("utf-8")
-
-            # Create temp file and ensure it's written and closed properly
-            with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as tmp_file:
-                tmp_file.write(content_str)
-                tmp_file_path = tmp_file.name
-
-            # Process the CSV
-            processor = CSVProcessor(db_session)
-            transactions, errors = processor.import_csv(Path(tmp_file_path))
-
-            # Clean up temp file
-            os.unlink(tmp_file_path)
-
-            if errors:
-                raise Exception(f"CSV processing errors: {'; '.join(errors[:5])}")
-
-            if not transactions:
-                raise Exception("No valid transactions found in CSV")
-
-            # Save transactions to database
-            new_count, duplicate_count = processor.save_transactions(transactions)
-
-            # Auto-predict categories for new transactions if model is available
-            from fafycat.api.upload import empty_categorization_summary, predict_transaction_categories
-
-            if new_count > 0:
-                cat_summary = predict_transaction_categories(db_session, transactions, new_count)
-            else:
-                cat_summary = empty_categorization_summary()
-            predictions_made = cat_summary["predictions_made"]
+            result = await import_csv_upload(file, db_session)
+            transactions = result.transactions
+            new_count, duplicate_count = result.new_count, result.duplicate_count
+            predictions_made = result.categorization["predictions_made"]
 
             # Create success page with results
             if new_count > 0:
@@ -78,3 +78,27 @@ def test_create_app_recreates_missing_model_dir(tmp_data_dir: Path, app_factory)
 
     app_factory()
     assert model_dir.is_dir()
+
+
+def test_app_database_runs_in_wal_mode(app_factory):
+    """SQLite connections get the WAL pragmas so reads do not wait on import commits."""
+    from sqlalchemy import text
+
+    app = app_factory()
+    with app.state.db_manager.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+
+def test_large_responses_are_gzip_compressed(test_client):
+    """Responses over 1 KiB are gzip-encoded for clients that accept it."""
+    response = test_client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "X-Process-Time" in response.headers
+
+
+def test_app_database_pool_is_sized_for_concurrent_sessions(app_factory):
+    """File-backed SQLite engines keep a larger connection pool than the default of five."""
+    app = app_factory()
+    assert app.state.db_manager.engine.pool.size() == 10
@@ -410,3 +410,12 @@ def test_analytics_breakdown_invalid_type_exits_with_argparse_error(cli_runner):
     assert result.returncode == 2, (
         f"expected exit 2, got {result.returncode}\nstdout={result.stdout!r}\nstderr={result.stderr!r}"
     )
+
+
+def test_serve_workers_flag_is_parsed_and_validated(cli_runner):
+    help_result = cli_runner("serve", "--help")
+    assert help_result.returncode == 0
+    assert "--workers" in help_result.stdout
+
+    bad = cli_runner("serve", "--workers", "0")
+    assert bad.returncode == 2
@@ -0,0 +1,98 @@
+"""Tests for the k-fold cross-validation helpers."""
+
+from collections import Counter
+
+import numpy as np
+
+from fafycat.data.csv_processor import create_synthetic_transactions
+from fafycat.ml.cross_validation import StratifiedKFoldValidator
+
+
+class MerchantLookupModel:
+    """Tiny deterministic model: predicts the label last seen for a merchant name."""
+
+    def fit(self, transactions, labels):
+        self.lookup = {t.name.split()[0]: label for t, label in zip(transactions, labels, strict=True)}
+        self.default = Counter(labels.tolist()).most_common(1)[0][0]
+        return self
+
+    def predict(self, transactions):
+        return np.array([self.lookup.get(t.name.split()[0], self.default) for t in transactions])
+
+
+def _dataset():
+    transactions = create_synthetic_transactions()
+    labels = np.array([t.category for t in transactions])
+    return transactions, labels
+
+
+def test_validate_single_model_reports_fold_scores():
+    transactions, labels = _dataset()
+
+    results = StratifiedKFoldValidator(n_splits=3).validate_single_model(transactions, labels, MerchantLookupModel)
+
+    assert len(results["cv_accuracy_scores"]) == 3
+    assert 0.0 <= results["cv_accuracy_mean"] <= 1.0
+    assert set(results["precision_per_class"]) == set(labels)
+
+
+def test_per_class_metrics_match_sklearn():
+    from sklearn.metrics import accuracy_score, precision_recall_fscore_support
+
+    transactions, labels = _dataset()
+    validator = StratifiedKFoldValidator(n_splits=3)
+
+    results = validator.validate_single_model(transactions, labels, MerchantLookupModel)
+
+    true_labels, predictions = [], []
+    for train_idx, val_idx in validator.skf.split(transactions, labels):
+        model = MerchantLookupModel().fit([transactions[i] for i in train_idx], labels[train_idx])
+        predictions.extend(model.predict([transactions[i] for i in val_idx]))
+        true_labels.extend(labels[val_idx])
+    classes = np.unique(labels)
+    precision, recall, _, _ = precision_recall_fscore_support(
+        true_labels, predictions, labels=classes, average=None, zero_division=0
+    )
+
+    assert results["overall_accuracy"] == accuracy_score(true_labels, predictions)
+    assert results["precision_per_class"] == dict(zip(classes, precision.tolist(), strict=True))
+    assert results["recall_per_class"] == dict(zip(classes, recall.tolist(), strict=True))
+
+
+class FixedProbaModel:
+    """Predicts the same class distribution for every row; counts how often it is fit."""
+
+    fits = 0
+    probas = (0.5, 0.5)
+
+    def fit(self, transactions, labels):
+        type(self).fits += 1
+        return self
+
+    def predict_proba(self, transactions):
+        return np.tile(self.probas, (len(transactions), 1))
+
+
+class LeansFirst(FixedProbaModel):
+    probas = (0.9, 0.1)
+
+
+class LeansSecond(FixedProbaModel):
+    probas = (0.2, 0.8)
+
+
+def test_validate_ensemble_weights_fits_each_model_once_per_fold():
+    transactions = create_synthetic_transactions()[:40]
+    labels = np.array([0] * 30 + [1] * 10)
+    candidates = [{"lgbm": 0.3, "nb": 0.7}, {"lgbm": 0.8, "nb": 0.2}]
+    LeansFirst.fits = LeansSecond.fits = 0
+
+    best_weights, best_score, scores = StratifiedKFoldValidator(n_splits=2).validate_ensemble_weights(
+        transactions, labels, LeansFirst, LeansSecond, candidates
+    )
+
+    assert LeansFirst.fits == LeansSecond.fits == 2
+    # 0.3/0.7 leans to class 1 (10 of 40 right); 0.8/0.2 leans to class 0 (30 of 40)
+    np.testing.assert_allclose(scores, [0.25, 0.75])
+    assert best_weights == candidates[1]
+    assert best_score == 0.75
@@ -1,6 +1,7 @@
 """Tests for CSV processing functionality."""
 
 import csv
+import io
 import tempfile
 from datetime import date
 from pathlib import Path
@@ -144,6 +145,79 @@ class TestCSVProcessor:
         finally:
             temp_path.unlink()
 
+    def test_import_csv_stream(self, setup_db):
+        """A binary file object parses the same as the file on disk."""
+        content = b"date,name,purpose,amount\n2024-01-15,EDEKA Markt,Lastschrift,-45.67\n2024-01-16,REWE,Karte,-12.50\n"
+
+        with setup_db.get_session() as session:
+            transactions, errors = CSVProcessor(session).import_csv_stream(io.BytesIO(content))
+
+        assert errors == []
+        assert [t.name for t in transactions] == ["EDEKA Markt", "REWE"]
+        assert transactions[0].date == date(2024, 1, 15)
+        assert transactions[1].amount == -12.50
+
+    def test_insert_new_transactions_reports_only_inserted_ids(self, setup_db):
+        """Already stored transactions count as duplicates and are left out of the IDs."""
+        transactions = create_synthetic_transactions()[:3]
+
+        with setup_db.get_session() as session:
+            processor = CSVProcessor(session)
+            processor.save_transactions(transactions[:1])
+            inserted_ids, duplicate_count = processor.insert_new_transactions(transactions)
+
+        assert duplicate_count == 1
+        assert inserted_ids == [t.transaction_id for t in transactions[1:]]
+
+    def test_insert_new_transactions_skips_repeats_within_batch(self, setup_db):
+        """A transaction repeated in one call is inserted once and counted as a duplicate."""
+        transactions = create_synthetic_transactions()[:2]
+
+        with setup_db.get_session() as session:
+            inserted_ids, duplicate_count = CSVProcessor(session).insert_new_transactions(
+                [transactions[0], transactions[1], transactions[0]]
+            )
+
+        assert duplicate_count == 1
+        assert inserted_ids == [t.transaction_id for t in transactions]
+
+    def test_save_without_commit_is_rolled_back(self, setup_db):
+        """With commit=False rows are only flushed, so the caller decides when they persist."""
+        transactions = create_synthetic_transactions()[:3]
+
+        with setup_db.get_session() as session:
+            processor = CSVProcessor(session)
+            new_count, _ = processor.save_transactions(transactions[:2], commit=False)
+            # Flushed rows already take part in duplicate detection
+            assert processor.save_transactions(transactions, commit=False) == (1, 2)
+            session.rollback()
+
+        with setup_db.get_session() as session:
+            assert CSVProcessor(session).save_transactions(transactions) == (3, 0)
+        assert new_count == 2
+
+    def test_transaction_id_is_cached(self):
+        """The memoized transaction ID matches generate_id and is computed once."""
+        txn = create_synthetic_transactions()[0]
+
+        assert txn.transaction_id == txn.generate_id()
+        assert "transaction_id" in txn.__dict__
+        assert "transaction_id" not in txn.model_dump()
+
+    def test_transaction_id_follows_field_changes(self):
+        """Changing a field the ID is built from recomputes the memoized ID."""
+        txn = create_synthetic_transactions()[0]
+        original_id = txn.transaction_id
+
+        txn.amount += 1
+        assert txn.transaction_id == txn.generate_id() != original_id
+
+        txn.name = "renamed"
+        assert txn.transaction_id == txn.generate_id()
+
+        txn.currency = "USD"
+        assert "transaction_id" in txn.__dict__
+
     def test_synthetic_data_generation(self):
         """Test synthetic transaction data generation."""
         transactions = create_synthetic_transactions()
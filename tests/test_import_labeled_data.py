@@ -0,0 +1,257 @@
+"""Tests for the labeled data importer script."""
+
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from fafycat.core.config import AppConfig
+from fafycat.core.database import AppSettingsORM, DatabaseManager, TransactionORM
+from fafycat.core.models import TransactionInput
+from fafycat.data.csv_processor import CSVProcessor
+from scripts import import_labeled_data
+from scripts.import_labeled_data import IMPORTED_FILE_KEY_PREFIX, import_all_labeled_data, parse_labeled_csv
+
+
+def write_csv(path: Path, rows: list[str]) -> Path:
+    path.write_text("\n".join(rows) + "\n")
+    return path
+
+
+def reference_ids(path: Path) -> set[str]:
+    """IDs from the original row-by-row parser: whole-file dtypes, per-row day-first dates."""
+    ids = set()
+    for _, row in pd.read_csv(path).iterrows():
+        try:
+            txn = TransactionInput(
+                date=pd.to_datetime(str(row["Date"]).strip(), dayfirst=True).date(),
+                name=str(row["Name"]).strip(),
+                purpose=str(row["Purpose"]).strip(),
+                amount=float(row["Amount"]),
+            )
+        except Exception:
+            continue
+        ids.add(txn.generate_id())
+    return ids
+
+
+class TestParseLabeledCSV:
+    """Test parsing of labeled CSV files."""
+
+    def test_lowercase_columns(self, tmp_path):
+        """Lowercase headers and a 'category' column resolve like the capitalized ones."""
+        path = write_csv(
+            tmp_path / "lower.csv",
+            ["date,name,purpose,amount,currency,category", "15.01.2024,EDEKA,Karte,-45.67,EUR,groceries"],
+        )
+
+        [txn] = parse_labeled_csv(path)
+
+        assert txn.date == date(2024, 1, 15)
+        assert (txn.name, txn.purpose, txn.amount, txn.currency) == ("EDEKA", "Karte", -45.67, "EUR")
+        assert txn.category == "groceries"
+
+    def test_capitalized_columns(self, tmp_path):
+        """Capitalized headers with a 'Cat' column; currency defaults to EUR."""
+        path = write_csv(tmp_path / "upper.csv", ["Date,Name,Purpose,Amount,Cat", "16.01.2024,REWE,Karte,-12.50,food"])
+
+        [txn] = parse_labeled_csv(path)
+
+        assert (txn.name, txn.amount, txn.currency, txn.category) == ("REWE", -12.50, "EUR", "food")
+
+    def test_missing_required_column_skips_file(self, tmp_path):
+        """Files without a date, name or amount column yield no transactions."""
+        path = write_csv(tmp_path / "no_amount.csv", ["Date,Name,Purpose", "15.01.2024,EDEKA,Karte"])
+
+        assert parse_labeled_csv(path) == []
+
+    def test_unparseable_dates_and_amounts_are_dropped(self, tmp_path, capsys):
+        """Rows with a bad date or amount are skipped and reported once per file."""
+        path = write_csv(
+            tmp_path / "bad.csv",
+            [
+                "Date,Name,Purpose,Amount",
+                "15.01.2024,A,x,-1.00",
+                "not a date,B,x,-2.00",
+                ",C,x,-3.00",
+                "16.01.2024,D,x,abc",
+                "17.01.2024,E,x,",
+            ],
+        )
+
+        transactions = parse_labeled_csv(path)
+
+        assert [txn.name for txn in transactions] == ["A"]
+        assert "Skipped 4 rows" in capsys.readouterr().out
+
+    def test_dates_outside_the_detected_format(self, tmp_path):
+        """Rows in another layout than the detected one are parsed day-first, not dropped."""
+        rows = ["Date,Name,Purpose,Amount"] + [f"{day:02d}/03/2024,A{day},x,-1" for day in range(1, 6)]
+        path = write_csv(tmp_path / "mixed.csv", [*rows, "01/25/2024,B,x,-1", "2024-04-25,C,x,-1"])
+
+        transactions = parse_labeled_csv(path)
+
+        assert len(transactions) == 7
+        assert transactions[0].date == date(2024, 3, 1)
+        assert transactions[-2].date == date(2024, 1, 25)
+        assert transactions[-1].date == date(2024, 4, 25)
+
+    def test_value_date(self, tmp_path):
+        """A value date is kept only when it differs from the booking date."""
+        path = write_csv(
+            tmp_path / "value_date.csv",
+            [
+                "Date,Value date,Name,Purpose,Amount",
+                "15.01.2024,17.01.2024,A,x,-1",
+                "15.01.2024,15.01.2024,B,x,-1",
+                "15.01.2024,,C,x,-1",
+                "15.01.2024,garbage,D,x,-1",
+            ],
+        )
+
+        transactions = parse_labeled_csv(path)
+
+        assert [(txn.name, txn.value_date) for txn in transactions] == [
+            ("A", date(2024, 1, 17)),
+            ("B", None),
+            ("C", None),
+        ]
+
+    def test_repeated_rows_are_dropped(self, tmp_path, capsys):
+        """A row repeating another's date, amount, name and purpose is imported once."""
+        row = "15.01.2024,EDEKA,Karte,-45.67,groceries"
+        path = write_csv(tmp_path / "repeat.csv", ["Date,Name,Purpose,Amount,Cat", row, row, row.replace("-45", "-46")])
+
+        transactions = parse_labeled_csv(path)
+
+        assert [txn.amount for txn in transactions] == [-45.67, -46.67]
+        assert "Dropped 1 repeated rows" in capsys.readouterr().out
+
+    def test_category_carried_through(self, tmp_path):
+        """The labeled category is kept per row, and empty cells become None."""
+        path = write_csv(
+            tmp_path / "cats.csv",
+            [
+                "Date,Name,Purpose,Amount,Cat",
+                "15.01.2024,A,x,-1, rent ",
+                "16.01.2024,B,x,-1,",
+                "17.01.2024,C,x,-1,food",
+            ],
+        )
+
+        assert [txn.category for txn in parse_labeled_csv(path)] == ["rent", None, "food"]
+
+    def test_categories_none_without_category_column(self, tmp_path):
+        """Files without a category column produce unlabeled transactions."""
+        path = write_csv(tmp_path / "nocat.csv", ["Date,Name,Purpose,Amount", "15.01.2024,A,x,-1"])
+
+        assert parse_labeled_csv(path)[0].category is None
+
+    @pytest.mark.filterwarnings("ignore:Parsing dates in:UserWarning")
+    @pytest.mark.parametrize("chunk_size", [50_000, 4])
+    def test_ids_match_row_by_row_parser(self, tmp_path, monkeypatch, chunk_size):
+        """Transaction IDs match the original parser, including numeric names with a blank cell."""
+        monkeypatch.setattr(import_labeled_data, "READ_CHUNK_SIZE", chunk_size)
+        rows = ["Date,Name,Purpose,Amount,Cat"]
+        rows += [f"{day:02d}.02.2024,{100 + day},Miete {day},-{day}.50,rent" for day in range(1, 15)]
+        rows += [
+            "15.02.2024,,Ohne Namen,-3.00,misc",
+            "2024-04-25,101,ISO,-2.00,misc",
+            "bad,102,x,-1,misc",
+            "16.02.2024,103,x,abc,misc",
+        ]
+        path = write_csv(tmp_path / "ids.csv", rows)
+
+        transactions = parse_labeled_csv(path)
+
+        assert {txn.transaction_id for txn in transactions} == reference_ids(path)
+        assert transactions[0].name == "101.0"
+
+
+class TestImportAllLabeledData:
+    """Test skipping of labeled files that were already imported."""
+
+    @pytest.fixture
+    def db_manager(self, tmp_data_dir):
+        """Database manager for the per-test database the importer uses."""
+        db_manager = DatabaseManager(AppConfig())
+        db_manager.create_tables()
+        return db_manager
+
+    @pytest.fixture
+    def labeled_dir(self, tmp_path):
+        """Directory with one labeled CSV file."""
+        labeled_dir = tmp_path / "labeled"
+        labeled_dir.mkdir()
+        write_csv(labeled_dir / "a.csv", ["Date,Name,Purpose,Amount,Cat", "15.01.2024,EDEKA,Karte,-45.67,groceries"])
+        return labeled_dir
+
+    @staticmethod
+    def recorded_files(db_manager) -> set[str]:
+        with db_manager.get_session() as session:
+            keys = session.query(AppSettingsORM.key).filter(AppSettingsORM.key.startswith(IMPORTED_FILE_KEY_PREFIX))
+            return {key.removeprefix(IMPORTED_FILE_KEY_PREFIX) for (key,) in keys}
+
+    @staticmethod
+    def transaction_count(db_manager) -> int:
+        with db_manager.get_session() as session:
+            return session.query(TransactionORM).count()
+
+    def test_unchanged_file_is_skipped(self, db_manager, labeled_dir, capsys):
+        """A second run skips a file whose contents have not changed."""
+        import_all_labeled_data(labeled_dir)
+        assert self.recorded_files(db_manager) == {str((labeled_dir / "a.csv").resolve())}
+        capsys.readouterr()
+
+        import_all_labeled_data(labeled_dir)
+
+        out = capsys.readouterr().out
+        assert "Skipping a.csv (unchanged since last import)" in out
+        assert "Processing a.csv" not in out
+        assert self.transaction_count(db_manager) == 1
+
+    def test_modified_file_is_reimported(self, db_manager, labeled_dir, capsys):
+        """Changing a file's contents makes the next run import it again."""
+        import_all_labeled_data(labeled_dir)
+        with (labeled_dir / "a.csv").open("a") as f:
+            f.write("16.01.2024,REWE,Karte,-12.50,groceries\n")
+        capsys.readouterr()
+
+        import_all_labeled_data(labeled_dir)
+
+        assert "Imported: 1 new, 1 duplicates" in capsys.readouterr().out
+        assert self.transaction_count(db_manager) == 2
+
+    def test_force_reimports_unchanged_file(self, db_manager, labeled_dir, capsys):
+        """With force, an unchanged file is parsed and checked again."""
+        import_all_labeled_data(labeled_dir)
+        capsys.readouterr()
+
+        import_all_labeled_data(labeled_dir, force=True)
+
+        out = capsys.readouterr().out
+        assert "Skipping" not in out
+        assert "Imported: 0 new, 1 duplicates" in out
+        assert self.recorded_files(db_manager) == {str((labeled_dir / "a.csv").resolve())}
+
+    def test_failed_file_is_not_recorded(self, db_manager, labeled_dir, monkeypatch):
+        """A file that fails while its rows are saved is imported again on the next run."""
+        write_csv(labeled_dir / "b.csv", ["Date,Name,Purpose,Amount,Cat", "16.01.2024,REWE,Karte,-12.50,groceries"])
+        save_transactions = CSVProcessor.save_transactions
+
+        def fail_for_b(self, transactions, import_batch=None, commit=True):
+            if import_batch and import_batch.endswith("_b"):
+                raise RuntimeError("disk full")
+            return save_transactions(self, transactions, import_batch, commit=commit)
+
+        monkeypatch.setattr(CSVProcessor, "save_transactions", fail_for_b)
+        import_all_labeled_data(labeled_dir)
+
+        assert self.recorded_files(db_manager) == {str((labeled_dir / "a.csv").resolve())}
+
+        monkeypatch.setattr(CSVProcessor, "save_transactions", save_transactions)
+        import_all_labeled_data(labeled_dir)
+
+        assert self.transaction_count(db_manager) == 2
+        assert len(self.recorded_files(db_manager)) == 2
@@ -291,6 +291,20 @@ def test_predict_without_model(app_factory):
         # In production, this could be either True or False depending on if model was trained
 
 
+def test_get_categorizer_does_not_cache_missing_model(tmp_data_dir, test_db):
+    """Without a model file every call reports 503; no untrained instance is cached."""
+    from fastapi import HTTPException
+
+    from fafycat.api import ml
+
+    ml.reset_singletons()
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            ml.get_categorizer(test_db)
+        assert exc_info.value.status_code == 503
+    ml.reset_singletons()
+
+
 def test_prediction_error_handling(shared_engine, test_db, app_factory):
     """Test error handling when prediction fails."""
     from fafycat.api.dependencies import get_db_session
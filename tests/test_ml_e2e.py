@@ -5,9 +5,11 @@ and EnsembleCategorizer using synthetic data seeded into a temp DB.
 """
 
 import os
+import pickle
 import random
 import tempfile
 
+import joblib
 import numpy as np
 import pytest
 from sqlalchemy import create_engine
@@ -19,6 +21,7 @@ from fafycat.core.models import ModelMetrics, TransactionInput, TransactionPredi
 from fafycat.data.csv_processor import CSVProcessor, create_synthetic_transactions
 from fafycat.ml.categorizer import TransactionCategorizer
 from fafycat.ml.ensemble_categorizer import EnsembleCategorizer
+from fafycat.ml.naive_bayes_classifier import NaiveBayesTextClassifier
 
 # ---------------------------------------------------------------------------
 # Module-scoped fixtures (train once, share across tests in this file)
@@ -133,6 +136,50 @@ class TestTransactionCategorizerTrain:
             assert 0.0 <= pred.confidence_score <= 1.0
             assert pred.predicted_category_id > 0
 
+    def test_saved_model_loads_with_same_predictions(self, seeded_db, ml_config, tmp_path):
+        session, transactions = seeded_db
+        categorizer = TransactionCategorizer(session, ml_config)
+        categorizer.train()
+        model_path = tmp_path / "categorizer.pkl"
+        categorizer.save_model(model_path)
+
+        loaded = TransactionCategorizer(session, ml_config)
+        loaded.load_model(model_path)
+
+        expected = categorizer.predict_with_confidence(transactions[:5])
+        actual = loaded.predict_with_confidence(transactions[:5])
+        assert [p.predicted_category_id for p in actual] == [p.predicted_category_id for p in expected]
+
+    def test_memory_mapped_model_predicts(self, seeded_db, ml_config, tmp_path):
+        session, transactions = seeded_db
+        categorizer = TransactionCategorizer(session, ml_config)
+        categorizer.train()
+        model_path = tmp_path / "categorizer.pkl"
+        categorizer.save_model(model_path)
+
+        loaded = TransactionCategorizer(session, ml_config)
+        loaded.load_model(model_path, mmap_mode="r")
+
+        expected = categorizer.predict_with_confidence(transactions[:5])
+        actual = loaded.predict_with_confidence(transactions[:5])
+        assert [p.predicted_category_id for p in actual] == [p.predicted_category_id for p in expected]
+
+    def test_loads_plain_pickle_model_files(self, seeded_db, ml_config, tmp_path):
+        """Model files written with pickle.dump by earlier versions still load."""
+        session, _ = seeded_db
+        categorizer = TransactionCategorizer(session, ml_config)
+        categorizer.train()
+        joblib_path = tmp_path / "joblib.pkl"
+        categorizer.save_model(joblib_path)
+        pickle_path = tmp_path / "pickle.pkl"
+        pickle_path.write_bytes(pickle.dumps(joblib.load(joblib_path)))
+
+        loaded = TransactionCategorizer(session, ml_config)
+        loaded.load_model(pickle_path)
+
+        assert loaded.is_trained
+        assert list(loaded.classes_) == list(categorizer.classes_)
+
     def test_train_creates_calibrated_classifier(self, seeded_db, ml_config):
         session, _ = seeded_db
         categorizer = TransactionCategorizer(session, ml_config)
@@ -174,6 +221,21 @@ class TestTransactionCategorizerFit:
             assert isinstance(pred, TransactionPrediction)
             assert 0.0 <= pred.confidence_score <= 1.0
 
+    def test_fit_with_precomputed_features_matches_extraction(self, seeded_db, ml_config):
+        session, transactions = seeded_db
+        labels = _get_labels_for_transactions(session, transactions)
+        extracted = TransactionCategorizer(session, ml_config)
+        extracted.fit(transactions, labels)
+        precomputed = TransactionCategorizer(session, ml_config)
+        features = precomputed.extract_feature_frame(transactions)
+
+        precomputed.fit(transactions, labels, features=features)
+
+        np.testing.assert_allclose(
+            precomputed.predict_proba(transactions[:10], features=features.iloc[:10]),
+            extracted.predict_proba(transactions[:10]),
+        )
+
 
 # ---------------------------------------------------------------------------
 # Tests — EnsembleCategorizer
@@ -195,6 +257,19 @@ class TestEnsembleCategorizerTraining:
         weights = results["best_weights"]
         assert abs(weights["lgbm"] + weights["nb"] - 1.0) < 1e-6
 
+    def test_concurrent_component_fits_match_sequential(self, seeded_db, ml_config):
+        session, transactions = seeded_db
+        sequential = EnsembleCategorizer(session, ml_config.model_copy(update={"ensemble_concurrent_fit": False}))
+        concurrent = EnsembleCategorizer(session, ml_config.model_copy(update={"ensemble_concurrent_fit": True}))
+
+        sequential_results = sequential.train_with_validation_optimization()
+        concurrent_results = concurrent.train_with_validation_optimization()
+
+        assert concurrent_results["best_weights"] == sequential_results["best_weights"]
+        expected = sequential.predict_with_confidence(transactions[:5])
+        actual = concurrent.predict_with_confidence(transactions[:5])
+        assert [p.predicted_category_id for p in actual] == [p.predicted_category_id for p in expected]
+
     def test_ensemble_enables_predictions(self, seeded_db, ml_config):
         session, transactions = seeded_db
         ensemble = EnsembleCategorizer(session, ml_config)
@@ -208,3 +283,34 @@ class TestEnsembleCategorizerTraining:
             assert 0.0 <= pred.confidence_score <= 1.0
             # Ensemble predictions include weight keys
             assert "ensemble_lgbm_weight" in pred.feature_contributions or "merchant_rule" in pred.feature_contributions
+
+
+class TestEnsembleProbabilityAlignment:
+    """Column alignment between component models with different class orders."""
+
+    def test_align_probas_reorders_drops_and_renormalizes(self, ml_session, ml_config):
+        ensemble = EnsembleCategorizer(ml_session, ml_config)
+        probas = np.array([[0.2, 0.5, 0.3], [0.0, 0.0, 1.0]])
+
+        aligned = ensemble._align_probas(probas, np.array([10, 20, 30]), np.array([20, 10, 40]))
+
+        # Class 30 is absent from the target, class 40 from the source
+        np.testing.assert_allclose(aligned, [[0.5 / 0.7, 0.2 / 0.7, 0.0], [0.0, 0.0, 0.0]])
+
+
+class TestNaiveBayesExplanation:
+    """Naive Bayes explanations report labels in the original category-ID space."""
+
+    def test_explanation_maps_classes_to_labels(self, seeded_db):
+        session, transactions = seeded_db
+        labels = _get_labels_for_transactions(session, transactions)
+        classifier = NaiveBayesTextClassifier()
+        classifier.fit(transactions, labels)
+
+        explanation = classifier.get_prediction_explanation(transactions[0])
+
+        assert set(explanation["class_probabilities"]) == set(labels.tolist())
+        assert explanation["predicted_label"] == max(
+            explanation["class_probabilities"], key=explanation["class_probabilities"].get
+        )
+        assert sum(explanation["class_probabilities"].values()) == pytest.approx(1.0)
@@ -19,6 +19,7 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from fafycat.core.database import AppSettingsORM, Base, CategoryORM, TransactionORM
 from fafycat.core.models import ReviewPriority, TransactionInput, TransactionPrediction
+from fafycat.ml import prediction_pipeline
 from fafycat.ml.prediction_pipeline import (
     CategorizationSummary,
     get_auto_approve_threshold,
@@ -291,6 +292,20 @@ def test_predict_new_selects_only_given_ids_without_predictions(session: Session
     assert not_in_batch.predicted_category_id is None
 
 
+def test_predict_new_looks_up_ids_in_chunks(session: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    """IDs beyond one IN-filter chunk are still predicted, and repeated IDs only once."""
+    monkeypatch.setattr(prediction_pipeline, "ID_CHUNK_SIZE", 2)
+    scores = {f"t{i}": 0.60 for i in range(5)}
+    session.add_all([make_txn(name) for name in scores])
+    session.commit()
+
+    ids = [f"id-{name}" for name in scores]
+    summary = predict_new(session, FakeCategorizer(scores), transaction_ids=ids + ids[:2], threshold=0.50)
+
+    assert summary.total == 5
+    assert session.query(TransactionORM).filter(TransactionORM.predicted_category_id.is_(None)).count() == 0
+
+
 def test_predict_new_with_no_matching_ids_returns_empty_summary(session: Session) -> None:
     """No matching transactions -> empty Categorization Summary, no error."""
     summary = predict_new(session, FakeCategorizer({}), transaction_ids=["missing"], threshold=0.50)
@@ -6,7 +6,7 @@ import pandas as pd
 import pytest
 
 from simulations import Simulation, SimulationResult
-from simulations.scenarios import InflationOnlyScenario, ParentalLeaveScenario
+from simulations.scenarios import CustomScenario, InflationOnlyScenario, ParentalLeaveScenario
 
 
 class TestSimulationResult:
@@ -161,6 +161,68 @@ class TestSimulation:
         # Runs out at month 3 (2000 - 3*1000 = -1000)
         assert runway["runway_months"] == 3
 
+    def test_runway_months_recorded_in_summary(self):
+        """run stores the first negative months, which get_runway_months then returns."""
+        baseline = {"income": 0.0, "spending": 1000.0, "saving": 0.0}
+        sim = Simulation(baseline, initial_savings=2000.0, household_savings=1500.0)
+        scenario = InflationOnlyScenario(annual_inflation_rate=0.0)
+        result = sim.run(scenario, months=6)
+
+        assert result.summary["first_negative_month_personal"] == 3
+        assert result.summary["first_negative_month_total"] == 4
+        assert result.get_runway_months(use_total_liquid=False) == 3
+        assert result.get_runway_months() == 4
+
+    def test_repeated_runs_are_independent(self, baseline_data):
+        """Each run reflects the scenario's current behavior and returns its own result."""
+        sim = Simulation(baseline_data, initial_savings=1000.0)
+        multiplier = {"spending": 1.0}
+
+        def adjust(data):
+            return {**data, "spending": data["spending"] * multiplier["spending"]}
+
+        scenario = CustomScenario(adjust)
+        start = date(2025, 1, 1)
+
+        result = sim.run(scenario, months=6, start_date=start)
+        multiplier["spending"] = 3.0
+        changed = sim.run(scenario, months=6, start_date=start)
+        assert changed.summary["final_savings"] < result.summary["final_savings"]
+
+        changed.monthly_data["income"] *= 0
+        assert (sim.run(scenario, months=6, start_date=start).monthly_data["income"] > 0).all()
+
+    def test_run_batch_matches_individual_runs(self, baseline_data):
+        """Each batch result equals running its scenario on its own."""
+        sim = Simulation(baseline_data, initial_savings=1000.0, household_monthly_contribution=200.0)
+        scenarios = [
+            InflationOnlyScenario(annual_inflation_rate=0.03),
+            ParentalLeaveScenario(months_without_salary=3, salary_replacement_rate=0.67, start_month=2),
+        ]
+        start = date(2025, 1, 1)
+
+        batch = sim.run_batch(scenarios, months=12, start_date=start)
+
+        assert [result.scenario_name for result in batch] == [scenario.name for scenario in scenarios]
+        for scenario, result in zip(scenarios, batch, strict=True):
+            single = Simulation(baseline_data, initial_savings=1000.0, household_monthly_contribution=200.0).run(
+                scenario, months=12, start_date=start
+            )
+            pd.testing.assert_frame_equal(result.monthly_data, single.monthly_data)
+            assert result.summary == single.summary
+
+    def test_run_summary_only_matches_run(self):
+        """The DataFrame-free projection reports the same minimum and runway as run."""
+        baseline = {"income": 0.0, "spending": 1000.0, "saving": 0.0}
+        sim = Simulation(baseline, initial_savings=2000.0, household_savings=1500.0)
+        scenario = InflationOnlyScenario(annual_inflation_rate=0.02)
+
+        summary = sim.run_summary_only(scenario, months=6)
+        result = sim.run(scenario, months=6)
+
+        assert summary["min_savings"] == pytest.approx(result.summary["min_savings"])
+        assert summary["runway_months"] == result.get_runway_months() == 4
+
     def test_summary_statistics(self, baseline_data):
         """Summary statistics are calculated correctly."""
         sim = Simulation(baseline_data, initial_savings=10000.0)
@@ -0,0 +1,204 @@
+"""Tests for simulations/data_loader.py"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from fafycat.core.config import AppConfig
+from fafycat.core.database import CategoryORM, DatabaseManager, TransactionORM
+from simulations.data_loader import EXPORT_COLUMNS, FafyCatDataLoader
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """SQLite database with two years of categorized transactions.
+
+    2023: 12 salaries of 3000, 20 groceries of 100 plus one 10000 outlier, 2 predicted-only
+    savings of 500, one uncategorized and one inactive-category transaction.
+    2024: 12 salaries of 3500 and 12 groceries of 200.
+    """
+    path = tmp_path / "sim.db"
+    config = AppConfig()
+    config.database.url = f"sqlite:///{path}"
+    db_manager = DatabaseManager(config)
+    db_manager.create_tables()
+
+    with db_manager.get_session() as session:
+        salary = CategoryORM(name="salary", type="income")
+        groceries = CategoryORM(name="groceries", type="spending")
+        etf = CategoryORM(name="etf", type="saving")
+        retired = CategoryORM(name="retired", type="spending", is_active=False)
+        session.add_all([salary, groceries, etf, retired])
+        session.flush()
+
+        rows = []
+        for month in range(1, 13):
+            rows.append((date(2023, month, 25), "Employer", "Salary", 3000.0, salary.id, None))
+            rows.append((date(2024, month, 25), "Employer", "Salary", 3500.0, salary.id, None))
+            rows.append((date(2024, month, 3), "REWE", "", -200.0, groceries.id, None))
+        rows += [(date(2023, 1, day), "EDEKA", "Karte", -100.0, groceries.id, None) for day in range(1, 21)]
+        rows += [
+            (date(2023, 6, 1), "Kitchen", "Renovation", -10000.0, groceries.id, None),
+            (date(2023, 3, 1), "Broker", None, -500.0, None, etf.id),
+            (date(2023, 9, 1), "Broker", None, -500.0, None, etf.id),
+            (date(2023, 5, 1), "Unknown", None, -999.0, None, None),
+            (date(2023, 5, 2), "Old", None, -999.0, retired.id, None),
+        ]
+        session.add_all(
+            TransactionORM(
+                id=f"t{i}",
+                date=txn_date,
+                name=name,
+                purpose=purpose,
+                amount=amount,
+                category_id=category_id,
+                predicted_category_id=predicted_id,
+                import_batch="test",
+            )
+            for i, (txn_date, name, purpose, amount, category_id, predicted_id) in enumerate(rows)
+        )
+        session.commit()
+
+    return path
+
+
+@pytest.fixture
+def loader(db_path):
+    return FafyCatDataLoader(str(db_path))
+
+
+class TestMonthlyAverages:
+    """Tests for get_monthly_averages."""
+
+    def test_excludes_outliers(self, loader):
+        """The one-off 10000 is dropped from a type with more than 10 transactions."""
+        result = loader.get_monthly_averages(2023)
+
+        assert result["income"] == pytest.approx(3000.0)
+        assert result["spending"] == pytest.approx(2000.0 / 12)
+        assert result["saving"] == pytest.approx(1000.0 / 12)
+
+    def test_keeps_outliers_when_disabled(self, loader):
+        """Without outlier exclusion every categorized transaction counts."""
+        result = loader.get_monthly_averages(2023, exclude_outliers=False)
+
+        assert result["spending"] == pytest.approx(12000.0 / 12)
+        assert result["saving"] == pytest.approx(1000.0 / 12)
+
+    def test_multiple_years(self, loader):
+        """Several years are averaged over all of their months."""
+        result = loader.get_monthly_averages([2023, 2024])
+
+        assert result["income"] == pytest.approx(3250.0)
+        assert result["spending"] == pytest.approx((2000.0 + 2400.0) / 24)
+
+    def test_year_without_data(self, loader):
+        """A year without transactions averages to zero."""
+        assert loader.get_monthly_averages(2030) == {"income": 0.0, "spending": 0.0, "saving": 0.0}
+
+    def test_returns_copy_of_cached_result(self, loader):
+        """Mutating a result does not change later results."""
+        loader.get_monthly_averages(2023)["income"] = -1.0
+
+        assert loader.get_monthly_averages(2023)["income"] == pytest.approx(3000.0)
+
+
+class TestWeightedBaseline:
+    """Tests for get_weighted_baseline."""
+
+    def test_weights_are_normalized(self, loader):
+        """Weights are scaled to sum to one before averaging the years."""
+        result = loader.get_weighted_baseline({2023: 1, 2024: 3})
+
+        assert result["income"] == pytest.approx(0.25 * 3000.0 + 0.75 * 3500.0)
+        assert result["spending"] == pytest.approx(0.25 * 2000.0 / 12 + 0.75 * 200.0)
+        assert result["saving"] == pytest.approx(0.25 * 1000.0 / 12)
+
+    def test_matches_monthly_averages(self, loader):
+        """Each year contributes its get_monthly_averages result, with or without outliers."""
+        for exclude_outliers in (True, False):
+            weighted = loader.get_weighted_baseline({2023: 1}, exclude_outliers=exclude_outliers)
+            fresh = FafyCatDataLoader(str(loader.db_path))
+
+            assert weighted == pytest.approx(fresh.get_monthly_averages(2023, exclude_outliers=exclude_outliers))
+
+    def test_year_without_data_counts_as_zero(self, loader):
+        """A weighted year without transactions contributes zero."""
+        result = loader.get_weighted_baseline({2024: 1, 2030: 1})
+
+        assert result["income"] == pytest.approx(3500.0 / 2)
+
+    def test_invalid_weights(self, loader):
+        with pytest.raises(ValueError, match="cannot be empty"):
+            loader.get_weighted_baseline({})
+        with pytest.raises(ValueError, match="cannot be zero"):
+            loader.get_weighted_baseline({2023: 0})
+
+    def test_shares_cache_with_monthly_averages(self, loader, monkeypatch):
+        """Years computed by either method are not queried again by the other."""
+        loader.get_monthly_averages(2023)
+        loader.get_weighted_baseline({2023: 1, 2024: 1})
+
+        def no_session():
+            raise AssertionError("database queried again")
+
+        monkeypatch.setattr(loader, "get_session", no_session)
+
+        assert loader.get_monthly_averages(2024)["income"] == pytest.approx(3500.0)
+        assert loader.get_weighted_baseline({2024: 1, 2023: 1})["income"] == pytest.approx(3250.0)
+        assert list(loader.compare_baselines([2023, 2024])["year"]) == [2023, 2024]
+
+
+class TestTransactionSummary:
+    """Tests for get_transaction_summary."""
+
+    def test_counts_and_date_range(self, loader):
+        """All transactions of the year are counted; categorized ones have a category or prediction."""
+        summary = loader.get_transaction_summary(2023)
+
+        assert summary["total_transactions"] == 37
+        assert summary["categorized_transactions"] == 36
+        assert summary["categorization_rate"] == pytest.approx(36 / 37 * 100)
+        assert summary["date_range"] == {"start": date(2023, 1, 1), "end": date(2023, 12, 25)}
+
+    def test_year_without_data(self, loader):
+        summary = loader.get_transaction_summary(2030)
+
+        assert summary["total_transactions"] == 0
+        assert summary["categorized_transactions"] == 0
+        assert summary["categorization_rate"] == 0
+        assert summary["date_range"] == {"start": None, "end": None}
+
+
+class TestExportDataForAnalysis:
+    """Tests for export_data_for_analysis."""
+
+    def test_exports_categorized_transactions(self, loader, tmp_path, monkeypatch):
+        """Rows are streamed newest first, with name and purpose joined into the description.
+
+        Unlike the averages, the export keeps transactions of inactive categories.
+        """
+        monkeypatch.setattr("simulations.data_loader.EXPORT_CHUNK_SIZE", 5)
+
+        path = loader.export_data_for_analysis(str(tmp_path / "export.csv"), year=2023)
+        df = pd.read_csv(path)
+
+        assert list(df.columns) == EXPORT_COLUMNS
+        assert len(df) == 36
+        assert df["date"].is_monotonic_decreasing
+        assert set(df["description"]) == {"Employer - Salary", "EDEKA - Karte", "Kitchen - Renovation", "Broker", "Old"}
+        assert set(df.loc[df["category"] == "etf", "category_type"]) == {"saving"}
+
+    def test_all_years(self, loader, tmp_path):
+        path = loader.export_data_for_analysis(str(tmp_path / "export.csv"))
+
+        df = pd.read_csv(path)
+        assert len(df) == 36 + 24
+        assert "REWE" in set(df["description"])
+
+    def test_empty_export_writes_header(self, loader, tmp_path):
+        path = loader.export_data_for_analysis(str(tmp_path / "empty.csv"), year=2030)
+
+        assert pd.read_csv(path).columns.tolist() == EXPORT_COLUMNS
+        assert pd.read_csv(path).empty
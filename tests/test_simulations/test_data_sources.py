@@ -1,6 +1,7 @@
 """Tests for simulations/data_sources.py"""
 
 import tempfile
+from datetime import date
 from pathlib import Path
 
 import pytest
@@ -130,6 +131,18 @@ class TestCSVDataSource:
         assert result["spending"] == 0.0
         assert result["saving"] == 0.0
 
+    def test_outliers_excluded(self, tmp_path):
+        """Amounts outside the percentile range are left out of the average."""
+        today = date.today().isoformat()
+        rows = [f"{today},-100.00,spending"] * 20 + [f"{today},-100000.00,spending"]
+        csv_file = tmp_path / "outlier.csv"
+        csv_file.write_text("date,amount,category_type\n" + "\n".join(rows) + "\n")
+
+        source = CSVDataSource(str(csv_file), months_back=12)
+
+        assert source.get_monthly_averages()["spending"] == pytest.approx(2000.0 / 12)
+        assert source.get_monthly_averages(exclude_outliers=False)["spending"] == pytest.approx(102000.0 / 12)
+
 
 class TestDataSourceInterface:
     """Tests for DataSource abstract base class."""
@@ -242,6 +242,21 @@ class TestCustomScenario:
 
         assert scenario.apply_adjustments(baseline, month_number=3)["income"] == 3000.0
 
+    def test_periodic_function_called_once_per_period(self):
+        """A periodic custom scenario is evaluated for one period and repeated."""
+        calls = []
+
+        def seasonal(data, month_number):
+            calls.append(month_number)
+            return {**data, "spending": data["spending"] * (1.5 if month_number == 12 else 1.0)}
+
+        scenario = CustomScenario(seasonal, period=12)
+        _, spending, _ = scenario.apply_adjustments_vectorized({"income": 0.0, "spending": 100.0}, 30)
+
+        assert calls == list(range(1, 13))
+        assert spending[11] == spending[23] == 150.0
+        assert spending[12] == spending[29] == 100.0
+
 
 class TestConvenienceFunctions:
     """Tests for convenience scenario factories."""
@@ -266,3 +281,34 @@ class TestConvenienceFunctions:
 
         assert adjusted["income"] == 0.0  # No income during sabbatical
         assert "Sabbatical" in scenario.name
+
+
+class TestVectorizedAdjustments:
+    """Vectorized adjustments match the month-by-month ones."""
+
+    @pytest.mark.parametrize(
+        "scenario",
+        [
+            ParentalLeaveScenario(
+                months_without_salary=4,
+                salary_replacement_rate=0.67,
+                start_month=3,
+                reduced_spending_categories={"spending": 0.1},
+            ),
+            InflationOnlyScenario(annual_inflation_rate=0.05),
+            IncomeChangeScenario(income_change_percent=-0.5, start_month=2, duration_months=3),
+            SpendingReductionScenario(spending_reduction_percent=0.2, category_reductions={"spending": 0.1}),
+            CustomScenario(lambda data, month_number: {**data, "income": data["income"] - month_number}),
+        ],
+        ids=lambda scenario: scenario.name,
+    )
+    def test_matches_monthly_adjustments(self, scenario):
+        """Every month's income, spending and saving equal apply_adjustments for that month."""
+        baseline = {"income": 5000.0, "spending": 3000.0, "saving": 500.0}
+        income, spending, saving = scenario.apply_adjustments_vectorized(baseline, 12)
+
+        for month_num in range(1, 13):
+            adjusted = scenario.apply_adjustments(baseline, month_num)
+            assert income[month_num - 1] == pytest.approx(adjusted["income"])
+            assert spending[month_num - 1] == pytest.approx(adjusted["spending"])
+            assert saving[month_num - 1] == pytest.approx(adjusted["saving"])
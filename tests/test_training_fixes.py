@@ -3,6 +3,7 @@
 Covers:
 - categorizer.fit() adapts calibration folds to the smallest class count,
   so training no longer crashes when a class has < 5 samples.
+- prepare_training_data drops and names categories below the per-class minimum.
 - LightGBM is configured with verbose=-1 (suppresses "no further splits" spam).
 - fafycat.app installs a uvicorn access-log filter that drops /api/ml/training-status lines.
 """
@@ -21,9 +22,10 @@ from sqlalchemy.orm import sessionmaker
 
 from fafycat.app import _TrainingStatusAccessLogFilter
 from fafycat.core.config import MLConfig
-from fafycat.core.database import Base
+from fafycat.core.database import Base, CategoryORM, TransactionORM
 from fafycat.core.models import TransactionInput
 from fafycat.ml.categorizer import TransactionCategorizer
+from fafycat.ml.ensemble_categorizer import EnsembleCategorizer
 
 
 @pytest.fixture
@@ -136,6 +138,47 @@ class TestFitWithSmallClasses:
         assert categorizer.calibrated_classifier is not None
 
 
+class TestPrepareTrainingData:
+    """Categories below the per-class minimum are dropped and reported by name."""
+
+    @staticmethod
+    def _seed(session) -> None:
+        counts = {"groceries": 30, "rent": 25, "gifts": 2}
+        for cat_id, (name, count) in enumerate(counts.items(), start=1):
+            session.add(CategoryORM(id=cat_id, name=name, type="spending"))
+            for i in range(count):
+                session.add(
+                    TransactionORM(
+                        id=f"{name[:4]}{i:012d}",
+                        date=date(2026, 1, 1 + i % 28),
+                        name=f"{name} shop {i}",
+                        purpose="purpose",
+                        amount=-10.0 - i,
+                        currency="EUR",
+                        category_id=cat_id,
+                        import_batch="test",
+                    )
+                )
+        session.commit()
+
+    def test_categorizer_reports_excluded_categories(self, empty_session, capsys):
+        self._seed(empty_session)
+
+        _, y = TransactionCategorizer(empty_session, MLConfig()).prepare_training_data()
+
+        assert set(y.tolist()) == {1, 2}
+        assert "gifts (2 samples)" in capsys.readouterr().out
+
+    def test_ensemble_reports_excluded_categories(self, empty_session, capsys):
+        self._seed(empty_session)
+
+        transactions, labels = EnsembleCategorizer(empty_session, MLConfig()).prepare_training_data()
+
+        assert len(transactions) == 55
+        assert set(labels.tolist()) == {1, 2}
+        assert "gifts (2 samples)" in capsys.readouterr().out
+
+
 class TestTrainingStatusLogFilter:
     def test_filter_drops_training_status_lines(self):
         f = _TrainingStatusAccessLogFilter()
@@ -101,6 +101,20 @@ class TestUploadProgressHTMX:
         assert "No new transactions imported" in html or "duplicates were skipped" in html
         assert "Duplicates skipped:" in html
 
+    def test_api_and_web_upload_share_import_pipeline(self, test_client):
+        """JSON API and legacy web upload routes report the same rejection."""
+        csv_content = "Date,Description,Amount\nnot-a-date,Test Transaction,-10.50\n"
+
+        files = {"file": ("test.csv", io.BytesIO(csv_content.encode()), "text/csv")}
+        api_response = test_client.post("/api/upload/csv", files=files)
+        files = {"file": ("test.csv", io.BytesIO(csv_content.encode()), "text/csv")}
+        web_response = test_client.post("/upload-csv", files=files)
+
+        assert api_response.status_code == 400
+        assert "Could not parse date" in api_response.json()["detail"]
+        assert "Upload Failed" in web_response.text
+        assert "Could not parse date" in web_response.text
+
     def test_import_page_has_htmx_form(self, test_client):
         """Test that the import page includes the HTMX form elements."""
         response = test_client.get("/import")
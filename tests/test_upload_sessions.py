@@ -0,0 +1,97 @@
+"""Tests for the upload preview/confirmation session workflow."""
+
+import io
+
+from fafycat.api.upload import UploadSessionStore
+from fafycat.core.database import UploadSessionORM
+
+
+def _upload(test_client, csv_content: str):
+    files = {"file": ("test.csv", io.BytesIO(csv_content.encode()), "text/csv")}
+    return test_client.post("/api/upload/csv", files=files)
+
+
+class TestUploadSessions:
+    """Upload sessions are persisted in the database, not process memory."""
+
+    def test_preview_and_confirm_round_trip(self, test_client, db_session):
+        csv_content = "date,name,purpose,amount\n2024-01-01,Shop A,Card,-10.50\n2024-01-02,Shop B,Card,-3.00\n"
+        upload_id = _upload(test_client, csv_content).json()["upload_id"]
+
+        assert db_session.get(UploadSessionORM, upload_id) is not None
+
+        preview = test_client.get(f"/api/upload/preview/{upload_id}")
+        assert preview.status_code == 200
+        body = preview.json()
+        assert body["summary"]["filename"] == "test.csv"
+        assert body["summary"]["imported"] == 2
+        assert {row["description"] for row in body["preview"]} == {"Shop A - Card", "Shop B - Card"}
+
+        confirm = test_client.post(f"/api/upload/confirm/{upload_id}")
+        assert confirm.status_code == 200
+        assert confirm.json()["summary"]["imported"] == 2
+
+        assert test_client.get(f"/api/upload/preview/{upload_id}").status_code == 404
+        assert test_client.post(f"/api/upload/confirm/{upload_id}").status_code == 404
+
+    def test_store_is_shared_across_sessions(self, db_session, temp_db):
+        from sqlalchemy.orm import sessionmaker
+
+        UploadSessionStore(db_session).put(
+            "abc",
+            {"filename": "f.csv", "total_rows": 1, "imported": 1, "duplicates": 0, "transaction_ids": ["id1"]},
+        )
+
+        other = sessionmaker(bind=temp_db)()
+        try:
+            data = UploadSessionStore(other).get("abc")
+        finally:
+            other.close()
+
+        assert data is not None
+        assert data["transaction_ids"] == ["id1"]
+        assert data["predictions_made"] == 0
+
+    def test_predictions_run_in_background_and_reach_preview(self, test_client, monkeypatch):
+        from fafycat.api import ml
+        from fafycat.core.models import TransactionPrediction
+
+        class FakeCategorizer:
+            def predict_with_confidence(self, transactions):
+                return [
+                    TransactionPrediction(
+                        transaction_id=t.generate_id(),
+                        predicted_category_id=1,
+                        confidence_score=0.4,
+                        feature_contributions={},
+                    )
+                    for t in transactions
+                ]
+
+        monkeypatch.setattr(ml, "get_categorizer", lambda db: FakeCategorizer())
+
+        response = _upload(test_client, "date,name,purpose,amount\n2024-03-01,Shop C,Card,-7.00\n")
+        data = response.json()
+        assert data["predictions_pending"] is True
+        assert data["predictions_made"] == 0
+
+        # TestClient runs background tasks before returning the response
+        preview = test_client.get(f"/api/upload/preview/{data['upload_id']}").json()
+        assert preview["summary"]["predictions_made"] == 1
+
+    def test_expired_sessions_are_hidden_and_purged(self, db_session):
+        from datetime import timedelta
+
+        store = UploadSessionStore(db_session)
+        store.put("old", {"filename": "f.csv", "total_rows": 1, "imported": 1, "duplicates": 0, "transaction_ids": []})
+
+        expired = UploadSessionStore(db_session, ttl=timedelta(seconds=-1))
+        assert expired.get("old") is None
+
+        expired.put(
+            "new", {"filename": "g.csv", "total_rows": 0, "imported": 0, "duplicates": 0, "transaction_ids": []}
+        )
+        assert db_session.get(UploadSessionORM, "old") is None
+
+    def test_unknown_upload_id_is_404(self, test_client):
+        assert test_client.get("/api/upload/preview/missing").status_code == 404